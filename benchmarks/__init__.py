@@ -2,7 +2,5 @@
 
 # Copyright (c) 2014, 2015 Ghislain Antony Vaillant.
 #
-# This file is distributed under the new BSD License, see the LICENSE file or 
-# checkout the license terms at http://opensource.org/licenses/BSD-2-Clause).
-
-from __future__ import absolute_import, division, print_function
+# This file is distributed under the new BSD License, see the LICENSE file or
+# checkout the license terms at http://opensource.org/licenses/BSD-3-Clause).
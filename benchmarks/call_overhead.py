@@ -0,0 +1,41 @@
+# coding: utf8
+
+# Copyright (c) 2014, 2015 Ghislain Antony Vaillant.
+#
+# This file is distributed under the new BSD License, see the LICENSE file or
+# checkout the license terms at http://opensource.org/licenses/BSD-3-Clause).
+
+"""
+Python overhead of executing a plan.
+
+The benchmarks follow the conventions of airspeed velocity. The time per
+call of each way of executing a small plan may also be printed with::
+
+    python -m benchmarks.call_overhead
+
+run from the root of the source tree, with skfftw installed or built in
+place. Running the file directly leaves the source tree out of the path.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+from skfftw.bench import TimeCallOverhead
+import timeit
+
+
+def main():
+    benchmark = TimeCallOverhead()
+    for n in TimeCallOverhead.params:
+        benchmark.setup(n)
+        for name in sorted(dir(benchmark)):
+            if name.startswith('time_'):
+                method = getattr(benchmark, name)
+                number = 20000
+                best = min(timeit.repeat(lambda: method(n), number=number,
+                                         repeat=5))
+                print('n={:<5d} {:<25s} {:8.2f} us'.format(
+                    n, name, best / number * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,16 @@
+# coding: utf8
+
+# Copyright (c) 2014, 2015 Ghislain Antony Vaillant.
+#
+# This file is distributed under the new BSD License, see the LICENSE file or
+# checkout the license terms at http://opensource.org/licenses/BSD-3-Clause).
+
+"""
+Throughput of plan execution across sizes and precisions.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+from skfftw.bench import TimeExecute
+
+__all__ = ('TimeExecute',)
@@ -18,7 +18,8 @@ import shutil
 import sys
 
 
-packages = find_packages(exclude=['docs', 'tests'])
+packages = find_packages(exclude=['benchmarks', 'benchmarks.*', 'docs',
+                                   'tests'])
 
 
 SETUP_REQUIRES_ERROR = (
@@ -62,28 +63,21 @@ NO_SETUP_REQUIRES_ARGUMENTS = [
 ]
 
 
-# Access to cffi extension
-def get_ext_modules():
-    import skfftw.backend._cffi as cffi
-    return [cffi.ffi.verifier.get_extension()]
+# Compiled cffi modules, built by cffi's setuptools extension
+CFFI_MODULES = [
+    "skfftw/bindings/build.py:constants_ffibuilder",
+    "skfftw/bindings/build.py:ffibuilder",
+    "skfftw/bindings/build.py:single_ffibuilder",
+    "skfftw/bindings/build.py:longdouble_ffibuilder",
+]
 
 
 # Build command
-class BuildCommand(build):
-    def finalize_options(self):
-        self.distribution.ext_modules = get_ext_modules()
-        build.finalize_options(self)
-
 class DummyBuildCommand(build):
     def run(self):
         raise RuntimeError(SETUP_REQUIRES_ERROR)
 
 # Intall command
-class InstallCommand(install):
-    def finalize_options(self):
-        self.distribution.ext_modules = get_ext_modules()
-        install.finalize_options(self)
-
 class DummyInstallCommand(install):
     def run(self):
         raise RuntimeError(SETUP_REQUIRES_ERROR)
@@ -195,14 +189,12 @@ def keywords_with_side_effects(argv):
         }
     else:
         return {
-            "setup_requires": ["cffi"],
+            "setup_requires": ["cffi >= 1.0.0"],
             "cmdclass": {
-                "build": BuildCommand,
-                "install": InstallCommand,
                 "clean": CleanCommand,
                 "test": TestCommand,
             },
-            "ext_package": "skfftw",
+            "cffi_modules": CFFI_MODULES,
         }
 
 
@@ -239,7 +231,7 @@ setup(
         ],
     packages=packages,
     install_requires= [
-        "cffi >= 0.6",
+        "cffi >= 1.0.0",
         ],
     # for cffi
     zip_safe=False, 
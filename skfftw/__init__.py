@@ -8,3 +8,5 @@
 from __future__ import absolute_import, division, print_function
 
 from .version import VERSION as __version__
+from .aligned import byte_align, empty_aligned, zeros_aligned
+from .wrappers import available_precisions
@@ -0,0 +1,90 @@
+# coding: utf8
+
+# Copyright (c) 2014, 2015 Ghislain Antony Vaillant.
+#
+# This file is distributed under the new BSD License, see the LICENSE file or
+# checkout the license terms at http://opensource.org/licenses/BSD-3-Clause).
+
+"""
+Allocation of arrays with the memory alignment preferred by FFTW.
+
+FFTW plans created for aligned arrays use SIMD instructions, and may only be
+reused on arrays of the same alignment. Arrays allocated by this module are
+aligned to simd_alignment bytes, which suits every SIMD extension supported by
+FFTW as well as cache lines.
+
+The arrays are over-allocated by numpy and offset to the alignment, rather
+than allocated with fftw_malloc. They are thus owned and freed by numpy like
+any other array, their allocation does not load an FFTW library, and they
+may be aligned beyond the alignment of fftw_malloc.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import numpy as np
+
+__all__ = ('simd_alignment', 'empty_aligned', 'zeros_aligned', 'byte_align',
+           'is_aligned')
+
+
+# FFTW checks 16-byte alignment for its SSE and AVX codelets, but allocates
+# on 32 or 64-byte boundaries for AVX and AVX-512: align to the largest.
+simd_alignment = 64
+
+
+def _address(array):
+    return array.__array_interface__['data'][0]
+
+
+def is_aligned(array, n=None):
+    """
+    Whether the data of an array is aligned to n bytes.
+
+    n defaults to simd_alignment.
+    """
+    if n is None:
+        n = simd_alignment
+    return _address(array) % n == 0
+
+
+def empty_aligned(shape, dtype=np.double, order='C', n=None):
+    """
+    Allocate an uninitialised array aligned to n bytes.
+
+    The arguments follow numpy.empty, and n defaults to simd_alignment.
+    """
+    if n is None:
+        n = simd_alignment
+    if n < 1:
+        raise ValueError("Invalid alignment: {}".format(n))
+    dt = np.dtype(dtype)
+    nbytes = int(np.prod(shape, dtype=np.intp)) * dt.itemsize
+    buffer = np.empty(nbytes + n, dtype=np.uint8)
+    offset = -_address(buffer) % n
+    return buffer[offset:offset + nbytes].view(dt).reshape(shape, order=order)
+
+
+def zeros_aligned(shape, dtype=np.double, order='C', n=None):
+    """
+    Allocate a zero-filled array aligned to n bytes.
+
+    The arguments follow numpy.zeros, and n defaults to simd_alignment.
+    """
+    array = empty_aligned(shape, dtype, order, n)
+    array.fill(0)
+    return array
+
+
+def byte_align(array, n=None, dtype=None):
+    """
+    Return the array if aligned to n bytes, or an aligned copy otherwise.
+
+    The array is converted to dtype if given. n defaults to simd_alignment.
+    """
+    array = np.asarray(array, dtype=dtype)
+    if is_aligned(array, n):
+        return array
+    order = 'F' if array.flags.f_contiguous and array.ndim > 1 else 'C'
+    aligned_array = empty_aligned(array.shape, array.dtype, order, n)
+    aligned_array[...] = array
+    return aligned_array
@@ -1 +0,0 @@
-#include <fftw3.h>
\ No newline at end of file
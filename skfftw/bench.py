@@ -0,0 +1,382 @@
+# coding: utf8
+
+# Copyright (c) 2014, 2015 Ghislain Antony Vaillant.
+#
+# This file is distributed under the new BSD License, see the LICENSE file or
+# checkout the license terms at http://opensource.org/licenses/BSD-3-Clause).
+
+"""
+Performance benchmarks of skfftw.
+
+The benchmarks follow the conventions of airspeed velocity, which runs them
+from the benchmarks directory of the source tree to track their history.
+They may also be run once from an installed package with::
+
+    python -m skfftw.bench [-o results.json] [-b pattern]
+
+which prints the time of each benchmark and writes them to a JSON file,
+together with the versions of the packages and the number of CPUs.
+Benchmarks comparing with numpy.fft and scipy.fft are skipped when scipy is
+not installed, and those of precisions whose FFTW library is not installed
+are skipped as well.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+from skfftw import empty_aligned, wisdom
+from skfftw.enums import Flag
+from skfftw.fftw import Plan
+from skfftw.version import VERSION
+from skfftw.wrappers import load_library
+import argparse
+import itertools
+import json
+import math
+import multiprocessing
+import platform
+import re
+import subprocess
+import sys
+import timeit
+import numpy as np
+
+__all__ = ('TimePlanning', 'TimeExecute', 'TimeThreads', 'TimeCallOverhead',
+           'TimeBackends', 'TimeImport', 'benchmarks', 'run', 'main')
+
+
+def _random_array(shape, dtype):
+    array = empty_aligned(shape, dtype)
+    array.real = np.random.randn(*array.shape)
+    array.imag = np.random.randn(*array.shape)
+    return array
+
+
+def _require_precision(dtype):
+    try:
+        load_library(dtype)
+    except ValueError as e:
+        raise NotImplementedError(str(e))
+
+
+def _dft_flops(shape):
+    """
+    Nominal number of floating point operations of a complex DFT, as used by
+    benchFFT.
+    """
+    n = int(np.prod(shape))
+    return 5 * n * math.log(n, 2)
+
+
+class TimePlanning(object):
+
+    """
+    Creation of plans with each planner flag.
+
+    The accumulated wisdom is forgotten before each plan, which would
+    otherwise be created from it.
+    """
+
+    params = [['estimate', 'measure', 'patient'], [64, 1024, 16384]]
+    param_names = ['flag', 'n']
+    number = 1
+    timeout = 300
+
+    def setup(self, flag, n):
+        self.input_array = _random_array(n, np.cdouble)
+        self.output_array = empty_aligned(n, np.cdouble)
+        self.flags = (Flag[flag],)
+
+    def time_plan(self, flag, n):
+        wisdom.forget_wisdom()
+        Plan(self.input_array, self.output_array, flags=self.flags)
+
+
+class TimeExecute(object):
+
+    """
+    Execution of plans over powers of two, primes and 3-d volumes.
+    """
+
+    params = [[(1024,), (65536,), (1048576,), (1009,), (65521,),
+               (64, 64, 64), (128, 128, 128)],
+              ['csingle', 'cdouble', 'clongdouble']]
+    param_names = ['shape', 'dtype']
+
+    def setup(self, shape, dtype):
+        _require_precision(dtype)
+        self.input_array = _random_array(shape, dtype)
+        self.output_array = empty_aligned(shape, dtype)
+        self.plan = Plan(self.input_array, self.output_array,
+                         flags=(Flag.measure,))
+
+    def time_execute(self, shape, dtype):
+        self.plan.execute()
+
+    def flops(self, shape, dtype):
+        return _dft_flops(shape)
+
+
+class TimeThreads(object):
+
+    """
+    Execution of multithreaded plans.
+    """
+
+    params = [[(1048576,), (128, 128, 128)], [1, 2, 4]]
+    param_names = ['shape', 'threads']
+
+    def setup(self, shape, threads):
+        self.input_array = _random_array(shape, np.cdouble)
+        self.output_array = empty_aligned(shape, np.cdouble)
+        self.plan = Plan(self.input_array, self.output_array,
+                         flags=(Flag.measure,), threads=threads)
+
+    def time_execute(self, shape, threads):
+        self.plan.execute()
+
+    def flops(self, shape, threads):
+        return _dft_flops(shape)
+
+
+class TimeCallOverhead(object):
+
+    """
+    Python overhead of each way of executing a small plan, from the execute
+    method, which reuses the bound arrays, to calls switching arrays.
+    """
+
+    params = [64, 256, 1024]
+    param_names = ['n']
+
+    def setup(self, n):
+        self.input_array = _random_array(n, np.cdouble)
+        self.output_array = empty_aligned(n, np.cdouble)
+        self.other_input_array = self.input_array.copy()
+        self.plan = Plan(self.input_array, self.output_array)
+
+    def time_execute(self, n):
+        self.plan.execute()
+
+    def time_call(self, n):
+        self.plan()
+
+    def time_call_same_arrays(self, n):
+        self.plan(self.input_array, self.output_array)
+
+    def time_call_new_arrays(self, n):
+        self.plan(self.other_input_array, self.output_array)
+        self.plan(self.input_array, self.output_array)
+
+
+class TimeBackends(object):
+
+    """
+    N-dimensional transforms of skfftw, numpy.fft and scipy.fft, through
+    their numpy.fft-like interfaces.
+    """
+
+    params = [['skfftw', 'numpy', 'scipy'],
+              [(4096,), (65536,), (1009,), (512, 512), (64, 64, 64)],
+              ['csingle', 'cdouble']]
+    param_names = ['backend', 'shape', 'dtype']
+
+    def setup(self, backend, shape, dtype):
+        if backend == 'skfftw':
+            _require_precision(dtype)
+            from skfftw.interfaces import numpy_fft as module
+        elif backend == 'numpy':
+            module = np.fft
+        else:
+            try:
+                import scipy.fft as module
+            except ImportError:
+                raise NotImplementedError('scipy is not installed')
+        self.fftn = module.fftn
+        self.input_array = _random_array(shape, dtype)
+        self.fftn(self.input_array)
+
+    def time_fftn(self, backend, shape, dtype):
+        self.fftn(self.input_array)
+
+    def flops(self, backend, shape, dtype):
+        return _dft_flops(shape)
+
+
+class TimeImport(object):
+
+    """
+    Import of the modules of skfftw in a fresh interpreter, with numpy
+    imported beforehand.
+
+    The constants of skfftw.enums come from a compiled module of their own,
+    hence its import does not load the FFTW libraries, which are only loaded
+    by the first plan of their precision.
+    """
+
+    def timeraw_import_skfftw(self):
+        return 'import skfftw', 'import numpy'
+
+    def timeraw_import_enums(self):
+        return 'import skfftw.enums', 'import numpy'
+
+    def timeraw_import_fftw(self):
+        return 'import skfftw.fftw', 'import numpy'
+
+    def timeraw_first_single_plan(self):
+        return ('a = numpy.zeros(64, numpy.csingle)\n'
+                'skfftw.fftw.Plan(a, a.copy())',
+                'import numpy, skfftw.fftw')
+
+
+benchmarks = (TimePlanning, TimeExecute, TimeThreads, TimeCallOverhead,
+              TimeBackends, TimeImport)
+
+
+def _parameters(benchmark):
+    """
+    Combinations of the parameters of a benchmark class.
+
+    A single parameter may be given as a plain list of values.
+    """
+    params = getattr(benchmark, 'params', [])
+    if not params:
+        return [()]
+    if len(getattr(benchmark, 'param_names', ())) == 1 and len(params) != 1:
+        params = [params]
+    return list(itertools.product(*params))
+
+
+def _autorange(timer, min_time):
+    """
+    Number of calls lasting at least min_time seconds in total.
+    """
+    number = 1
+    while True:
+        if timer.timeit(number) >= min_time:
+            return number
+        number *= 10
+
+
+def _time_raw(code, setup, repeat):
+    """
+    Best time of running code once in a fresh interpreter, after setup.
+    """
+    script = ('import sys, timeit\n'
+              'print(timeit.timeit(sys.argv[1], sys.argv[2], number=1))')
+    return min(float(subprocess.check_output(
+        [sys.executable, '-c', script, code, setup]))
+        for _ in range(repeat))
+
+
+def run(benchmarks=benchmarks, pattern=None, repeat=3, min_time=0.2,
+        output=sys.stdout):
+    """
+    Run benchmarks and return their results.
+
+    Each time_ method of the benchmark classes whose full name matches the
+    regular expression pattern is called repeatedly with every combination of
+    the parameters, and the best time per call is kept. The code returned by
+    timeraw_ methods, along with optional setup code, is timed in a fresh
+    interpreter instead. Setup methods raising NotImplementedError skip their
+    parameters. Progress is printed to output, unless None.
+    """
+    results = []
+    for benchmark in benchmarks:
+        methods = sorted(name for name in dir(benchmark)
+                         if name.startswith(('time_', 'timeraw_')))
+        names = ['{}.{}'.format(benchmark.__name__, method)
+                 for method in methods]
+        if pattern is not None:
+            methods = [method for method, name in zip(methods, names)
+                       if re.search(pattern, name)]
+        if not methods:
+            continue
+        param_names = getattr(benchmark, 'param_names', [])
+        for params in _parameters(benchmark):
+            instance = benchmark()
+            try:
+                if hasattr(instance, 'setup'):
+                    instance.setup(*params)
+            except NotImplementedError:
+                continue
+            try:
+                for method in methods:
+                    function = getattr(instance, method)
+                    if method.startswith('timeraw_'):
+                        code = function(*params)
+                        if not isinstance(code, tuple):
+                            code = code, ''
+                        number = 1
+                        seconds = _time_raw(code[0], code[1], repeat)
+                    else:
+                        timer = timeit.Timer(lambda: function(*params))
+                        number = getattr(instance, 'number', None)
+                        if number is None:
+                            number = _autorange(timer, min_time)
+                        seconds = min(timer.repeat(repeat, number)) / number
+                    result = {
+                        'benchmark': '{}.{}'.format(benchmark.__name__,
+                                                    method),
+                        'params': dict(zip(param_names,
+                                           [repr(p) if isinstance(p, tuple)
+                                            else p for p in params])),
+                        'seconds': seconds,
+                        'number': number,
+                        'repeat': repeat,
+                    }
+                    if hasattr(instance, 'flops'):
+                        result['mflops'] = (instance.flops(*params) /
+                                            seconds / 1e6)
+                    results.append(result)
+                    if output is not None:
+                        print('{:<35s} {:<50s} {:12.3f} us'.format(
+                            result['benchmark'],
+                            ', '.join('{}={}'.format(*item) for item in
+                                      zip(param_names, params)),
+                            seconds * 1e6), file=output)
+            finally:
+                if hasattr(instance, 'teardown'):
+                    instance.teardown(*params)
+    return results
+
+
+def _environment():
+    versions = {'skfftw': VERSION, 'numpy': np.__version__,
+                'python': platform.python_version()}
+    try:
+        import scipy
+        versions['scipy'] = scipy.__version__
+    except ImportError:
+        pass
+    return {'versions': versions, 'machine': platform.machine(),
+            'platform': platform.platform(),
+            'cpu_count': multiprocessing.cpu_count()}
+
+
+def main(argv=None):
+    """
+    Command line entry point, run by python -m skfftw.bench.
+    """
+    parser = argparse.ArgumentParser(prog='python -m skfftw.bench',
+                                     description='Run the skfftw benchmarks.')
+    parser.add_argument('-o', '--output', default='skfftw-bench.json',
+                        help='JSON file receiving the results')
+    parser.add_argument('-b', '--bench', default=None,
+                        help='regular expression selecting the benchmarks')
+    parser.add_argument('-r', '--repeat', type=int, default=3,
+                        help='number of repetitions of each measurement')
+    parser.add_argument('-t', '--min-time', type=float, default=0.2,
+                        help='minimum duration of each repetition, in '
+                        'seconds')
+    args = parser.parse_args(argv)
+    results = run(pattern=args.bench, repeat=args.repeat,
+                  min_time=args.min_time)
+    document = _environment()
+    document['results'] = results
+    with open(args.output, 'w') as f:
+        json.dump(document, f, indent=2, sort_keys=True)
+    print('Results written to {}'.format(args.output))
+
+
+if __name__ == '__main__':
+    main()
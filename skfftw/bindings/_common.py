@@ -0,0 +1,37 @@
+# coding: utf8
+
+# Copyright (c) 2014, 2015 Ghislain Antony Vaillant.
+#
+# This file is distributed under the new BSD License, see the LICENSE file or 
+# checkout the license terms at http://opensource.org/licenses/BSD-3-Clause).
+
+from __future__ import absolute_import, division, print_function
+
+
+INCLUDES = """
+#include <math.h>
+#include <stdlib.h>
+#include <fftw3.h>
+"""
+
+TYPES = """
+"""
+
+FUNCTIONS = """
+void free(void *);
+"""
+
+MACROS = """
+"""
+
+CUSTOMIZATIONS = """
+/*
+ * Execute a plan on new arrays, then scale the n values of the output.
+ *
+ * Scaling right after the transform, within the same call, reuses the tail of
+ * the output while it is still in cache and spares the separate pass over the
+ * whole output made by numpy. The scale factor is computed once per plan by
+ * scale_factor, in the precision of the plan.
+ */
+#define SKFFTW_DEFINE_SCALED(X, R, SQRT)                                     R sk ## X ## _scale_factor(size_t n, int root)                               {                                                                                return root ? 1 / SQRT((R) n) : 1 / (R) n;                               }                                                                                                                                                         static void sk ## X ## _scale(R *data, size_t n, R scale)                    {                                                                                size_t i;                                                                    for (i = 0; i < n; ++i)                                                          data[i] *= scale;                                                    }                                                                                                                                                         void sk ## X ## _execute_dft_scaled(const X ## _plan p, X ## _complex *in,                                       X ## _complex *out, size_t n, R scale)   {                                                                                X ## _execute_dft(p, in, out);                                               sk ## X ## _scale((R *) out, n, scale);                                  }                                                                                                                                                         void sk ## X ## _execute_dft_r2c_scaled(const X ## _plan p, R *in,                                                   X ## _complex *out, size_t n,                                                R scale)                             {                                                                                X ## _execute_dft_r2c(p, in, out);                                           sk ## X ## _scale((R *) out, n, scale);                                  }                                                                                                                                                         void sk ## X ## _execute_dft_c2r_scaled(const X ## _plan p,                                                          X ## _complex *in, R *out, size_t n,                                         R scale)                             {                                                                                X ## _execute_dft_c2r(p, in, out);                                           sk ## X ## _scale(out, n, scale);                                        }                                                                                                                                                         void sk ## X ## _execute_r2r_scaled(const X ## _plan p, R *in, R *out,                                           size_t n, R scale)                       {                                                                                X ## _execute_r2r(p, in, out);                                               sk ## X ## _scale(out, n, scale);                                        }
+"""
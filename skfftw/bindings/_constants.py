@@ -0,0 +1,44 @@
+# coding: utf8
+
+# Copyright (c) 2014, 2015 Ghislain Antony Vaillant.
+#
+# This file is distributed under the new BSD License, see the LICENSE file or 
+# checkout the license terms at http://opensource.org/licenses/BSD-3-Clause).
+
+from __future__ import absolute_import, division, print_function
+
+
+INCLUDES = """
+#include <fftw3.h>
+"""
+
+TYPES = """
+enum fftw_r2r_kind_do_not_use_me {
+    FFTW_R2HC, FFTW_HC2R, FFTW_DHT,
+    FFTW_REDFT00, FFTW_REDFT01, FFTW_REDFT10, FFTW_REDFT11,
+    FFTW_RODFT00, FFTW_RODFT01, FFTW_RODFT10, FFTW_RODFT11,
+    ...
+};
+typedef enum fftw_r2r_kind_do_not_use_me fftw_r2r_kind;
+"""
+
+FUNCTIONS = """
+"""
+
+MACROS = """
+#define FFTW_FORWARD ...
+#define FFTW_BACKWARD ...
+
+#define FFTW_MEASURE ...
+#define FFTW_DESTROY_INPUT ...
+#define FFTW_UNALIGNED ...
+#define FFTW_CONSERVE_MEMORY ...
+#define FFTW_EXHAUSTIVE ...
+#define FFTW_PRESERVE_INPUT ...
+#define FFTW_PATIENT ...
+#define FFTW_ESTIMATE ...
+#define FFTW_WISDOM_ONLY ...
+"""
+
+CUSTOMIZATIONS = """
+"""
@@ -15,12 +15,16 @@ INCLUDES = """
 TYPES = """
 typedef ... fftw_complex;
 typedef ... *fftw_plan;
-
-typedef ... fftwf_complex;
-typedef ... *fftwf_plan;
-
-typedef ... fftwl_complex;
-typedef ... *fftwl_plan;
+typedef struct {
+    int n;
+    int is;
+    int os;
+} fftw_iodim;
+typedef struct {
+    ptrdiff_t n;
+    ptrdiff_t is;
+    ptrdiff_t os;
+} fftw_iodim64;
 """
 
 FUNCTIONS = """
@@ -28,37 +32,81 @@ void fftw_execute(const fftw_plan);
 fftw_plan fftw_plan_dft(int, const int *, fftw_complex *, fftw_complex *,
                         int, unsigned);
 void fftw_execute_dft(const fftw_plan, fftw_complex *, fftw_complex *);
+fftw_plan fftw_plan_many_dft(int, const int *, int, fftw_complex *,
+                             const int *, int, int, fftw_complex *,
+                             const int *, int, int, int, unsigned);
+fftw_plan fftw_plan_guru_dft(int, const fftw_iodim *, int, const fftw_iodim *,
+                             fftw_complex *, fftw_complex *, int, unsigned);
+fftw_plan fftw_plan_guru64_dft(int, const fftw_iodim64 *, int,
+                               const fftw_iodim64 *, fftw_complex *,
+                               fftw_complex *, int, unsigned);
+fftw_plan fftw_plan_dft_r2c(int, const int *, double *, fftw_complex *,
+                            unsigned);
+fftw_plan fftw_plan_dft_c2r(int, const int *, fftw_complex *, double *,
+                            unsigned);
+void fftw_execute_dft_r2c(const fftw_plan, double *, fftw_complex *);
+void fftw_execute_dft_c2r(const fftw_plan, fftw_complex *, double *);
+fftw_plan fftw_plan_many_dft_r2c(int, const int *, int, double *, const int *,
+                                 int, int, fftw_complex *, const int *, int,
+                                 int, unsigned);
+fftw_plan fftw_plan_many_dft_c2r(int, const int *, int, fftw_complex *,
+                                 const int *, int, int, double *, const int *,
+                                 int, int, unsigned);
+fftw_plan fftw_plan_guru_dft_r2c(int, const fftw_iodim *, int,
+                                 const fftw_iodim *, double *, fftw_complex *,
+                                 unsigned);
+fftw_plan fftw_plan_guru64_dft_r2c(int, const fftw_iodim64 *, int,
+                                   const fftw_iodim64 *, double *,
+                                   fftw_complex *, unsigned);
+fftw_plan fftw_plan_guru_dft_c2r(int, const fftw_iodim *, int,
+                                 const fftw_iodim *, fftw_complex *, double *,
+                                 unsigned);
+fftw_plan fftw_plan_guru64_dft_c2r(int, const fftw_iodim64 *, int,
+                                   const fftw_iodim64 *, fftw_complex *,
+                                   double *, unsigned);
+fftw_plan fftw_plan_r2r(int, const int *, double *, double *,
+                        const fftw_r2r_kind *, unsigned);
+fftw_plan fftw_plan_many_r2r(int, const int *, int, double *, const int *, int,
+                             int, double *, const int *, int, int,
+                             const fftw_r2r_kind *, unsigned);
+fftw_plan fftw_plan_guru_r2r(int, const fftw_iodim *, int, const fftw_iodim *,
+                             double *, double *, const fftw_r2r_kind *,
+                             unsigned);
+fftw_plan fftw_plan_guru64_r2r(int, const fftw_iodim64 *, int,
+                               const fftw_iodim64 *, double *, double *,
+                               const fftw_r2r_kind *, unsigned);
+void fftw_execute_r2r(const fftw_plan, double *, double *);
 void fftw_destroy_plan(fftw_plan);
-
-void fftwf_execute(const fftwf_plan);
-fftwf_plan fftwf_plan_dft(int, const int *, fftwf_complex *, fftwf_complex *,
-                          int, unsigned);
-void fftwf_execute_dft(const fftwf_plan, fftwf_complex *, fftwf_complex *);
-void fftwf_destroy_plan(fftwf_plan);
-
-void fftwl_execute(const fftwl_plan);
-fftwl_plan fftwl_plan_dft(int, const int *, fftwl_complex *, fftwl_complex *,
-                          int, unsigned);
-void fftwl_execute_dft(const fftwl_plan, fftwl_complex *, fftwl_complex *);
-void fftwl_destroy_plan(fftwl_plan);
+int fftw_export_wisdom_to_filename(const char *);
+char *fftw_export_wisdom_to_string(void);
+int fftw_import_system_wisdom(void);
+int fftw_import_wisdom_from_filename(const char *);
+int fftw_import_wisdom_from_string(const char *);
+void fftw_forget_wisdom(void);
+void fftw_set_timelimit(double);
+void fftw_print_plan(const fftw_plan);
+char *fftw_sprint_plan(const fftw_plan);
+void fftw_flops(const fftw_plan, double *, double *, double *);
+double fftw_estimate_cost(const fftw_plan);
+double fftw_cost(const fftw_plan);
+int fftw_alignment_of(double *);
+int fftw_init_threads(void);
+void fftw_plan_with_nthreads(int);
+void fftw_cleanup_threads(void);
+double skfftw_scale_factor(size_t, int);
+void skfftw_execute_dft_scaled(const fftw_plan, fftw_complex *, fftw_complex *,
+                               size_t, double);
+void skfftw_execute_dft_r2c_scaled(const fftw_plan, double *, fftw_complex *,
+                                   size_t, double);
+void skfftw_execute_dft_c2r_scaled(const fftw_plan, fftw_complex *, double *,
+                                   size_t, double);
+void skfftw_execute_r2r_scaled(const fftw_plan, double *, double *, size_t,
+                               double);
 """
 
 MACROS = """
-#define FFTW_FORWARD ...
-#define FFTW_BACKWARD ...
-
-#define FFTW_MEASURE ...
-#define FFTW_DESTROY_INPUT ...
-#define FFTW_UNALIGNED ...
-#define FFTW_CONSERVE_MEMORY ...
-#define FFTW_EXHAUSTIVE ...
-#define FFTW_PRESERVE_INPUT ...
-#define FFTW_PATIENT ...
-#define FFTW_ESTIMATE ...
-#define FFTW_WISDOM_ONLY ...
 """
 
 CUSTOMIZATIONS = """
+SKFFTW_DEFINE_SCALED(fftw, double, sqrt)
 """
-
-CONDITIONAL_NAMES = {}
\ No newline at end of file
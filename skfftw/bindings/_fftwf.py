@@ -0,0 +1,114 @@
+# coding: utf8
+
+# Copyright (c) 2014, 2015 Ghislain Antony Vaillant.
+#
+# This file is distributed under the new BSD License, see the LICENSE file or 
+# checkout the license terms at http://opensource.org/licenses/BSD-3-Clause).
+
+from __future__ import absolute_import, division, print_function
+
+
+INCLUDES = """
+#include <fftw3.h>
+"""
+
+TYPES = """
+typedef ... fftwf_complex;
+typedef ... *fftwf_plan;
+typedef struct {
+    int n;
+    int is;
+    int os;
+} fftwf_iodim;
+typedef struct {
+    ptrdiff_t n;
+    ptrdiff_t is;
+    ptrdiff_t os;
+} fftwf_iodim64;
+typedef fftw_r2r_kind fftwf_r2r_kind;
+"""
+
+FUNCTIONS = """
+void fftwf_execute(const fftwf_plan);
+fftwf_plan fftwf_plan_dft(int, const int *, fftwf_complex *, fftwf_complex *,
+                          int, unsigned);
+void fftwf_execute_dft(const fftwf_plan, fftwf_complex *, fftwf_complex *);
+fftwf_plan fftwf_plan_many_dft(int, const int *, int, fftwf_complex *,
+                               const int *, int, int, fftwf_complex *,
+                               const int *, int, int, int, unsigned);
+fftwf_plan fftwf_plan_guru_dft(int, const fftwf_iodim *, int,
+                               const fftwf_iodim *, fftwf_complex *,
+                               fftwf_complex *, int, unsigned);
+fftwf_plan fftwf_plan_guru64_dft(int, const fftwf_iodim64 *, int,
+                                 const fftwf_iodim64 *, fftwf_complex *,
+                                 fftwf_complex *, int, unsigned);
+fftwf_plan fftwf_plan_dft_r2c(int, const int *, float *, fftwf_complex *,
+                              unsigned);
+fftwf_plan fftwf_plan_dft_c2r(int, const int *, fftwf_complex *, float *,
+                              unsigned);
+void fftwf_execute_dft_r2c(const fftwf_plan, float *, fftwf_complex *);
+void fftwf_execute_dft_c2r(const fftwf_plan, fftwf_complex *, float *);
+fftwf_plan fftwf_plan_many_dft_r2c(int, const int *, int, float *, const int *,
+                                   int, int, fftwf_complex *, const int *, int,
+                                   int, unsigned);
+fftwf_plan fftwf_plan_many_dft_c2r(int, const int *, int, fftwf_complex *,
+                                   const int *, int, int, float *, const int *,
+                                   int, int, unsigned);
+fftwf_plan fftwf_plan_guru_dft_r2c(int, const fftwf_iodim *, int,
+                                   const fftwf_iodim *, float *,
+                                   fftwf_complex *, unsigned);
+fftwf_plan fftwf_plan_guru64_dft_r2c(int, const fftwf_iodim64 *, int,
+                                     const fftwf_iodim64 *, float *,
+                                     fftwf_complex *, unsigned);
+fftwf_plan fftwf_plan_guru_dft_c2r(int, const fftwf_iodim *, int,
+                                   const fftwf_iodim *, fftwf_complex *,
+                                   float *, unsigned);
+fftwf_plan fftwf_plan_guru64_dft_c2r(int, const fftwf_iodim64 *, int,
+                                     const fftwf_iodim64 *, fftwf_complex *,
+                                     float *, unsigned);
+fftwf_plan fftwf_plan_r2r(int, const int *, float *, float *,
+                          const fftwf_r2r_kind *, unsigned);
+fftwf_plan fftwf_plan_many_r2r(int, const int *, int, float *, const int *,
+                               int, int, float *, const int *, int, int,
+                               const fftwf_r2r_kind *, unsigned);
+fftwf_plan fftwf_plan_guru_r2r(int, const fftwf_iodim *, int,
+                               const fftwf_iodim *, float *, float *,
+                               const fftwf_r2r_kind *, unsigned);
+fftwf_plan fftwf_plan_guru64_r2r(int, const fftwf_iodim64 *, int,
+                                 const fftwf_iodim64 *, float *, float *,
+                                 const fftwf_r2r_kind *, unsigned);
+void fftwf_execute_r2r(const fftwf_plan, float *, float *);
+void fftwf_destroy_plan(fftwf_plan);
+int fftwf_export_wisdom_to_filename(const char *);
+char *fftwf_export_wisdom_to_string(void);
+int fftwf_import_system_wisdom(void);
+int fftwf_import_wisdom_from_filename(const char *);
+int fftwf_import_wisdom_from_string(const char *);
+void fftwf_forget_wisdom(void);
+void fftwf_set_timelimit(double);
+void fftwf_print_plan(const fftwf_plan);
+char *fftwf_sprint_plan(const fftwf_plan);
+void fftwf_flops(const fftwf_plan, double *, double *, double *);
+double fftwf_estimate_cost(const fftwf_plan);
+double fftwf_cost(const fftwf_plan);
+int fftwf_alignment_of(float *);
+int fftwf_init_threads(void);
+void fftwf_plan_with_nthreads(int);
+void fftwf_cleanup_threads(void);
+float skfftwf_scale_factor(size_t, int);
+void skfftwf_execute_dft_scaled(const fftwf_plan, fftwf_complex *,
+                                fftwf_complex *, size_t, float);
+void skfftwf_execute_dft_r2c_scaled(const fftwf_plan, float *, fftwf_complex *,
+                                    size_t, float);
+void skfftwf_execute_dft_c2r_scaled(const fftwf_plan, fftwf_complex *, float *,
+                                    size_t, float);
+void skfftwf_execute_r2r_scaled(const fftwf_plan, float *, float *, size_t,
+                                float);
+"""
+
+MACROS = """
+"""
+
+CUSTOMIZATIONS = """
+SKFFTW_DEFINE_SCALED(fftwf, float, sqrtf)
+"""
@@ -0,0 +1,117 @@
+# coding: utf8
+
+# Copyright (c) 2014, 2015 Ghislain Antony Vaillant.
+#
+# This file is distributed under the new BSD License, see the LICENSE file or 
+# checkout the license terms at http://opensource.org/licenses/BSD-3-Clause).
+
+from __future__ import absolute_import, division, print_function
+
+
+INCLUDES = """
+#include <fftw3.h>
+"""
+
+TYPES = """
+typedef ... fftwl_complex;
+typedef ... *fftwl_plan;
+typedef struct {
+    int n;
+    int is;
+    int os;
+} fftwl_iodim;
+typedef struct {
+    ptrdiff_t n;
+    ptrdiff_t is;
+    ptrdiff_t os;
+} fftwl_iodim64;
+typedef fftw_r2r_kind fftwl_r2r_kind;
+"""
+
+FUNCTIONS = """
+void fftwl_execute(const fftwl_plan);
+fftwl_plan fftwl_plan_dft(int, const int *, fftwl_complex *, fftwl_complex *,
+                          int, unsigned);
+void fftwl_execute_dft(const fftwl_plan, fftwl_complex *, fftwl_complex *);
+fftwl_plan fftwl_plan_many_dft(int, const int *, int, fftwl_complex *,
+                               const int *, int, int, fftwl_complex *,
+                               const int *, int, int, int, unsigned);
+fftwl_plan fftwl_plan_guru_dft(int, const fftwl_iodim *, int,
+                               const fftwl_iodim *, fftwl_complex *,
+                               fftwl_complex *, int, unsigned);
+fftwl_plan fftwl_plan_guru64_dft(int, const fftwl_iodim64 *, int,
+                                 const fftwl_iodim64 *, fftwl_complex *,
+                                 fftwl_complex *, int, unsigned);
+fftwl_plan fftwl_plan_dft_r2c(int, const int *, long double *, fftwl_complex *,
+                              unsigned);
+fftwl_plan fftwl_plan_dft_c2r(int, const int *, fftwl_complex *, long double *,
+                              unsigned);
+void fftwl_execute_dft_r2c(const fftwl_plan, long double *, fftwl_complex *);
+void fftwl_execute_dft_c2r(const fftwl_plan, fftwl_complex *, long double *);
+fftwl_plan fftwl_plan_many_dft_r2c(int, const int *, int, long double *,
+                                   const int *, int, int, fftwl_complex *,
+                                   const int *, int, int, unsigned);
+fftwl_plan fftwl_plan_many_dft_c2r(int, const int *, int, fftwl_complex *,
+                                   const int *, int, int, long double *,
+                                   const int *, int, int, unsigned);
+fftwl_plan fftwl_plan_guru_dft_r2c(int, const fftwl_iodim *, int,
+                                   const fftwl_iodim *, long double *,
+                                   fftwl_complex *, unsigned);
+fftwl_plan fftwl_plan_guru64_dft_r2c(int, const fftwl_iodim64 *, int,
+                                     const fftwl_iodim64 *, long double *,
+                                     fftwl_complex *, unsigned);
+fftwl_plan fftwl_plan_guru_dft_c2r(int, const fftwl_iodim *, int,
+                                   const fftwl_iodim *, fftwl_complex *,
+                                   long double *, unsigned);
+fftwl_plan fftwl_plan_guru64_dft_c2r(int, const fftwl_iodim64 *, int,
+                                     const fftwl_iodim64 *, fftwl_complex *,
+                                     long double *, unsigned);
+fftwl_plan fftwl_plan_r2r(int, const int *, long double *, long double *,
+                          const fftwl_r2r_kind *, unsigned);
+fftwl_plan fftwl_plan_many_r2r(int, const int *, int, long double *,
+                               const int *, int, int, long double *,
+                               const int *, int, int, const fftwl_r2r_kind *,
+                               unsigned);
+fftwl_plan fftwl_plan_guru_r2r(int, const fftwl_iodim *, int,
+                               const fftwl_iodim *, long double *,
+                               long double *, const fftwl_r2r_kind *,
+                               unsigned);
+fftwl_plan fftwl_plan_guru64_r2r(int, const fftwl_iodim64 *, int,
+                                 const fftwl_iodim64 *, long double *,
+                                 long double *, const fftwl_r2r_kind *,
+                                 unsigned);
+void fftwl_execute_r2r(const fftwl_plan, long double *, long double *);
+void fftwl_destroy_plan(fftwl_plan);
+int fftwl_export_wisdom_to_filename(const char *);
+char *fftwl_export_wisdom_to_string(void);
+int fftwl_import_system_wisdom(void);
+int fftwl_import_wisdom_from_filename(const char *);
+int fftwl_import_wisdom_from_string(const char *);
+void fftwl_forget_wisdom(void);
+void fftwl_set_timelimit(double);
+void fftwl_print_plan(const fftwl_plan);
+char *fftwl_sprint_plan(const fftwl_plan);
+void fftwl_flops(const fftwl_plan, double *, double *, double *);
+double fftwl_estimate_cost(const fftwl_plan);
+double fftwl_cost(const fftwl_plan);
+int fftwl_alignment_of(long double *);
+int fftwl_init_threads(void);
+void fftwl_plan_with_nthreads(int);
+void fftwl_cleanup_threads(void);
+long double skfftwl_scale_factor(size_t, int);
+void skfftwl_execute_dft_scaled(const fftwl_plan, fftwl_complex *,
+                                fftwl_complex *, size_t, long double);
+void skfftwl_execute_dft_r2c_scaled(const fftwl_plan, long double *,
+                                    fftwl_complex *, size_t, long double);
+void skfftwl_execute_dft_c2r_scaled(const fftwl_plan, fftwl_complex *,
+                                    long double *, size_t, long double);
+void skfftwl_execute_r2r_scaled(const fftwl_plan, long double *, long double *,
+                                size_t, long double);
+"""
+
+MACROS = """
+"""
+
+CUSTOMIZATIONS = """
+SKFFTW_DEFINE_SCALED(fftwl, long double, sqrtl)
+"""
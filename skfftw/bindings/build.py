@@ -0,0 +1,72 @@
+# coding: utf8
+
+# Copyright (c) 2014, 2015 Ghislain Antony Vaillant.
+#
+# This file is distributed under the new BSD License, see the LICENSE file or
+# checkout the license terms at http://opensource.org/licenses/BSD-3-Clause).
+
+"""
+Builders of the compiled cffi modules, run by setup.py.
+
+The constants of FFTW live in a module of their own, which is not linked
+against the FFTW libraries, so that they are resolved without loading them.
+Each precision of FFTW is bound by a module linked against its own libraries
+only, which are loaded along with the module on first use. The single and
+long double precision modules are optional, and skipped by the build when
+their libraries are not installed.
+The modules may be compiled in place, for development, with::
+
+    python setup.py build_ext --inplace
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import os
+import sys
+
+# setup.py runs this file outside of the package, which would otherwise be
+# imported with all its dependencies
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from utils import build_ffi_for_binding
+
+
+# FFTW ships its multithreaded planner in separate libraries, built either on
+# top of POSIX threads or OpenMP. The one to link against is selected at build
+# time with the SKFFTW_THREADING environment variable.
+_threading_libraries = {
+    'pthreads': "_threads",
+    'openmp': "_omp",
+}
+
+threading_backend = os.environ.get('SKFFTW_THREADING', 'pthreads')
+if threading_backend not in _threading_libraries:
+    raise ValueError("Unsupported threading backend: {}".format(
+        threading_backend))
+
+
+def _precision_ffibuilder(prefix, library, optional):
+    return build_ffi_for_binding(
+        module_name='skfftw.bindings.{}_cffi'.format(prefix),
+        module_prefix='',
+        modules=["_constants", "_common", prefix],
+        pre_include="",
+        post_include="",
+        libraries=[library + _threading_libraries[threading_backend],
+                   library],
+        extra_compile_args=[],
+        extra_link_args=[],
+        optional=optional,
+    )
+
+
+constants_ffibuilder = build_ffi_for_binding(
+    module_name='skfftw.bindings._constants_cffi',
+    module_prefix='',
+    modules=["_constants"],
+)
+
+ffibuilder = _precision_ffibuilder("_fftw", "fftw3", optional=False)
+single_ffibuilder = _precision_ffibuilder("_fftwf", "fftw3f", optional=True)
+longdouble_ffibuilder = _precision_ffibuilder("_fftwl", "fftw3l",
+                                              optional=True)
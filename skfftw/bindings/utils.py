@@ -4,46 +4,14 @@
 
 from __future__ import absolute_import, division, print_function
 
-import binascii
 import sys
-import threading
 
 from cffi import FFI
-from cffi.verifier import Verifier
 
 
-class LazyLibrary(object):
-    def __init__(self, ffi):
-        self._ffi = ffi
-        self._lib = None
-        self._lock = threading.Lock()
-
-    def __getattr__(self, name):
-        if self._lib is None:
-            with self._lock:
-                if self._lib is None:
-                    self._lib = self._ffi.verifier.load_library()
-
-        return getattr(self._lib, name)
-
-
-def load_library_for_binding(ffi, module_prefix, modules):
-    lib = ffi.verifier.load_library()
-
-    for name in modules:
-        module_name = module_prefix + name
-        module = sys.modules[module_name]
-        for condition, names in module.CONDITIONAL_NAMES.items():
-            if not getattr(lib, condition):
-                for name in names:
-                    delattr(lib, name)
-
-    return lib
-
-
-def build_ffi_for_binding(module_prefix, modules, pre_include="",
+def build_ffi_for_binding(module_name, module_prefix, modules, pre_include="",
                           post_include="", libraries=[], extra_compile_args=[],
-                          extra_link_args=[]):
+                          extra_link_args=[], optional=False):
     """
     Modules listed in ``modules`` should have the following attributes:
 
@@ -54,9 +22,9 @@ def build_ffi_for_binding(module_prefix, modules, pre_include="",
     * ``CUSTOMIZATIONS``: A string containing arbitrary top-level C code, this
         can be used to do things like test for a define and provide an
         alternate implementation based on that.
-    * ``CONDITIONAL_NAMES``: A dict mapping strings of condition names from the
-        library to a list of names which will not be present without the
-        condition.
+
+    The build of an ``optional`` module may fail without failing the build of
+    the package.
     """
     types = []
     includes = []
@@ -64,9 +32,8 @@ def build_ffi_for_binding(module_prefix, modules, pre_include="",
     macros = []
     customizations = []
     for name in modules:
-        module_name = module_prefix + "." + name
-        __import__(module_name)
-        module = sys.modules[module_name]
+        __import__(module_prefix + name)
+        module = sys.modules[module_prefix + name]
 
         types.append(module.TYPES)
         macros.append(module.MACROS)
@@ -90,57 +57,28 @@ def build_ffi_for_binding(module_prefix, modules, pre_include="",
         customizations
     )
     ffi = build_ffi(
+        module_name,
         cdef_source="\n".join(types + functions + macros),
         verify_source=verify_source,
         libraries=libraries,
         extra_compile_args=extra_compile_args,
         extra_link_args=extra_link_args,
+        optional=optional,
     )
 
     return ffi
 
 
-def build_ffi(cdef_source, verify_source, libraries=[], extra_compile_args=[],
-              extra_link_args=[]):
+def build_ffi(module_name, cdef_source, verify_source, libraries=[],
+              extra_compile_args=[], extra_link_args=[], optional=False):
     ffi = FFI()
     ffi.cdef(cdef_source)
-
-    ffi.verifier = Verifier(
-        ffi,
+    ffi.set_source(
+        module_name,
         verify_source,
-        tmpdir='',
-        modulename=_create_modulename(cdef_source, verify_source, sys.version),
         libraries=libraries,
-        ext_package="skfftw",
         extra_compile_args=extra_compile_args,
         extra_link_args=extra_link_args,
+        optional=optional,
     )
-
-    ffi.verifier.compile_module = _compile_module
-    ffi.verifier._compile_module = _compile_module
-
     return ffi
-
-
-def _compile_module(*args, **kwargs):
-    raise RuntimeError(
-        "Attempted implicit compile of a cffi module. All cffi modules should "
-        "be pre-compiled at installation time."
-    )
-
-
-def _create_modulename(cdef_sources, source, sys_version):
-    """
-    cffi creates a modulename internally that incorporates the cffi version.
-    This will cause cryptography's wheels to break when the version of cffi
-    the user has does not match what was used when building the wheel. To
-    resolve this we build our own modulename that uses most of the same code
-    from cffi but elides the version key.
-    """
-    key = '\x00'.join([sys_version[:3], source, cdef_sources])
-    key = key.encode('utf-8')
-    k1 = hex(binascii.crc32(key[0::2]) & 0xffffffff)
-    k1 = k1.lstrip('0x').rstrip('L')
-    k2 = hex(binascii.crc32(key[1::2]) & 0xffffffff)
-    k2 = k2.lstrip('0').rstrip('L')
-    return '_{0}_cffi_{1}{2}'.format("skfftw", k1, k2)
@@ -0,0 +1,234 @@
+# coding: utf8
+
+# Copyright (c) 2014, 2015 Ghislain Antony Vaillant.
+#
+# This file is distributed under the new BSD License, see the LICENSE file or
+# checkout the license terms at http://opensource.org/licenses/BSD-3-Clause).
+
+"""
+Process-wide cache of FFTW plans.
+
+Plans are keyed on the layout and alignment of their arrays together with
+their planning parameters, so a cached plan may be executed on any pair of
+arrays of the same geometry by passing them to its transform method. They are
+created on private arrays of that geometry, so that the planner does not
+overwrite the arrays of their callers. Plan.transform does not keep its
+arrays either, whereas __call__ binds them to the plan, which would then keep
+them alive as long as the plan stays in the cache.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+from skfftw.enums import Flag
+from skfftw.fftw import (_as_array, _check_axes, _data, _layout,
+                         _rebuilt_arrays, _simd_aligned, get_default_threads)
+import numpy as np
+import collections
+import threading
+import time
+
+__all__ = ('PlanCache', 'CacheInfo', 'get_plan', 'cache_info', 'configure',
+           'clear')
+
+
+CacheInfo = collections.namedtuple(
+    'CacheInfo', ['hits', 'misses', 'evictions', 'maxsize', 'currsize'])
+
+_clock = getattr(time, 'monotonic', time.time)
+
+
+def _flag_int(flags):
+    flag_int = 0
+    for flag in flags:
+        flag_int |= int(flag)
+    return flag_int
+
+
+def _hashable(value):
+    """
+    Hashable form of a keyword argument, with sequences as tuples.
+    """
+    if isinstance(value, np.ndarray):
+        value = value.tolist()
+    if isinstance(value, (list, tuple)):
+        return tuple(_hashable(item) for item in value)
+    return value
+
+
+def _plan_key(plan_class, input_array, output_array, kwargs):
+    """
+    Key identifying the plans interchangeable for the given arguments.
+    """
+    params = dict((name, _hashable(value)) for name, value in kwargs.items())
+    params['flags'] = _flag_int(params.get('flags', (Flag.estimate,)))
+    if params.get('threads') is None:
+        params['threads'] = get_default_threads()
+    params['axes'] = _check_axes(params.get('axes'), input_array.ndim)
+    if 'direction' in params:
+        params['direction'] = int(params['direction'])
+    return (plan_class,
+            _layout(input_array),
+            _layout(output_array),
+            _data(input_array) == _data(output_array),
+            _simd_aligned(input_array),
+            _simd_aligned(output_array),
+            tuple(sorted(params.items())))
+
+
+class PlanCache(object):
+
+    """
+    Cache of FFTW plans with least-recently-used eviction.
+
+    At most maxsize plans are kept, and plans unused for more than ttl
+    seconds are evicted as well when ttl is set. Evicted plans are merely
+    released by the cache: a plan still referenced elsewhere remains valid,
+    and is destroyed when garbage collected.
+    """
+
+    def __init__(self, maxsize=128, ttl=None):
+        self._plans = collections.OrderedDict()
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._maxsize = None
+        self._ttl = None
+        self.configure(maxsize, ttl)
+
+    def __len__(self):
+        return len(self._plans)
+
+    def configure(self, maxsize=None, ttl=None):
+        """
+        Update the size limit and the time-to-live of the cache.
+
+        Parameters left to None are unchanged. Set ttl to 0 to disable
+        expiry.
+        """
+        with self._lock:
+            if maxsize is not None:
+                if maxsize < 0:
+                    raise ValueError("Invalid cache size: {}".format(maxsize))
+                self._maxsize = int(maxsize)
+            if ttl is not None:
+                if ttl < 0:
+                    raise ValueError("Invalid time-to-live: {}".format(ttl))
+                self._ttl = ttl or None
+            self._evict(_clock())
+
+    def get(self, plan_class, input_array, output_array, **kwargs):
+        """
+        Return a plan of the given class for the given arrays.
+
+        The keyword arguments are forwarded to the plan constructor on a
+        cache miss. The plan is then created on private arrays with the
+        layout of the given arrays, and planned for unaligned arrays if they
+        are not both aligned. The arrays may be any object accepted by the
+        plans, and are left untouched. The plan should be executed with its
+        transform method, which does not keep the arrays alive.
+        """
+        input_array, output_array = _as_array(input_array), _as_array(
+            output_array)
+        key = _plan_key(plan_class, input_array, output_array, kwargs)
+        now = _clock()
+        with self._lock:
+            entry = self._plans.get(key)
+            if entry is not None:
+                if not self._expired(entry, now):
+                    self._plans[key] = (entry[0], now)
+                    self._plans.move_to_end(key)
+                    self._hits += 1
+                    return entry[0]
+                del self._plans[key]
+                self._evictions += 1
+            self._misses += 1
+        plan = self._create(plan_class, input_array, output_array, kwargs)
+        with self._lock:
+            if self._maxsize:
+                self._plans[key] = (plan, now)
+                self._plans.move_to_end(key)
+                self._evict(now)
+        return plan
+
+    def info(self):
+        """
+        Hit and miss statistics of the cache.
+        """
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._evictions,
+                             self._maxsize, len(self._plans))
+
+    def clear(self):
+        """
+        Release all the cached plans and reset the statistics.
+        """
+        with self._lock:
+            self._plans.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def _create(self, plan_class, input_array, output_array, kwargs):
+        """
+        Private method creating a plan on scratch arrays of the same layout.
+
+        The scratch arrays are aligned, hence the plan is explicitly planned
+        with Flag.unaligned when the given arrays are not.
+        """
+        arrays = _rebuilt_arrays(
+            [(array.shape, array.dtype.str, array.strides)
+             for array in (input_array, output_array)],
+            _data(input_array) == _data(output_array))
+        kwargs = dict(kwargs)
+        if not (_simd_aligned(input_array) and _simd_aligned(output_array)):
+            kwargs['flags'] = (tuple(kwargs.get('flags', (Flag.estimate,))) +
+                               (Flag.unaligned,))
+        return plan_class(*arrays, **kwargs)
+
+    def _expired(self, entry, now):
+        return self._ttl is not None and now - entry[1] > self._ttl
+
+    def _evict(self, now):
+        """
+        Release expired plans, then the least recently used ones.
+        """
+        if self._ttl is not None:
+            for key, entry in list(self._plans.items()):
+                if self._expired(entry, now):
+                    del self._plans[key]
+                    self._evictions += 1
+        while len(self._plans) > self._maxsize:
+            self._plans.popitem(last=False)
+            self._evictions += 1
+
+
+_plan_cache = PlanCache()
+
+
+def get_plan(plan_class, input_array, output_array, **kwargs):
+    """
+    Return a plan from the process-wide cache.
+
+    See PlanCache.get for details.
+    """
+    return _plan_cache.get(plan_class, input_array, output_array, **kwargs)
+
+
+def cache_info():
+    """
+    Hit and miss statistics of the process-wide cache.
+    """
+    return _plan_cache.info()
+
+
+def configure(maxsize=None, ttl=None):
+    """
+    Update the size limit and the time-to-live of the process-wide cache.
+    """
+    _plan_cache.configure(maxsize, ttl)
+
+
+def clear():
+    """
+    Release all the plans of the process-wide cache.
+    """
+    _plan_cache.clear()
@@ -0,0 +1,408 @@
+# coding: utf8
+
+# Copyright (c) 2014, 2015 Ghislain Antony Vaillant.
+#
+# This file is distributed under the new BSD License, see the LICENSE file or
+# checkout the license terms at http://opensource.org/licenses/BSD-3-Clause).
+
+"""
+Convolution and correlation of N-dimensional arrays through FFTW.
+
+The functions follow their scipy.signal counterparts, and compute the
+transforms with plans from the process-wide plan cache. Real inputs are
+transformed with real-to-complex plans and complex ones with complex plans,
+in the precision of the inputs.
+
+The spectrum of the second input, the kernel, is cached as well, so that
+filtering many signals with the same kernel transforms it only once.
+oaconvolve splits the first input into blocks, whose size is chosen by a
+cost model of the transforms, and transforms all the blocks with a single
+batched plan, which the threads of the plan share.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+from skfftw import cache
+from skfftw.aligned import empty_aligned, zeros_aligned
+from skfftw.enums import Direction, Normalization
+from skfftw.fftw import (InverseRealPlan, Plan, RealPlan, _half_shape,
+                         _is_strided)
+from skfftw.interfaces._transforms import complex_dtype, real_dtype, resize
+import collections
+import math
+import numpy as np
+import threading
+
+__all__ = ('fftconvolve', 'oaconvolve', 'correlate', 'next_fast_len')
+
+
+# kernel spectra, by kernel and transform shape
+_kernel_spectra = collections.OrderedDict()
+_kernel_spectra_lock = threading.Lock()
+_max_kernel_spectra = 16
+# largest kernel, in number of values, whose spectrum is cached
+_max_cached_kernel = 1 << 16
+# block sizes of oaconvolve, by signal and kernel size
+_block_sizes = {}
+_max_block_sizes = 1024
+
+
+def next_fast_len(n):
+    """
+    Smallest size of at least n which FFTW transforms efficiently.
+
+    Sizes whose prime factors are 2, 3, 5 and 7 are transformed by the
+    codelets of FFTW.
+    """
+    n = int(n)
+    if n < 1:
+        raise ValueError("Invalid size: {}".format(n))
+    best = 1 << (n - 1).bit_length()
+    p7 = 1
+    while p7 < best:
+        p5 = p7
+        while p5 < best:
+            p3 = p5
+            while p3 < best:
+                # smallest multiple of p3 by a power of two of at least n
+                ratio = -(-n // p3)
+                best = min(best, p3 << (ratio - 1).bit_length())
+                p3 *= 3
+            p5 *= 5
+        p7 *= 7
+    return best
+
+
+def _transform_cost(n):
+    """
+    Relative cost of the transform of n values, including the linear passes
+    over the data around it.
+    """
+    return n * (math.log(n, 2) + 1)
+
+
+def _fast_sizes(low, high):
+    """
+    Sorted sizes of the range [low, high] which FFTW transforms efficiently.
+    """
+    sizes = []
+    p7 = 1
+    while p7 <= high:
+        p5 = p7
+        while p5 <= high:
+            p3 = p5
+            while p3 <= high:
+                n = p3 << max((-(-low // p3) - 1).bit_length(), 0)
+                while n <= high:
+                    sizes.append(n)
+                    n *= 2
+                p3 *= 3
+            p5 *= 5
+        p7 *= 7
+    return sorted(sizes)
+
+
+def _block_size(s, k):
+    """
+    Transform size of the blocks convolving s samples with a kernel of k.
+
+    Blocks of m samples need transforms of n >= m + k - 1 values, and the
+    cost of the transforms of all the blocks is minimized over the fast sizes
+    n of at least 2 * k - 1, so that blocks are longer than the kernel. The
+    cost per sample only grows with n beyond a few times k, which bounds the
+    search. Returns None when a single transform of the whole input is
+    cheaper.
+    """
+    key = (s, k)
+    if key in _block_sizes:
+        return _block_sizes[key]
+    full = next_fast_len(s + k - 1)
+    best, best_cost = None, _transform_cost(full)
+    for n in _fast_sizes(2 * k - 1, min(full - 1, 64 * k)):
+        cost = -(-s // (n - k + 1)) * _transform_cost(n)
+        if cost < best_cost:
+            best, best_cost = n, cost
+    if len(_block_sizes) >= _max_block_sizes:
+        _block_sizes.clear()
+    _block_sizes[key] = best
+    return best
+
+
+def _check_inputs(in1, in2, mode, axes):
+    """
+    Validate the inputs, moving the convolved axes to the end.
+
+    Returns the inputs and the number of convolved axes.
+    """
+    if mode not in ('full', 'same', 'valid'):
+        raise ValueError("Invalid mode {!r}; should be 'full', 'same' or "
+                         "'valid'".format(mode))
+    if in1.ndim != in2.ndim:
+        raise ValueError('Inputs have different dimensionalities')
+    if axes is None:
+        axes = tuple(range(in1.ndim))
+    else:
+        axes = tuple(int(axis) for axis in np.atleast_1d(axes))
+        axes = tuple(axis + in1.ndim if axis < 0 else axis for axis in axes)
+        if any(not 0 <= axis < in1.ndim for axis in axes):
+            raise ValueError("Invalid axes for {}-d arrays".format(in1.ndim))
+        if len(set(axes)) != len(axes):
+            raise ValueError('Repeated axes')
+    for axis in range(in1.ndim):
+        if axis not in axes and 1 not in (in1.shape[axis], in2.shape[axis]):
+            if in1.shape[axis] != in2.shape[axis]:
+                raise ValueError('Inputs have incompatible shapes along '
+                                 "axis {}".format(axis))
+    destination = tuple(range(in1.ndim - len(axes), in1.ndim))
+    return (np.moveaxis(in1, axes, destination),
+            np.moveaxis(in2, axes, destination), axes)
+
+
+def _forward(array, shape, dtype, threads):
+    """
+    Transform an array over its trailing axes, zero-padded to shape.
+    """
+    axes = tuple(range(array.ndim - len(shape), array.ndim))
+    input_shape = array.shape[:-len(shape)] + shape
+    if (array.shape == input_shape and array.dtype == dtype and
+            _is_strided(array)):
+        # forward transforms out of place leave their input untouched
+        input_array = array
+    else:
+        input_array = resize(array, input_shape, dtype)
+    if dtype.kind == 'f':
+        output_array = empty_aligned(_half_shape(input_array.shape),
+                                     complex_dtype(dtype))
+        plan = cache.get_plan(RealPlan, input_array, output_array,
+                              threads=threads, axes=axes)
+    else:
+        output_array = empty_aligned(input_array.shape, dtype)
+        plan = cache.get_plan(Plan, input_array, output_array,
+                              threads=threads, axes=axes)
+    if input_array.size:
+        plan.transform(input_array, output_array)
+    return output_array
+
+
+def _backward(spectrum, shape, dtype, threads):
+    """
+    Inverse of _forward, which destroys the spectrum.
+    """
+    output_shape = spectrum.shape[:-len(shape)] + shape
+    axes = tuple(range(spectrum.ndim - len(shape), spectrum.ndim))
+    output_array = empty_aligned(output_shape, dtype)
+    if dtype.kind == 'f':
+        plan = cache.get_plan(InverseRealPlan, spectrum, output_array,
+                              threads=threads, axes=axes)
+    else:
+        plan = cache.get_plan(Plan, spectrum, output_array,
+                              direction=Direction.backward, threads=threads,
+                              axes=axes)
+    if output_array.size:
+        plan.transform(spectrum, output_array, Normalization.full)
+    return output_array
+
+
+def _kernel_spectrum(kernel, shape, dtype, threads):
+    """
+    Spectrum of a kernel, from the cache of kernel spectra if possible.
+    """
+    if kernel.size > _max_cached_kernel:
+        return _forward(kernel, shape, dtype, threads)
+    key = (kernel.shape, kernel.dtype.str, shape, dtype.str,
+           kernel.tobytes())
+    with _kernel_spectra_lock:
+        spectrum = _kernel_spectra.get(key)
+        if spectrum is not None:
+            _kernel_spectra.move_to_end(key)
+            return spectrum
+    spectrum = _forward(kernel, shape, dtype, threads)
+    spectrum.flags.writeable = False
+    with _kernel_spectra_lock:
+        _kernel_spectra[key] = spectrum
+        while len(_kernel_spectra) > _max_kernel_spectra:
+            _kernel_spectra.popitem(last=False)
+    return spectrum
+
+
+def _multiply(spectrum, kernel_spectrum):
+    """
+    Multiply a spectrum by a kernel spectrum, in place when possible.
+    """
+    shape = np.broadcast(spectrum, kernel_spectrum).shape
+    if shape == spectrum.shape:
+        return np.multiply(spectrum, kernel_spectrum, out=spectrum)
+    output = empty_aligned(shape, spectrum.dtype)
+    return np.multiply(spectrum, kernel_spectrum, out=output)
+
+
+def _dtype(in1, in2):
+    dtype = np.result_type(in1, in2)
+    if dtype.kind == 'c':
+        return complex_dtype(dtype)
+    return real_dtype(dtype)
+
+
+def _apply_mode(full, s1, s2, mode):
+    """
+    Crop the trailing axes of a full convolution as selected by mode.
+    """
+    if mode == 'full':
+        shape = tuple(n1 + n2 - 1 for n1, n2 in zip(s1, s2))
+    elif mode == 'same':
+        shape = s1
+    else:
+        shape = tuple(max(n1, n2) - min(n1, n2) + 1 for n1, n2 in zip(s1, s2))
+    starts = [(n - m) // 2 for n, m in zip(full.shape[-len(s1):], shape)]
+    if mode == 'full':
+        starts = [0] * len(s1)
+    index = tuple(slice(start, start + n) for start, n in zip(starts, shape))
+    return full[(Ellipsis,) + index]
+
+
+def _check_valid(s1, s2, mode):
+    if mode == 'valid' and not (all(n1 >= n2 for n1, n2 in zip(s1, s2)) or
+                                all(n2 >= n1 for n1, n2 in zip(s1, s2))):
+        raise ValueError("For 'valid' mode, one input must be at least as "
+                         "large as the other in every dimension")
+
+
+def _result(output, axes):
+    destination = tuple(range(output.ndim - len(axes), output.ndim))
+    return np.moveaxis(output, destination, axes)
+
+
+def fftconvolve(in1, in2, mode='full', axes=None, threads=None):
+    """
+    Convolve two N-dimensional arrays with a single transform of each.
+
+    See scipy.signal.fftconvolve. The transforms use the given number of
+    threads, which defaults to skfftw.fftw.get_default_threads.
+    """
+    in1, in2 = np.asarray(in1), np.asarray(in2)
+    in1, in2, axes = _check_inputs(in1, in2, mode, axes)
+    dtype = _dtype(in1, in2)
+    if in1.size == 0 or in2.size == 0:
+        return np.array([], dtype=dtype)
+    d = len(axes)
+    s1, s2 = in1.shape[in1.ndim - d:], in2.shape[in2.ndim - d:]
+    _check_valid(s1, s2, mode)
+    shape = tuple(next_fast_len(n1 + n2 - 1) for n1, n2 in zip(s1, s2))
+    spectrum = _multiply(_forward(in1, shape, dtype, threads),
+                         _kernel_spectrum(in2, shape, dtype, threads))
+    full = _backward(spectrum, shape, dtype, threads)
+    full = full[(Ellipsis,) + tuple(slice(0, n1 + n2 - 1)
+                                    for n1, n2 in zip(s1, s2))]
+    return _result(_apply_mode(full, s1, s2, mode), axes)
+
+
+def _overlap_add(blocks, axis, step):
+    """
+    Overlap-add consecutive blocks along an axis.
+
+    The blocks are indexed by the given axis, and the following one holds
+    their values, which start every step values and overlap the next block
+    by less than step values. The two axes are replaced by the sum.
+    """
+    count, n = blocks.shape[axis], blocks.shape[axis + 1]
+    before, after = blocks.shape[:axis], blocks.shape[axis + 2:]
+    if count == 1:
+        return blocks.reshape(before + (n,) + after)
+    output = np.zeros(before + ((count + 1) * step,) + after, blocks.dtype)
+    index = (slice(None),) * axis
+    head = output[index + (slice(0, count * step),)]
+    head = head.reshape(before + (count, step) + after)
+    head += blocks[index + (slice(None), slice(0, step))]
+    tail = output[index + (slice(step, (count + 1) * step),)]
+    tail = tail.reshape(before + (count, step) + after)
+    tail[index + (slice(None), slice(0, n - step))] += blocks[
+        index + (slice(None), slice(step, n))]
+    return output[index + (slice(0, count * step + n - step),)]
+
+
+def oaconvolve(in1, in2, mode='full', axes=None, threads=None):
+    """
+    Convolve two N-dimensional arrays by overlap-add.
+
+    See scipy.signal.oaconvolve. The larger input is split into blocks along
+    each convolved axis, whose size minimizes the cost of their transforms,
+    and falls back to fftconvolve when a single block is cheaper. All the
+    blocks are transformed by one batched plan, using the given number of
+    threads, which defaults to skfftw.fftw.get_default_threads.
+    """
+    in1, in2 = np.asarray(in1), np.asarray(in2)
+    signal, kernel, moved_axes = _check_inputs(in1, in2, mode, axes)
+    dtype = _dtype(signal, kernel)
+    if signal.size == 0 or kernel.size == 0:
+        return np.array([], dtype=dtype)
+    d = len(moved_axes)
+    s1, s2 = signal.shape[signal.ndim - d:], kernel.shape[kernel.ndim - d:]
+    _check_valid(s1, s2, mode)
+    if all(n1 <= n2 for n1, n2 in zip(s1, s2)):
+        signal, kernel = kernel, signal
+    s, k = signal.shape[signal.ndim - d:], kernel.shape[kernel.ndim - d:]
+    sizes = [_block_size(n1, n2) if n1 >= n2 else None
+             for n1, n2 in zip(s, k)]
+    if not any(sizes) or any(n1 < n2 for n1, n2 in zip(s, k)):
+        return fftconvolve(in1, in2, mode, axes, threads)
+    shape = tuple(n or next_fast_len(n1 + n2 - 1)
+                  for n, n1, n2 in zip(sizes, s, k))
+    steps = tuple(n - n2 + 1 if size else n1
+                  for n, size, n1, n2 in zip(shape, sizes, s, k))
+    counts = tuple(-(-n1 // step) for n1, step in zip(s, steps))
+    # split the signal into blocks, indexed by the leading axes
+    other = signal.shape[:signal.ndim - d]
+    padded = resize(signal, other + tuple(c * step for c, step in
+                                          zip(counts, steps)), dtype)
+    interleaved = padded.reshape(other + sum(zip(counts, steps), ()))
+    o = len(other)
+    grouped = interleaved.transpose(
+        tuple(range(o)) + tuple(range(o, o + 2 * d, 2)) +
+        tuple(range(o + 1, o + 2 * d, 2)))
+    blocks = zeros_aligned(other + counts + shape, dtype)
+    np.copyto(blocks[(Ellipsis,) + tuple(slice(0, step) for step in steps)],
+              grouped)
+    kernel_spectrum = _kernel_spectrum(kernel, shape, dtype, threads)
+    kernel_spectrum = kernel_spectrum.reshape(
+        kernel_spectrum.shape[:kernel.ndim - d] + (1,) * d +
+        kernel_spectrum.shape[kernel.ndim - d:])
+    spectrum = _multiply(_forward(blocks, shape, dtype, threads),
+                         kernel_spectrum)
+    output = _backward(spectrum, shape, dtype, threads)
+    o = output.ndim - 2 * d
+    output = output.transpose(
+        tuple(range(o)) + sum(zip(range(o, o + d), range(o + d, o + 2 * d)),
+                              ()))
+    for i, step in enumerate(steps):
+        output = _overlap_add(output, o + i, step)
+    full = output[(Ellipsis,) + tuple(slice(0, n1 + n2 - 1)
+                                      for n1, n2 in zip(s, k))]
+    if mode == 'same':
+        return _result(_apply_mode(full, s1, s2, mode), moved_axes)
+    return _result(_apply_mode(full, s, k, mode), moved_axes)
+
+
+def _reverse_and_conjugate(array, axes):
+    """
+    Reverse an array along the given axes, and conjugate it.
+    """
+    if axes is None:
+        axes = range(array.ndim)
+    reverse = [slice(None)] * array.ndim
+    for axis in np.atleast_1d(axes):
+        reverse[axis] = slice(None, None, -1)
+    return np.conjugate(array[tuple(reverse)])
+
+
+def correlate(in1, in2, mode='full', axes=None, threads=None):
+    """
+    Cross-correlate two N-dimensional arrays.
+
+    See scipy.signal.correlate. The correlation is computed as the
+    convolution of in1 with in2 reversed and conjugated, by oaconvolve.
+    """
+    in2 = np.asarray(in2)
+    if np.ndim(in1) != in2.ndim:
+        raise ValueError('Inputs have different dimensionalities')
+    return oaconvolve(in1, _reverse_and_conjugate(in2, axes), mode, axes,
+                      threads)
@@ -7,10 +7,10 @@
 
 from __future__ import absolute_import, division, print_function
 
-from .backend.constants import *
+from .wrappers.constants import *
 import enum
 
-__all__ = ('FftwDirection', 'FftwFlag', 'FftwNormalization')
+__all__ = ('FftwDirection', 'FftwFlag', 'FftwNormalization', 'FftwR2RKind')
 
 
 @enum.unique
@@ -36,6 +36,23 @@ class Flag(enum.IntEnum):
 FftwFlag = Flag
 
 
+@enum.unique
+class R2RKind(enum.IntEnum):
+    r2hc = FFTW_R2HC
+    hc2r = FFTW_HC2R
+    dht = FFTW_DHT
+    redft00 = FFTW_REDFT00
+    redft01 = FFTW_REDFT01
+    redft10 = FFTW_REDFT10
+    redft11 = FFTW_REDFT11
+    rodft00 = FFTW_RODFT00
+    rodft01 = FFTW_RODFT01
+    rodft10 = FFTW_RODFT10
+    rodft11 = FFTW_RODFT11
+
+FftwR2RKind = R2RKind
+
+
 class Normalization(enum.Enum):
     none = 0
     sqrt = 1
@@ -7,12 +7,306 @@
 
 from __future__ import absolute_import, division, print_function
 
-from skfftw.enums import Direction, Flag, Normalization
-from skfftw.wrappers import libfftw, libfftwf, libfftwl
+from skfftw import wisdom
+from skfftw.aligned import empty_aligned
+from skfftw.enums import Direction, Flag, Normalization, R2RKind
+from skfftw.wrappers import load_library, planner_lock
+from functools import reduce
+from numpy.lib.stride_tricks import as_strided
+from timeit import default_timer as _timer
 import numpy as np
+import operator
+import threading
+import warnings
 
 
-__all__ = ('Plan',)
+__all__ = ('Plan', 'RealPlan', 'InverseRealPlan', 'R2RPlan',
+           'empty_real_inplace', 'get_default_threads', 'set_default_threads')
+
+
+_default_threads = 1
+# wrapper modules for which the FFTW threads library has been initialised
+_threads_initialized = set()
+# largest size or stride of the int based interfaces of FFTW
+_int_max = np.iinfo(np.intc).max
+
+
+def get_default_threads():
+    """
+    Number of threads used by plans created without an explicit count.
+    """
+    return _default_threads
+
+
+def set_default_threads(threads):
+    """
+    Set the number of threads used by plans created without an explicit count.
+    """
+    global _default_threads
+    _default_threads = _check_threads(threads)
+
+
+def _check_threads(threads):
+    threads = int(threads)
+    if threads < 1:
+        raise ValueError("Invalid number of threads: {}".format(threads))
+    return threads
+
+
+def _check_timelimit(timelimit):
+    if timelimit is None:
+        return None
+    timelimit = float(timelimit)
+    if not timelimit > 0:
+        raise ValueError("Invalid time limit: {}".format(timelimit))
+    return timelimit
+
+
+def _rigor(flag_int):
+    """
+    Flag setting the rigor of the planner for the given flags.
+    """
+    for flag in (Flag.wisdom_only, Flag.estimate, Flag.exhaustive,
+                 Flag.patient):
+        if flag_int & flag:
+            return flag
+    return Flag.measure
+
+
+def _future(done):
+    """
+    Future resolved with None if done, or pending otherwise.
+    """
+    from concurrent.futures import Future
+    future = Future()
+    if done:
+        future.set_running_or_notify_cancel()
+        future.set_result(None)
+    return future
+
+
+def _planner_failure(flag_int):
+    if flag_int & Flag.wisdom_only:
+        return RuntimeError('No wisdom available for the plan')
+    return RuntimeError('Failed to create the plan')
+
+
+def empty_real_inplace(shape, dtype=np.double):
+    """
+    Allocate a pair of arrays for in-place real transforms.
+
+    Returns a real array of the given shape and a complex array of the
+    matching half-spectrum shape, both viewing the same buffer. The last
+    dimension of the real array is padded to hold 2 * (n // 2 + 1) values, as
+    required by FFTW.
+    """
+    shape = tuple(np.atleast_1d(shape))
+    real_dt = np.dtype(dtype)
+    if real_dt.kind != 'f':
+        raise ValueError("Unsupported data type: {}".format(real_dt))
+    complex_array = empty_aligned(_half_shape(shape),
+                                  dtype=np.promote_types(real_dt, np.csingle))
+    real_array = complex_array.view(real_dt)[..., :shape[-1]]
+    return real_array, complex_array
+
+
+def _half_shape(shape, axis=-1):
+    shape = list(shape)
+    shape[axis] = shape[axis] // 2 + 1
+    return tuple(shape)
+
+
+def _product(values):
+    return reduce(operator.mul, values, 1)
+
+
+def _check_axes(axes, ndim):
+    """
+    Normalize the axes of a transform, which default to all axes.
+    """
+    if axes is None:
+        axes = tuple(range(ndim))
+    else:
+        axes = tuple(int(axis) for axis in np.atleast_1d(axes))
+        axes = tuple(axis + ndim if axis < 0 else axis for axis in axes)
+    if not axes or any(not 0 <= axis < ndim for axis in axes):
+        raise ValueError("Invalid axes for {}-d arrays".format(ndim))
+    if len(set(axes)) != len(axes):
+        raise ValueError('Repeated axes')
+    return axes
+
+
+def _stride(array, axis):
+    """
+    Stride of an array along an axis, in number of elements.
+    """
+    if array.shape[axis] == 1:
+        # unit dimensions may have any stride
+        return 0
+    stride, remainder = divmod(array.strides[axis], array.itemsize)
+    if remainder:
+        raise ValueError('Strides must be multiples of the item size')
+    return stride
+
+
+def _data(array):
+    return array.__array_interface__['data'][0]
+
+
+def _is_strided(array):
+    """
+    Whether FFTW can transform an array in place of its memory, its strides
+    being positive multiples of the item size.
+    """
+    return all(n < 2 or (s > 0 and s % array.itemsize == 0)
+               for n, s in zip(array.shape, array.strides))
+
+
+def _as_array(obj):
+    """
+    Array viewing the memory of an object, without copy.
+
+    The object is an ndarray, or exports __array_interface__, DLPack or the
+    buffer protocol, as memoryviews, array.array, Arrow buffers and CPU
+    tensors do. The view is read-only if the memory of the object is.
+    """
+    if isinstance(obj, np.ndarray):
+        return obj
+    if hasattr(obj, '__array_interface__'):
+        return np.asarray(obj)
+    if hasattr(obj, '__dlpack__') and hasattr(np, 'from_dlpack'):
+        return np.from_dlpack(obj)
+    try:
+        buffer = memoryview(obj)
+    except TypeError:
+        raise TypeError("Unsupported array type: {}".format(
+            type(obj).__name__))
+    return np.asarray(buffer)
+
+
+def _simd_aligned(array):
+    """
+    Whether an array has the SIMD alignment expected by FFTW for its type.
+    """
+    try:
+        library = load_library(array.dtype)
+    except ValueError:
+        return False
+    return library.alignment_of(array) == 0
+
+
+def _extent(array):
+    """
+    Number of bytes spanned by the data of an array.
+    """
+    if not array.size:
+        return 0
+    return array.itemsize + sum((n - 1) * s
+                                for n, s in zip(array.shape, array.strides))
+
+
+def _exceeds_int(array):
+    """
+    Whether the elements spanned by an array exceed the range of int, and
+    with them the sizes and strides of the arrays, or their products.
+    """
+    return _extent(array) // array.itemsize > _int_max
+
+
+def _is_dense(array):
+    return array.flags.c_contiguous or array.flags.f_contiguous
+
+
+def _aligned_copies(*arrays):
+    """
+    Aligned arrays sharing one buffer with the same layout as the arrays.
+
+    The arrays must have non-negative strides and start at the same address,
+    as those of an in-place transform do. Their content is not copied.
+    """
+    buffer = empty_aligned(max(_extent(array) for array in arrays), np.uint8)
+    return [np.ndarray(array.shape, array.dtype, buffer, 0, array.strides)
+            for array in arrays]
+
+
+def _rebuilt_arrays(layouts, inplace):
+    """
+    Aligned arrays of the given shapes, data types and strides, sharing one
+    buffer if inplace.
+    """
+    templates = [as_strided(np.zeros(1, dtype), shape, strides)
+                 for shape, dtype, strides in layouts]
+    if inplace:
+        return _aligned_copies(*templates)
+    return [_aligned_copies(template)[0] for template in templates]
+
+
+def _new_plan(plan_class):
+    return plan_class.__new__(plan_class)
+
+
+def _logical_size(kind, n):
+    """
+    Size of the DFT equivalent to a real-to-real transform of n samples.
+
+    Normalizing by this size makes a pair of inverse transforms, such as
+    R2RKind.redft10 and R2RKind.redft01, an identity.
+    """
+    if kind is R2RKind.redft00:
+        if n < 2:
+            raise ValueError('REDFT00 transforms require at least 2 samples')
+        return 2 * (n - 1)
+    if kind is R2RKind.rodft00:
+        return 2 * (n + 1)
+    if kind in (R2RKind.r2hc, R2RKind.hc2r, R2RKind.dht):
+        return n
+    return 2 * n
+
+
+def _layout(array):
+    """
+    Memory layout of an array, ignoring the strides of unit dimensions.
+    """
+    strides = tuple(s if n > 1 else 0
+                    for n, s in zip(array.shape, array.strides))
+    return array.shape, array.dtype, strides
+
+
+_invalid_strides = 'Strides must be positive multiples of the item size'
+
+
+def _check_real_arrays(real_array, complex_array, axes):
+    """
+    Validate the arrays of a real transform and return the real data type.
+
+    The complex array must hold the half-spectrum of the real array along the
+    last transformed axis. Either the arrays do not share their memory and
+    have any strides, or the real array is the padded view of a C-contiguous
+    complex array used by in-place transforms.
+    """
+    real_dt = np.dtype(real_array.dtype)
+    if real_dt.kind != 'f':
+        raise ValueError("Unsupported real array: {}".format(real_dt))
+    if complex_array.dtype != np.promote_types(real_dt, np.csingle):
+        raise ValueError("Incompatible complex data type: {}".format(
+            complex_array.dtype))
+    expected_shape = _half_shape(real_array.shape, axes[-1])
+    if complex_array.shape != expected_shape:
+        raise ValueError("Incompatible half-spectrum shape: expected {}, "
+                         "got {}".format(expected_shape, complex_array.shape))
+    if _data(real_array) == _data(complex_array):
+        if not complex_array.flags.c_contiguous:
+            raise ValueError('Complex array must be C-contiguous')
+        if axes[-1] != real_array.ndim - 1:
+            raise ValueError('In-place real transforms must halve the last '
+                             'axis')
+        padded_layout = _layout(complex_array.view(real_dt)[
+            ..., :real_array.shape[-1]])
+        if _layout(real_array) != padded_layout:
+            raise ValueError('Invalid padding of in-place real array')
+    elif not (_is_strided(real_array) and _is_strided(complex_array)):
+        raise ValueError(_invalid_strides)
+    return real_dt
 
 
 class Plan(object):
@@ -21,45 +315,395 @@ class Plan(object):
     The FFTW plan class.
     """
     
-    __planner_funcs = {np.dtype('cdouble'): libfftw.plan_dft,
-                       np.dtype('csingle'): libfftwf.plan_dft,
-                       np.dtype('clongdouble'): libfftwl.plan_dft}
-    __execute_funcs = {np.dtype('cdouble'): libfftw.execute_dft,
-                       np.dtype('csingle'): libfftwf.execute_dft,
-                       np.dtype('clongdouble'): libfftwl.execute_dft}
-    __destroy_funcs = {np.dtype('cdouble'): libfftw.destroy_plan,
-                       np.dtype('csingle'): libfftwf.destroy_plan,
-                       np.dtype('clongdouble'): libfftwl.destroy_plan}
+    # data types of the arrays, and functions of the wrapper module of their
+    # precision, by attribute of the plan
+    _dtypes = (np.dtype('cdouble'), np.dtype('csingle'),
+               np.dtype('clongdouble'))
+    _functions = {'_planner': 'plan_dft',
+                  '_many_planner': 'plan_many_dft',
+                  '_guru_planner': 'plan_guru_dft',
+                  '_guru64_planner': 'plan_guru64_dft',
+                  '_execute': 'execute_dft',
+                  '_pointers': 'dft_pointers',
+                  '_execute_pointers': 'execute_dft_pointers',
+                  '_execute_scaled': 'execute_dft_scaled_pointers',
+                  '_destroy': 'destroy_plan'}
     
     def __init__(self, input_array, output_array,
                  direction=Direction.forward, flags=(Flag.estimate,),
-                 *args, **kwargs):
+                 threads=None, axes=None, realign=True, planning='blocking',
+                 timelimit=None, *args, **kwargs):
         """
         Instantiate a DFT plan.
+
+        The transform is computed with the given number of threads, which
+        defaults to the process-wide value of get_default_threads().
+
+        By default, all the axes of the arrays are transformed. A subset of
+        axes may be selected instead, in which case the remaining axes are
+        batch dimensions, transformed independently by the same plan.
+
+        Plans created for arrays with the SIMD alignment of FFTW, such as
+        those allocated by empty_aligned, require the same alignment from the
+        arrays they are executed on. Misaligned arrays are transformed through
+        aligned copies when realign is set, and rejected with a RuntimeError
+        otherwise. Plans created for misaligned arrays are planned with
+        Flag.unaligned and accept any alignment.
+
+        With planning set to 'background', planner flags more rigorous than
+        Flag.estimate do not block the caller: the plan is first created with
+        Flag.estimate, while the plan requested is created on a background
+        thread, which then swaps it in. The planner lock is held by that
+        thread meanwhile. The upgrade property is a future resolved once the
+        plan is swapped.
+
+        With planning set to 'wisdom', the plan is created from the wisdom
+        only if possible, and planned with its flags otherwise. Planning may
+        be bounded by a timelimit, in seconds, past which the planner returns
+        the best plan found so far. The planning_path property reports how
+        the plan was created. Plans created with Flag.wisdom_only and no
+        wisdom raise a RuntimeError.
+
+        The wall time spent planning, and the number and duration of the
+        executions, are recorded by the plan.
+
+        Besides ndarrays, the arrays may be any object exporting
+        __array_interface__, DLPack or the buffer protocol, which the plan
+        transforms in place of their memory through an ndarray view. Arrays
+        the plan writes to must be writable: the output array, and the input
+        array of in-place plans, of plans destroying their input, and of
+        plans measured by the planner.
         """
+        input_array, output_array = _as_array(input_array), _as_array(
+            output_array)
         self._handle = None
-        dt = np.dtype(input_array.dtype)
-        try:
-            self._planner = self.__planner_funcs[dt]
-            self._execute = self.__execute_funcs[dt]
-            self._destroy = self.__destroy_funcs[dt]
-        except:
+        self._retired_handles = []
+        self._executions = 0
+        self._execution_time = 0.0
+        self._axes = _check_axes(axes, input_array.ndim)
+        dt = self._check_arrays(input_array, output_array)
+        if dt not in self._dtypes:
             raise ValueError("Unsupported data type: {}".format(dt))
+        self._library = load_library(dt)
+        for attribute, function in self._functions.items():
+            setattr(self, attribute, getattr(self._library, function))
+        self._alignment_of = self._library.alignment_of
+        if threads is None:
+            threads = _default_threads
+        self._threads = _check_threads(threads)
         self._input_array = input_array
         self._output_array = output_array
+        self._input_layout = _layout(input_array)
+        self._output_layout = _layout(output_array)
+        self._inplace = _data(input_array) == _data(output_array)
         self._direction = direction
-        sign_int = int(self._direction)
         self._flags = flags
+        self._realign = realign
+        if planning not in ('blocking', 'background', 'wisdom'):
+            raise ValueError("Invalid planning mode: {}".format(planning))
+        self._timelimit = _check_timelimit(timelimit)
         flag_int = 0
         for flag in self._flags:
             flag_int |= int(flag)
-        self._handle = self._planner(self._input_array, self._output_array,
-                                     sign_int, flag_int)
+        self._aligned = (not flag_int & Flag.unaligned and
+                         self._is_aligned(*self._planning_arrays()))
+        if not self._aligned:
+            flag_int |= Flag.unaligned
+        wisdom._autoload(dt)
+        background = (planning == 'background' and
+                      not flag_int & (Flag.estimate | Flag.wisdom_only))
+        if background:
+            initial_flag_int = (flag_int & ~(Flag.patient | Flag.exhaustive) |
+                                Flag.estimate)
+        else:
+            initial_flag_int = flag_int
+        # the planner overwrites the arrays it measures
+        measured = (_rigor(initial_flag_int) not in
+                    (Flag.estimate, Flag.wisdom_only) and
+                    self._planning_arrays()[0] is input_array)
+        if not self._is_writable(input_array, output_array, measured):
+            raise ValueError('Read-only array overwritten by the plan')
+        self._planning_time = 0.0
+        arrays = self._planning_arrays()
+        handle = None
+        if planning == 'wisdom' and not flag_int & Flag.wisdom_only:
+            self._planning_path = Flag.wisdom_only
+            handle = self._plan_handle(flag_int | Flag.wisdom_only, *arrays)
+        if handle is None:
+            self._planning_path = _rigor(initial_flag_int)
+            handle = self._plan_handle(initial_flag_int, *arrays)
+        if handle is None:
+            raise _planner_failure(initial_flag_int)
+        self._handle = handle
+        self._bind_arrays(input_array, output_array)
+        # scale factors of the plan, and number of values they apply to
+        scale_factor = self._library.scale_factor
+        self._scale_factors = {Normalization.sqrt: scale_factor(self.N, True),
+                               Normalization.full: scale_factor(self.N)}
+        # the values spanned by the output are scaled, which is only safe
+        # when they all belong to the output, or to the padding of in-place
+        # real transforms
+        if (_is_dense(output_array) or
+                (self._inplace and _is_dense(input_array))):
+            self._scaled_size = (_extent(output_array) //
+                                 output_array.real.itemsize)
+        else:
+            self._scaled_size = None
+        # futures are only created on demand, importing them being slow
+        self._upgrade = None
+        if background:
+            self._upgrade = _future(done=False)
+            thread = threading.Thread(target=self._plan_in_background,
+                                      args=(flag_int,))
+            thread.daemon = True
+            thread.start()
     
     def __del__(self):
-        if self._handle is not None:
-            self._destroy(self._handle)
+        self.destroy()
+
+    def destroy(self):
+        """
+        Release the FFTW plan.
+
+        Called automatically when the Plan instance is garbage collected. The
+        plan cannot be executed anymore afterwards.
+        """
+        if getattr(self, '_handle', None) is None:
+            return
+        with planner_lock:
+            handle, self._handle = self._handle, None
+            if handle is not None:
+                self._destroy(handle)
+            for handle in self._retired_handles:
+                self._destroy(handle)
+            del self._retired_handles[:]
+
+    def __reduce__(self):
+        """
+        Pickle the geometry and parameters of the plan, with the wisdom of
+        its precision.
+
+        The arrays of the plan are not pickled: the plan is rebuilt for new
+        arrays of the same layout. Plans planned in the background are
+        pickled once the plan requested is swapped in.
+        """
+        self._live_handle()
+        if self._upgrade is not None:
+            self._upgrade.result()
+        kwargs = self._init_kwargs()
+        flags = tuple(kwargs['flags'])
+        if not self._aligned and Flag.unaligned not in flags:
+            flags += (Flag.unaligned,)
+        kwargs['flags'] = flags
+        if _rigor(reduce(operator.or_, map(int, flags), 0)) is Flag.estimate:
+            plan_wisdom = None
+        else:
+            plan_wisdom = wisdom.export_wisdom_to_string(
+                self._input_array.dtype)
+        state = {'layouts': [(array.shape, array.dtype.str, array.strides)
+                             for array in (self._input_array,
+                                           self._output_array)],
+                 'inplace': self._inplace,
+                 'kwargs': kwargs,
+                 'wisdom': plan_wisdom}
+        return _new_plan, (self.__class__,), state
+
+    def __setstate__(self, state):
+        """
+        Rebuild a pickled plan.
+
+        Plans more rigorous than Flag.estimate are created from the wisdom
+        pickled with them, under Flag.wisdom_only, so that they are not
+        measured again. Should the wisdom not provide the plan, as with
+        another version of FFTW, the plan is created with Flag.estimate and a
+        RuntimeWarning is issued.
+        """
+        input_array, output_array = _rebuilt_arrays(state['layouts'],
+                                                    state['inplace'])
+        kwargs = dict(state['kwargs'])
+        flags = tuple(kwargs.pop('flags'))
+        if state['wisdom'] is None:
+            self.__init__(input_array, output_array, flags=flags, **kwargs)
+            return
+        wisdom.import_wisdom_from_string(state['wisdom'],
+                                         input_array.dtype)
+        try:
+            self.__init__(input_array, output_array,
+                          flags=flags + (Flag.wisdom_only,), **kwargs)
+        except RuntimeError:
+            warnings.warn('Pickled wisdom does not provide the plan, created '
+                          'with Flag.estimate instead', RuntimeWarning)
+            rigor = (Flag.measure, Flag.patient, Flag.exhaustive,
+                     Flag.wisdom_only)
+            self.__init__(input_array, output_array,
+                          flags=tuple(flag for flag in flags
+                                      if flag not in rigor) +
+                          (Flag.estimate,), **kwargs)
+        else:
+            # the plan is the one requested, only found in the wisdom
+            self._flags = tuple(flag for flag in self._flags
+                                if flag is not Flag.wisdom_only)
+
+    def _init_kwargs(self):
+        """
+        Private method returning the keyword arguments which recreate the
+        plan, given arrays of the same layout.
+        """
+        return {'direction': self._direction, 'flags': self._flags,
+                'threads': self._threads, 'axes': self._axes,
+                'realign': self._realign, 'timelimit': self._timelimit}
+
+    def _plan_in_background(self, flag_int):
+        """
+        Private method creating the plan requested, then swapping it for the
+        plan created with Flag.estimate.
+
+        The planner overwrites the arrays it measures, hence works on aligned
+        scratch arrays with the layout of the planning arrays. The plan
+        replaced is only destroyed with the Plan instance, as concurrent
+        callers may still be executing it.
+        """
+        future = self._upgrade
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            arrays = self._planning_arrays()
+            if self._inplace:
+                scratch_arrays = _aligned_copies(*arrays)
+            else:
+                scratch_arrays = [_aligned_copies(array)[0]
+                                  for array in arrays]
+            with planner_lock:
+                if self._handle is None:
+                    raise RuntimeError('The plan has been destroyed')
+                handle = self._plan_handle(flag_int, *scratch_arrays)
+                if handle is None:
+                    raise _planner_failure(flag_int)
+                self._retired_handles.append(self._handle)
+                self._handle = handle
+                self._planning_path = _rigor(flag_int)
+        except Exception as error:
+            future.set_exception(error)
+        else:
+            future.set_result(None)
     
+    def _plan_handle(self, flag_int, input_array, output_array):
+        """
+        Private method creating an FFTW plan with the threads and the time
+        limit of the plan.
+
+        Returns None if the planner fails, as it does with Flag.wisdom_only
+        when the wisdom lacks the transform.
+        """
+        with planner_lock:
+            self._plan_with_nthreads(self._library, self._threads)
+            self._library.set_timelimit(self._timelimit)
+            start = _timer()
+            try:
+                handle = self._create_handle(flag_int, input_array,
+                                             output_array)
+            finally:
+                self._planning_time += _timer() - start
+                self._library.set_timelimit(None)
+        return handle if handle else None
+
+    def _check_arrays(self, input_array, output_array):
+        """
+        Private method validating the arrays supplied at construct time.
+
+        Returns the data type selecting the FFTW functions of the plan.
+        """
+        if input_array.dtype != output_array.dtype:
+            raise ValueError('Input and output arrays have different types')
+        if input_array.shape != output_array.shape:
+            raise ValueError('Input and output arrays have different shapes')
+        if not (_is_strided(input_array) and _is_strided(output_array)):
+            raise ValueError(_invalid_strides)
+        return np.dtype(input_array.dtype)
+
+    def _transform_shape(self):
+        """
+        Private method returning the logical shape of the transform.
+        """
+        return self._input_array.shape
+
+    def _planning_arrays(self):
+        """
+        Private method returning the arrays handed to the FFTW planner.
+        """
+        return self._input_array, self._output_array
+
+    def _planner_args(self, flag_int):
+        """
+        Private method returning the trailing arguments of the planners.
+        """
+        return int(self._direction), flag_int
+
+    def _create_handle(self, flag_int, input_array, output_array):
+        """
+        Private method calling the FFTW planner on the planning arrays, or on
+        arrays of the same layout.
+
+        Transforms over all the axes of contiguous arrays use the basic
+        interface. Transforms over their trailing axes use the advanced
+        interface, with the leading axes collapsed into a single batch
+        dimension. Any other subset of axes, and arrays of any other strides,
+        such as Fortran-ordered arrays and sliced views, go through the guru
+        interface, whose dimensions are given by the strides of the arrays.
+
+        Arrays spanning more elements than int can count always go through
+        the 64-bit guru interface, whose sizes and strides are ptrdiff_t.
+        """
+        args = self._planner_args(flag_int)
+        ndim = input_array.ndim
+        rank = len(self._axes)
+        shape = self._transform_shape()
+        large = _exceeds_int(input_array) or _exceeds_int(output_array)
+        if (not large and self._axes == tuple(range(ndim)) and
+                self._is_contiguous(input_array, output_array)):
+            return self._planner(input_array, output_array, *args)
+        if (not large and self._axes == tuple(range(ndim - rank, ndim)) and
+                input_array.flags.c_contiguous and
+                output_array.flags.c_contiguous):
+            return self._many_planner(
+                shape[ndim - rank:],
+                _product(shape[:ndim - rank]),
+                input_array, 1, _product(input_array.shape[ndim - rank:]),
+                output_array, 1, _product(output_array.shape[ndim - rank:]),
+                *args)
+        dims = [(shape[axis], _stride(input_array, axis),
+                 _stride(output_array, axis)) for axis in self._axes]
+        howmany_dims = [(shape[axis], _stride(input_array, axis),
+                         _stride(output_array, axis))
+                        for axis in range(ndim) if axis not in self._axes]
+        guru_planner = self._guru64_planner if large else self._guru_planner
+        return guru_planner(dims, howmany_dims, input_array, output_array,
+                            *args)
+
+    def _is_contiguous(self, input_array, output_array):
+        """
+        Private method checking whether the arrays have the layout expected
+        by the basic interface of FFTW.
+        """
+        return (input_array.flags.c_contiguous and
+                output_array.flags.c_contiguous)
+
+    def _plan_with_nthreads(self, library, threads):
+        """
+        Private method setting the number of threads of the next plan.
+
+        The threads library of a precision is only initialised once a
+        multithreaded plan is requested. Must be called with the planner lock
+        held.
+        """
+        if library not in _threads_initialized:
+            if threads == 1:
+                return
+            if not library.init_threads():
+                raise RuntimeError('Failed to initialize FFTW threads')
+            _threads_initialized.add(library)
+        library.plan_with_nthreads(threads)
+
     def __call__(self, input_array=None, output_array=None,
         normalization=Normalization.none, *args, **kwargs):
         """
@@ -71,16 +715,69 @@ class Plan(object):
         using the input_array and output_array parameters. If the supplied
         array(s) is (are) not compatible with the original one(s) supplied 
         at construct time, a RuntimeError is raised.
+
+        The transform itself only uses the arrays it is given, so threads
+        sharing a plan may call it concurrently with their own arrays.
+
+        Arrays already used by the previous call are not validated again, and
+        are transformed with the data pointers cached at that time. They must
+        not be reshaped in place in the meantime. The plan keeps them alive
+        until they are replaced, see transform otherwise.
+        """
+        scale_factor = self._scale_factor(normalization)
+        bound = self._bound
+        if not ((input_array is None or input_array is bound[0]) and
+                (output_array is None or output_array is bound[1])):
+            bound = self._update_arrays(input_array, output_array)
+        return self._execute_normalized(bound, normalization, scale_factor)
+
+    def transform(self, input_array, output_array,
+                  normalization=Normalization.none):
+        """
+        Execute DFT from plan on the given arrays, without keeping them.
+
+        Unlike __call__, the arrays are not bound to the plan, hence are
+        validated on every call, and are not kept alive by the plan. This
+        suits plans shared by many callers, such as those of the plan cache.
+
+        Returns the output array.
+        """
+        scale_factor = self._scale_factor(normalization)
+        bound = self._update_arrays(input_array, output_array, bind=False)
+        return self._execute_normalized(bound, normalization, scale_factor)
+
+    def _scale_factor(self, normalization):
         """
-        self.execute_dft(input_array, output_array)
-        if normalization is not Normalization.none:
+        Private method returning the scale factor of a normalization, or None.
+        """
+        if normalization is Normalization.none:
+            return None
+        try:
+            return self._scale_factors[normalization]
+        except (KeyError, TypeError):
+            raise ValueError("Incompatible normalization")
+
+    def _execute_normalized(self, bound, normalization, scale_factor):
+        """
+        Private method executing the plan on bound arrays, then normalizing
+        the output.
+        """
+        start = _timer()
+        if scale_factor is None:
+            self._execute_bound(bound)
+        elif bound[2] is not None and self._scaled_size is not None:
+            self._execute_scaled(self._handle, bound[2], bound[3],
+                                 self._scaled_size, scale_factor)
+        else:
+            self._execute_bound(bound)
+            output_array = bound[1]
             if normalization is Normalization.sqrt:
-                self._output_array /= np.sqrt(self.N)
-            elif normalization is Normalization.full:
-                self._output_array /= self.N
+                output_array /= np.sqrt(self.N)
             else:
-                raise ValueError("Incompatible normalization")
-        return self._output_array
+                output_array /= self.N
+        self._execution_time += _timer() - start
+        self._executions += 1
+        return bound[1]
 
     def execute(self):
         """
@@ -88,7 +785,10 @@ class Plan(object):
         
         For more options, please use the __call__ method of this plan.
         """
-        self._execute(self._handle, self._input_array, self._output_array)
+        start = _timer()
+        self._execute_bound(self._bound)
+        self._execution_time += _timer() - start
+        self._executions += 1
 
     def execute_dft(self, input_array=None, output_array=None):
         """
@@ -96,29 +796,251 @@ class Plan(object):
         
         For more options, please use the __call__ method of this plan.
         """
-        self._update_arrays(input_array, output_array)
-        self.execute()
+        bound = self._update_arrays(input_array, output_array)
+        start = _timer()
+        self._execute_bound(bound)
+        self._execution_time += _timer() - start
+        self._executions += 1
+
+    def _execute_bound(self, bound):
+        """
+        Private method executing the plan on arrays bound to it.
+
+        Arrays requiring no copy are transformed straight from their cached
+        data pointers.
+        """
+        if bound[2] is not None:
+            self._execute_pointers(self._handle, bound[2], bound[3])
+        else:
+            self._execute_arrays(bound[0], bound[1])
 
-    def _update_arrays(self, input_array, output_array):
+    def _execute_arrays(self, input_array, output_array):
+        """
+        Private method executing the plan on validated arrays.
+
+        Arrays lacking the SIMD alignment of an aligned plan are transformed
+        through aligned copies.
+        """
+        if self._aligned and not self._is_aligned(input_array, output_array):
+            if not self._realign:
+                raise RuntimeError('Incompatible array alignment')
+            if self._inplace:
+                aligned_input, aligned_output = _aligned_copies(
+                    input_array, output_array)
+            else:
+                aligned_input, aligned_output = (
+                    array if self._alignment_of(array) == 0 else
+                    _aligned_copies(array)[0]
+                    for array in (input_array, output_array))
+            if aligned_input is not input_array:
+                np.copyto(aligned_input, input_array)
+            self._execute_handle(aligned_input, aligned_output)
+            if aligned_output is not output_array:
+                np.copyto(output_array, aligned_output)
+        else:
+            self._execute_handle(input_array, output_array)
+
+    def _execute_handle(self, input_array, output_array):
+        """
+        Private method calling the FFTW new-array execute function.
+        """
+        self._execute(self._handle, input_array, output_array)
+
+    def _is_aligned(self, input_array, output_array):
+        """
+        Private method checking the SIMD alignment of a pair of arrays.
+        """
+        return (self._alignment_of(input_array) == 0 and
+                self._alignment_of(output_array) == 0)
+
+    def _update_arrays(self, input_array, output_array, bind=True):
         """
         Private method used for safe update of the internal arrays.
+
+        Returns the arrays bound to the plan, as stored by _bind_arrays, or
+        as returned by _bound_arrays without storing them unless bind.
         """
+        bound = self._bound
         # check input array
-        if input_array is not None:
-            if (input_array.flags.c_contiguous and
-                input_array.shape == self.input_array.shape and
-                input_array.dtype == self.input_array.dtype):
-                self._input_array = input_array                
-            else:
+        if input_array is None:
+            input_array = bound[0]
+        else:
+            input_array = _as_array(input_array)
+            if _layout(input_array) != self._input_layout:
                 raise RuntimeError('Incompatible input array')
-        # check output array        
-        if output_array is not None:
-            if (output_array.flags.c_contiguous and
-                output_array.shape == self.output_array.shape and
-                output_array.dtype == self.output_array.dtype):
-                self._output_array = output_array                
-            else:
+        # check output array
+        if output_array is None:
+            output_array = bound[1]
+        else:
+            output_array = _as_array(output_array)
+            if _layout(output_array) != self._output_layout:
                 raise RuntimeError('Incompatible output array')
+        # in-place plans must remain in-place and vice versa
+        if (_data(input_array) == _data(output_array)) != self._inplace:
+            raise RuntimeError('Incompatible in-place layout')
+        if not self._is_writable(input_array, output_array):
+            raise RuntimeError('Incompatible read-only array')
+        if not bind:
+            return self._bound_arrays(input_array, output_array)
+        return self._bind_arrays(input_array, output_array)
+
+    def _is_writable(self, input_array, output_array, measured=False):
+        """
+        Private method checking that the arrays the plan writes to, measured
+        by the planner or not, are writable.
+        """
+        if not output_array.flags.writeable:
+            return False
+        return (input_array.flags.writeable or
+                not (measured or self._destroys_input()))
+
+    def _destroys_input(self):
+        """
+        Private method checking whether executing the plan may overwrite the
+        input array.
+        """
+        return self._inplace
+
+    def _bound_arrays(self, input_array, output_array):
+        """
+        Private method returning validated arrays in a tuple, along with their
+        data pointers when the plan can execute on the arrays directly.
+        """
+        if self._is_direct(input_array, output_array):
+            return ((input_array, output_array) +
+                    self._pointers(input_array, output_array))
+        return (input_array, output_array, None, None)
+
+    def _bind_arrays(self, input_array, output_array):
+        """
+        Private method storing validated arrays as the arrays of the plan.
+
+        They are stored as returned by _bound_arrays, in a single tuple which
+        concurrent callers read atomically, and returned.
+        """
+        bound = self._bound_arrays(input_array, output_array)
+        self._input_array = input_array
+        self._output_array = output_array
+        self._bound = bound
+        return bound
+
+    def _is_direct(self, input_array, output_array):
+        """
+        Private method checking whether the arrays need no copy to execute.
+        """
+        return (not self._aligned or
+                self._is_aligned(input_array, output_array))
+
+    def _live_handle(self):
+        """
+        Private method returning the FFTW plan, unless destroyed.
+        """
+        if self._handle is None:
+            raise RuntimeError('The plan has been destroyed')
+        return self._handle
+
+    def describe(self):
+        """
+        Description of the algorithm selected by the FFTW planner.
+
+        Returns the nested list of solvers printed by FFTW, in the same
+        format as the wisdom.
+        """
+        description = self._library.sprint_plan(self._live_handle())
+        return description.decode('ascii')
+
+    def reset_statistics(self):
+        """
+        Reset the count and the duration of the executions of the plan.
+        """
+        self._executions = 0
+        self._execution_time = 0.0
+
+    @property
+    def flops(self):
+        """
+        Number of floating point operations per execution, as counted by
+        FFTW, with fused multiply-adds counted as two operations.
+        """
+        add, mul, fma = self._library.flops(self._live_handle())
+        return add + mul + 2 * fma
+
+    @property
+    def estimated_cost(self):
+        """
+        Cost of the plan estimated by FFTW from its operation count.
+
+        The unit is arbitrary, but consistent across plans.
+        """
+        return self._library.estimate_cost(self._live_handle())
+
+    @property
+    def cost(self):
+        """
+        Cost of the plan measured by FFTW while planning.
+
+        Zero for plans created with Flag.estimate or from wisdom.
+        """
+        return self._library.cost(self._live_handle())
+
+    @property
+    def planning_time(self):
+        """
+        Wall time spent by the FFTW planner creating the plan, in seconds.
+
+        Includes the failed attempts, and the background planning once done.
+        """
+        return self._planning_time
+
+    @property
+    def planning_path(self):
+        """
+        Flag setting the rigor of the planner which created the plan.
+
+        Flag.wisdom_only for plans created from the wisdom only, and
+        Flag.estimate for plans planned in the background until upgraded.
+        """
+        return self._planning_path
+
+    @property
+    def timelimit(self):
+        """
+        Bound on the planning time, in seconds, or None.
+        """
+        return self._timelimit
+
+    @property
+    def upgrade(self):
+        """
+        Future resolved once the plan is planned with its flags.
+
+        Already done unless the plan is planned in the background, in which
+        case it holds any exception raised by the planner, and may be
+        cancelled before the planning starts.
+        """
+        if self._upgrade is None:
+            self._upgrade = _future(done=True)
+        return self._upgrade
+
+    @property
+    def executions(self):
+        """
+        Number of executions of the plan.
+
+        Counts are approximate when threads call the plan concurrently.
+        """
+        return self._executions
+
+    @property
+    def execution_time(self):
+        """
+        Cumulative wall time of the executions of the plan, in seconds.
+
+        Includes the normalization of the output, and the copies of the
+        arrays realigned. The achieved operation rate of the plan is
+        flops * executions / execution_time.
+        """
+        return self._execution_time
 
     @property
     def direction(self):
@@ -134,6 +1056,27 @@ class Plan(object):
         """
         return self._flags
 
+    @property
+    def axes(self):
+        """
+        Axes over which the transform is computed.
+        """
+        return self._axes
+
+    @property
+    def threads(self):
+        """
+        Number of threads used by the transform.
+        """
+        return self._threads
+
+    @property
+    def aligned(self):
+        """
+        Whether the plan requires arrays with the SIMD alignment of FFTW.
+        """
+        return self._aligned
+
     @property
     def input_array(self):
         """
@@ -151,6 +1094,298 @@ class Plan(object):
     @property
     def N(self):
         """
-        Total number of samples. Useful for scaling purposes.
+        Total number of samples per transform. Useful for scaling purposes.
+        """
+        shape = self._transform_shape()
+        return _product(shape[axis] for axis in self._axes)
+
+
+class RealPlan(Plan):
+
+    """
+    The FFTW plan class for real-to-complex transforms.
+
+    The output array holds the non-redundant half of the spectrum of the real
+    input array, hence its last transformed dimension is n // 2 + 1 for an
+    input of size n along that axis. In-place transforms use the padded layout
+    provided by empty_real_inplace.
+    """
+
+    _dtypes = (np.dtype('double'), np.dtype('single'),
+               np.dtype('longdouble'))
+    _functions = {'_planner': 'plan_dft_r2c',
+                  '_many_planner': 'plan_many_dft_r2c',
+                  '_guru_planner': 'plan_guru_dft_r2c',
+                  '_guru64_planner': 'plan_guru64_dft_r2c',
+                  '_execute': 'execute_dft_r2c',
+                  '_pointers': 'dft_r2c_pointers',
+                  '_execute_pointers': 'execute_dft_r2c_pointers',
+                  '_execute_scaled': 'execute_dft_r2c_scaled_pointers',
+                  '_destroy': 'destroy_plan'}
+
+    def __init__(self, input_array, output_array, flags=(Flag.estimate,),
+                 threads=None, axes=None, *args, **kwargs):
+        """
+        Instantiate a real-to-complex DFT plan.
+        """
+        super(RealPlan, self).__init__(input_array, output_array,
+                                       Direction.forward, flags, threads,
+                                       axes, *args, **kwargs)
+
+    def _check_arrays(self, input_array, output_array):
+        return _check_real_arrays(input_array, output_array, self._axes)
+
+    def _is_contiguous(self, input_array, output_array):
+        # in-place arrays have the padded layout of the basic interface
+        return self._inplace or super(RealPlan, self)._is_contiguous(
+            input_array, output_array)
+
+    def _init_kwargs(self):
+        kwargs = super(RealPlan, self)._init_kwargs()
+        del kwargs['direction']
+        return kwargs
+
+    def _planner_args(self, flag_int):
+        return (flag_int,)
+
+
+class InverseRealPlan(Plan):
+
+    """
+    The FFTW plan class for complex-to-real transforms.
+
+    The input array holds the non-redundant half of the spectrum of the real
+    output array, hence its last transformed dimension is n // 2 + 1 for an
+    output of size n along that axis. In-place transforms use the padded
+    layout provided by empty_real_inplace.
+
+    Complex-to-real transforms destroy their input by default. With
+    preserve_input set, the input is left untouched: transforms over a single
+    axis are planned with Flag.preserve_input, and multi-dimensional ones,
+    which FFTW cannot plan that way, work on an internal copy.
+    """
+
+    _dtypes = (np.dtype('double'), np.dtype('single'),
+               np.dtype('longdouble'))
+    _functions = {'_planner': 'plan_dft_c2r',
+                  '_many_planner': 'plan_many_dft_c2r',
+                  '_guru_planner': 'plan_guru_dft_c2r',
+                  '_guru64_planner': 'plan_guru64_dft_c2r',
+                  '_execute': 'execute_dft_c2r',
+                  '_pointers': 'dft_c2r_pointers',
+                  '_execute_pointers': 'execute_dft_c2r_pointers',
+                  '_execute_scaled': 'execute_dft_c2r_scaled_pointers',
+                  '_destroy': 'destroy_plan'}
+
+    def __init__(self, input_array, output_array, flags=(Flag.estimate,),
+                 threads=None, axes=None, preserve_input=False,
+                 *args, **kwargs):
+        """
+        Instantiate a complex-to-real DFT plan.
+        """
+        input_array, output_array = _as_array(input_array), _as_array(
+            output_array)
+        self._preserve_input = preserve_input
+        self._scratch_array = None
+        flags = tuple(flags)
+        if preserve_input:
+            if _data(input_array) == _data(output_array):
+                raise ValueError('In-place transforms cannot preserve input')
+            if len(_check_axes(axes, output_array.ndim)) == 1:
+                flags = tuple(f for f in flags if f is not Flag.destroy_input)
+                flags += (Flag.preserve_input,)
+            else:
+                self._scratch_array = empty_aligned(input_array.shape,
+                                                    input_array.dtype)
+        super(InverseRealPlan, self).__init__(input_array, output_array,
+                                              Direction.backward, flags,
+                                              threads, axes, *args, **kwargs)
+
+    def _check_arrays(self, input_array, output_array):
+        return _check_real_arrays(output_array, input_array, self._axes)
+
+    def _is_contiguous(self, input_array, output_array):
+        return self._inplace or super(InverseRealPlan, self)._is_contiguous(
+            input_array, output_array)
+
+    def _init_kwargs(self):
+        kwargs = super(InverseRealPlan, self)._init_kwargs()
+        del kwargs['direction']
+        kwargs['preserve_input'] = self._preserve_input
+        if self._preserve_input:
+            # added back by the constructor
+            kwargs['flags'] = tuple(flag for flag in self._flags
+                                    if flag is not Flag.preserve_input)
+        return kwargs
+
+    def _transform_shape(self):
+        return self._output_array.shape
+
+    def _destroys_input(self):
+        return (super(InverseRealPlan, self)._destroys_input() or
+                not self._preserve_input)
+
+    def _planning_arrays(self):
+        if self._scratch_array is not None:
+            return self._scratch_array, self._output_array
+        return self._input_array, self._output_array
+
+    def _planner_args(self, flag_int):
+        return (flag_int,)
+
+    def _is_direct(self, input_array, output_array):
+        return (self._scratch_array is None and
+                super(InverseRealPlan, self)._is_direct(input_array,
+                                                        output_array))
+
+    def _is_aligned(self, input_array, output_array):
+        if self._scratch_array is not None:
+            input_array = self._scratch_array
+        return super(InverseRealPlan, self)._is_aligned(input_array,
+                                                        output_array)
+
+    def _execute_handle(self, input_array, output_array):
+        if self._scratch_array is not None:
+            # copied per call, so that threads may share the plan
+            scratch_array = empty_aligned(input_array.shape,
+                                          input_array.dtype)
+            np.copyto(scratch_array, input_array)
+            input_array = scratch_array
+        self._execute(self._handle, input_array, output_array)
+
+    @property
+    def preserve_input(self):
+        """
+        Whether the input array is preserved by the transform.
+        """
+        return self._preserve_input
+
+
+class R2RPlan(Plan):
+
+    """
+    The FFTW plan class for real-to-real transforms.
+
+    The kind of transform, such as the DCT-II R2RKind.redft10, is given for
+    each transformed axis. Normalization.full divides by the size of the
+    equivalent DFT, 2 * n for most kinds of n samples, so that inverse kinds
+    normalized this way undo each other.
+
+    With orthogonalize set, the boundary samples of the transform are
+    weighted so that, together with Normalization.sqrt, the transform is
+    orthonormal and matches scipy.fft.dct and scipy.fft.dst with
+    norm='ortho'. The weights of REDFT00, REDFT01 and RODFT01 transforms apply
+    to their input, which is then modified by the transform.
+    """
+
+    _dtypes = (np.dtype('double'), np.dtype('single'),
+               np.dtype('longdouble'))
+    _functions = {'_planner': 'plan_r2r',
+                  '_many_planner': 'plan_many_r2r',
+                  '_guru_planner': 'plan_guru_r2r',
+                  '_guru64_planner': 'plan_guru64_r2r',
+                  '_execute': 'execute_r2r',
+                  '_pointers': 'r2r_pointers',
+                  '_execute_pointers': 'execute_r2r_pointers',
+                  '_execute_scaled': 'execute_r2r_scaled_pointers',
+                  '_destroy': 'destroy_plan'}
+
+    # weighted samples of the orthogonalized transforms, by kind
+    _input_boundaries = {R2RKind.redft00: (0, -1),
+                         R2RKind.redft01: (0,),
+                         R2RKind.rodft01: (-1,)}
+    _output_boundaries = {R2RKind.redft00: (0, -1),
+                          R2RKind.redft10: (0,),
+                          R2RKind.rodft10: (-1,)}
+
+    def __init__(self, input_array, output_array, kinds,
+                 flags=(Flag.estimate,), threads=None, axes=None,
+                 orthogonalize=False, *args, **kwargs):
+        """
+        Instantiate a real-to-real transform plan.
+
+        kinds holds the kind of transform of each axis, or a single kind
+        used for all of them.
+        """
+        input_array, output_array = _as_array(input_array), _as_array(
+            output_array)
+        axes = _check_axes(axes, input_array.ndim)
+        kinds = tuple(R2RKind(kind) for kind in np.atleast_1d(kinds))
+        if len(kinds) == 1:
+            kinds *= len(axes)
+        elif len(kinds) != len(axes):
+            raise ValueError('Kinds and axes have different lengths')
+        for kind, axis in zip(kinds, axes):
+            _logical_size(kind, input_array.shape[axis])
+        self._kinds = kinds
+        self._orthogonalize = bool(orthogonalize)
+        sqrt2 = np.sqrt(input_array.dtype.type(2))
+        self._input_weights = self._weights(axes, self._input_boundaries,
+                                            sqrt2)
+        self._output_weights = self._weights(axes, self._output_boundaries,
+                                             1 / sqrt2)
+        super(R2RPlan, self).__init__(input_array, output_array, None, flags,
+                                      threads, axes, *args, **kwargs)
+        if self._input_weights or self._output_weights:
+            # the weights are applied around the execution, not fused to it
+            self._scaled_size = None
+
+    def _weights(self, axes, boundaries, weight):
+        """
+        Private method returning the weighted samples of an orthogonalized
+        transform, as a list of index and weight pairs.
+        """
+        if not self._orthogonalize:
+            return []
+        weights = []
+        for kind, axis in zip(self._kinds, axes):
+            for i in boundaries.get(kind, ()):
+                index = (slice(None),) * axis + (i,)
+                weights.append((index, weight))
+        return weights
+
+    def _planner_args(self, flag_int):
+        return [int(kind) for kind in self._kinds], flag_int
+
+    def _destroys_input(self):
+        # halfcomplex-to-real transforms destroy their input by default, as
+        # complex-to-real ones do, and weights are applied to the input
+        return (super(R2RPlan, self)._destroys_input() or
+                bool(self._input_weights) or R2RKind.hc2r in self._kinds)
+
+    def _init_kwargs(self):
+        kwargs = super(R2RPlan, self)._init_kwargs()
+        del kwargs['direction']
+        kwargs['kinds'] = self._kinds
+        kwargs['orthogonalize'] = self._orthogonalize
+        return kwargs
+
+    def _execute_bound(self, bound):
+        for index, weight in self._input_weights:
+            bound[0][index] *= weight
+        super(R2RPlan, self)._execute_bound(bound)
+        for index, weight in self._output_weights:
+            bound[1][index] *= weight
+
+    @property
+    def kinds(self):
+        """
+        Kind of transform of each axis.
+        """
+        return self._kinds
+
+    @property
+    def orthogonalize(self):
+        """
+        Whether the boundary samples are weighted for orthonormality.
+        """
+        return self._orthogonalize
+
+    @property
+    def N(self):
+        """
+        Size of the equivalent DFT. Useful for scaling purposes.
         """
-        return self._output_array.size
\ No newline at end of file
+        shape = self._transform_shape()
+        return _product(_logical_size(kind, shape[axis])
+                        for kind, axis in zip(self._kinds, self._axes))
@@ -0,0 +1,18 @@
+# coding: utf8
+
+# Copyright (c) 2014, 2015 Ghislain Antony Vaillant.
+#
+# This file is distributed under the new BSD License, see the LICENSE file or
+# checkout the license terms at http://opensource.org/licenses/BSD-3-Clause).
+
+"""
+Drop-in replacements for the FFT modules of other packages.
+
+The interfaces manage their plans internally, through the process-wide plan
+cache of skfftw.cache:
+
+- numpy_fft mirrors numpy.fft,
+- scipy_fft is a backend for scipy.fft.
+"""
+
+from __future__ import absolute_import, division, print_function
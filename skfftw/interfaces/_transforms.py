@@ -0,0 +1,280 @@
+# coding: utf8
+
+# Copyright (c) 2014, 2015 Ghislain Antony Vaillant.
+#
+# This file is distributed under the new BSD License, see the LICENSE file or
+# checkout the license terms at http://opensource.org/licenses/BSD-3-Clause).
+
+"""
+Transforms shared by the interface modules.
+
+The input is copied into an aligned scratch array of the matching precision,
+cropped or zero-padded to the requested shape, and transformed with a plan
+from the process-wide cache. Repeated calls on arrays of the same
+geometry therefore reuse the same plan, and never modify their input.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+from skfftw import cache
+from skfftw.aligned import empty_aligned, zeros_aligned
+from skfftw.enums import Direction, Normalization
+from skfftw.fftw import (InverseRealPlan, Plan, R2RPlan, RealPlan,
+                         _as_array, _check_axes, _data, _half_shape,
+                         _is_strided)
+import numpy as np
+
+
+# normalization of each transform direction, by value of the norm argument
+_forward_normalizations = {None: Normalization.none,
+                           'backward': Normalization.none,
+                           'ortho': Normalization.sqrt,
+                           'forward': Normalization.full}
+_backward_normalizations = {None: Normalization.full,
+                            'backward': Normalization.full,
+                            'ortho': Normalization.sqrt,
+                            'forward': Normalization.none}
+_swapped_norms = {None: 'forward', 'backward': 'forward', 'ortho': 'ortho',
+                  'forward': 'backward'}
+
+
+def _invalid_norm(norm):
+    return ValueError("Invalid norm value {!r}; should be 'backward', "
+                      "'ortho' or 'forward'".format(norm))
+
+
+def normalization(norm, direction):
+    """
+    Normalization of a transform, given the norm argument of numpy.fft.
+    """
+    normalizations = (_forward_normalizations
+                      if direction is Direction.forward
+                      else _backward_normalizations)
+    try:
+        return normalizations[norm]
+    except (KeyError, TypeError):
+        raise _invalid_norm(norm)
+
+
+def swap_direction(norm):
+    """
+    Norm argument applying the normalization of the opposite direction.
+    """
+    try:
+        return _swapped_norms[norm]
+    except (KeyError, TypeError):
+        raise _invalid_norm(norm)
+
+
+def complex_dtype(dtype):
+    """
+    Complex data type of the precision used to transform the given type.
+    """
+    dt = np.dtype(dtype)
+    if dt.kind in 'fc':
+        return np.promote_types(dt, np.csingle)
+    return np.dtype(np.cdouble)
+
+
+def real_dtype(dtype):
+    """
+    Real data type of the precision used to transform the given type.
+    """
+    dt = np.dtype(dtype)
+    if dt.kind == 'f':
+        return np.promote_types(dt, np.float32)
+    if dt.kind == 'c':
+        return np.empty(0, dtype=dt).real.dtype
+    return np.dtype(np.double)
+
+
+def as_array(a):
+    """
+    Array viewing the memory of a, if it exports an array interface, DLPack
+    or the buffer protocol, and built by numpy.asarray otherwise.
+    """
+    try:
+        return _as_array(a)
+    except TypeError:
+        return np.asarray(a)
+
+
+def shape_and_axes(a, s, axes, inverse_real=False):
+    """
+    Normalize the shape and axes of a transform, following numpy.fft.
+
+    When only s is given, the trailing len(s) axes are transformed. Sizes of
+    -1 or missing sizes are taken from the array, except for the last axis of
+    complex-to-real transforms, which defaults to 2 * (m - 1) for m input
+    samples.
+    """
+    if axes is None:
+        if s is None:
+            axes = range(a.ndim)
+        else:
+            axes = range(a.ndim - len(s), a.ndim)
+    axes = _check_axes(axes, a.ndim)
+    if s is None:
+        s = [a.shape[axis] for axis in axes]
+        if inverse_real:
+            s[-1] = 2 * (s[-1] - 1)
+    else:
+        s = list(s)
+        if len(s) != len(axes):
+            raise ValueError('Shape and axes have different lengths')
+        s = [a.shape[axis] if n == -1 else int(n) for n, axis in
+             zip(s, axes)]
+    for n in s:
+        if n < 1:
+            raise ValueError("Invalid number of FFT data points ({}) "
+                             "specified".format(n))
+    return tuple(s), axes
+
+
+def resized_shape(shape, s, axes):
+    shape = list(shape)
+    for n, axis in zip(s, axes):
+        shape[axis] = n
+    return tuple(shape)
+
+
+def resize(a, shape, dtype):
+    """
+    Copy an array into a new aligned array of the given shape and type.
+
+    The array is cropped or zero-padded at the end of the axes whose size
+    differs.
+    """
+    index = tuple(slice(0, min(m, n)) for m, n in zip(a.shape, shape))
+    if all(m >= n for m, n in zip(a.shape, shape)):
+        array = empty_aligned(shape, dtype=dtype)
+    else:
+        array = zeros_aligned(shape, dtype=dtype)
+    np.copyto(array[index], a[index], casting='same_kind')
+    return array
+
+
+def output(out, shape, dtype):
+    """
+    Array receiving the transform, which is out if FFTW can write to it
+    through its strides.
+    """
+    if out is not None:
+        out = _as_array(out)
+        if not out.flags.writeable:
+            raise ValueError('Output array is read-only')
+        if out.shape != shape:
+            raise ValueError("Invalid output shape: expected {}, got "
+                             "{}".format(shape, out.shape))
+        if out.dtype == dtype and _is_strided(out):
+            return out
+    return empty_aligned(shape, dtype=dtype)
+
+
+def result(out, output_array):
+    if out is None:
+        return output_array
+    out = _as_array(out)
+    if _data(out) != _data(output_array):
+        np.copyto(out, output_array, casting='same_kind')
+    return out
+
+
+def c2c(a, s, axes, direction, norm=None, out=None, threads=None):
+    """
+    Complex-to-complex transform of an array-like over the given axes.
+
+    The arguments follow numpy.fft, with s and axes as in numpy.fft.fftn.
+    """
+    scaling = normalization(norm, direction)
+    a = as_array(a)
+    s, axes = shape_and_axes(a, s, axes)
+    dtype = complex_dtype(a.dtype)
+    shape = resized_shape(a.shape, s, axes)
+    input_array = resize(a, shape, dtype)
+    output_array = output(out, shape, dtype)
+    if input_array.size:
+        plan = cache.get_plan(Plan, input_array, output_array,
+                              direction=direction, threads=threads,
+                              axes=axes)
+        plan.transform(input_array, output_array, scaling)
+    return result(out, output_array)
+
+
+def r2c(a, s, axes, norm=None, out=None, threads=None):
+    """
+    Real-to-complex transform of an array-like over the given axes.
+
+    The last axis is halved in the output.
+    """
+    scaling = normalization(norm, Direction.forward)
+    a = as_array(a)
+    if a.dtype.kind == 'c':
+        raise TypeError("Real transforms require real input, got "
+                        "{}".format(a.dtype))
+    s, axes = shape_and_axes(a, s, axes)
+    dtype = real_dtype(a.dtype)
+    shape = resized_shape(a.shape, s, axes)
+    input_array = resize(a, shape, dtype)
+    output_array = output(out, _half_shape(shape, axes[-1]),
+                          complex_dtype(dtype))
+    if input_array.size:
+        plan = cache.get_plan(RealPlan, input_array, output_array,
+                              threads=threads, axes=axes)
+        plan.transform(input_array, output_array, scaling)
+    return result(out, output_array)
+
+
+def c2r(a, s, axes, norm=None, out=None, threads=None):
+    """
+    Complex-to-real transform of an array-like over the given axes.
+
+    The input holds the half-spectrum along the last axis, whose output size
+    defaults to 2 * (m - 1) for m input samples.
+    """
+    scaling = normalization(norm, Direction.backward)
+    a = as_array(a)
+    s, axes = shape_and_axes(a, s, axes, inverse_real=True)
+    dtype = complex_dtype(a.dtype)
+    shape = resized_shape(a.shape, s, axes)
+    # the input is a scratch copy, which the transform is free to destroy
+    input_array = resize(a, _half_shape(shape, axes[-1]), dtype)
+    output_array = output(out, shape, real_dtype(dtype))
+    if output_array.size:
+        plan = cache.get_plan(InverseRealPlan, input_array, output_array,
+                              threads=threads, axes=axes)
+        plan.transform(input_array, output_array, scaling)
+    return result(out, output_array)
+
+
+def r2r(a, s, axes, kinds, direction, norm=None, orthogonalize=None,
+        threads=None):
+    """
+    Real-to-real transform of an array-like over the given axes.
+
+    The arguments follow scipy.fft.dctn, with the kind of transform of each
+    axis given by kinds, and the normalization selected by norm for the given
+    direction. orthogonalize defaults to whether norm is 'ortho'. The real and
+    imaginary parts of complex input are transformed separately.
+    """
+    scaling = normalization(norm, direction)
+    if orthogonalize is None:
+        orthogonalize = norm == 'ortho'
+    a = as_array(a)
+    if a.dtype.kind == 'c':
+        output_array = r2r(a.real, s, axes, kinds, direction, norm,
+                           orthogonalize, threads)
+        return output_array + 1j * r2r(a.imag, s, axes, kinds, direction,
+                                       norm, orthogonalize, threads)
+    s, axes = shape_and_axes(a, s, axes)
+    if len(kinds) == 1:
+        kinds = kinds * len(axes)
+    shape = resized_shape(a.shape, s, axes)
+    # the transform is computed in-place, on a scratch copy of the input
+    array = resize(a, shape, real_dtype(a.dtype))
+    if array.size:
+        plan = cache.get_plan(R2RPlan, array, array, kinds=tuple(kinds),
+                              threads=threads, axes=axes,
+                              orthogonalize=bool(orthogonalize))
+        plan.transform(array, array, scaling)
+    return array
@@ -0,0 +1,160 @@
+# coding: utf8
+
+# Copyright (c) 2014, 2015 Ghislain Antony Vaillant.
+#
+# This file is distributed under the new BSD License, see the LICENSE file or
+# checkout the license terms at http://opensource.org/licenses/BSD-3-Clause).
+
+"""
+Drop-in replacement for numpy.fft.
+
+The functions of this module share the signatures and the results of their
+numpy.fft counterparts, and compute them with FFTW plans kept in the
+process-wide plan cache. The precision of the input is preserved, so single
+and extended precision arrays are transformed in their own precision. The
+number of threads is given by skfftw.fftw.get_default_threads.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+from skfftw.enums import Direction
+from skfftw.interfaces import _transforms
+from numpy.fft import fftfreq, fftshift, ifftshift, rfftfreq
+import numpy as np
+
+__all__ = ('fft', 'ifft', 'fft2', 'ifft2', 'fftn', 'ifftn', 'rfft', 'irfft',
+           'rfft2', 'irfft2', 'rfftn', 'irfftn', 'hfft', 'ihfft', 'fftfreq',
+           'rfftfreq', 'fftshift', 'ifftshift')
+
+
+def _size(n):
+    return None if n is None else (n,)
+
+
+def fft(a, n=None, axis=-1, norm=None, out=None):
+    """
+    One-dimensional discrete Fourier transform.
+
+    See numpy.fft.fft.
+    """
+    return _transforms.c2c(a, _size(n), (axis,), Direction.forward, norm, out)
+
+
+def ifft(a, n=None, axis=-1, norm=None, out=None):
+    """
+    One-dimensional inverse discrete Fourier transform.
+
+    See numpy.fft.ifft.
+    """
+    return _transforms.c2c(a, _size(n), (axis,), Direction.backward, norm,
+                           out)
+
+
+def fft2(a, s=None, axes=(-2, -1), norm=None, out=None):
+    """
+    Two-dimensional discrete Fourier transform.
+
+    See numpy.fft.fft2.
+    """
+    return fftn(a, s, axes, norm, out)
+
+
+def ifft2(a, s=None, axes=(-2, -1), norm=None, out=None):
+    """
+    Two-dimensional inverse discrete Fourier transform.
+
+    See numpy.fft.ifft2.
+    """
+    return ifftn(a, s, axes, norm, out)
+
+
+def fftn(a, s=None, axes=None, norm=None, out=None):
+    """
+    N-dimensional discrete Fourier transform.
+
+    See numpy.fft.fftn.
+    """
+    return _transforms.c2c(a, s, axes, Direction.forward, norm, out)
+
+
+def ifftn(a, s=None, axes=None, norm=None, out=None):
+    """
+    N-dimensional inverse discrete Fourier transform.
+
+    See numpy.fft.ifftn.
+    """
+    return _transforms.c2c(a, s, axes, Direction.backward, norm, out)
+
+
+def rfft(a, n=None, axis=-1, norm=None, out=None):
+    """
+    One-dimensional discrete Fourier transform of real input.
+
+    See numpy.fft.rfft.
+    """
+    return _transforms.r2c(a, _size(n), (axis,), norm, out)
+
+
+def irfft(a, n=None, axis=-1, norm=None, out=None):
+    """
+    Inverse of rfft.
+
+    See numpy.fft.irfft.
+    """
+    return _transforms.c2r(a, _size(n), (axis,), norm, out)
+
+
+def rfft2(a, s=None, axes=(-2, -1), norm=None, out=None):
+    """
+    Two-dimensional discrete Fourier transform of real input.
+
+    See numpy.fft.rfft2.
+    """
+    return rfftn(a, s, axes, norm, out)
+
+
+def irfft2(a, s=None, axes=(-2, -1), norm=None, out=None):
+    """
+    Inverse of rfft2.
+
+    See numpy.fft.irfft2.
+    """
+    return irfftn(a, s, axes, norm, out)
+
+
+def rfftn(a, s=None, axes=None, norm=None, out=None):
+    """
+    N-dimensional discrete Fourier transform of real input.
+
+    See numpy.fft.rfftn.
+    """
+    return _transforms.r2c(a, s, axes, norm, out)
+
+
+def irfftn(a, s=None, axes=None, norm=None, out=None):
+    """
+    Inverse of rfftn.
+
+    See numpy.fft.irfftn.
+    """
+    return _transforms.c2r(a, s, axes, norm, out)
+
+
+def hfft(a, n=None, axis=-1, norm=None, out=None):
+    """
+    Discrete Fourier transform of a signal with Hermitian symmetry.
+
+    See numpy.fft.hfft.
+    """
+    return irfft(np.conjugate(a), n, axis, _transforms.swap_direction(norm),
+                 out)
+
+
+def ihfft(a, n=None, axis=-1, norm=None, out=None):
+    """
+    Inverse of hfft.
+
+    See numpy.fft.ihfft.
+    """
+    output = rfft(a, n, axis, _transforms.swap_direction(norm), out)
+    return np.conjugate(output, out=output)
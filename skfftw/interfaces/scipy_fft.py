@@ -0,0 +1,381 @@
+# coding: utf8
+
+# Copyright (c) 2014, 2015 Ghislain Antony Vaillant.
+#
+# This file is distributed under the new BSD License, see the LICENSE file or
+# checkout the license terms at http://opensource.org/licenses/BSD-3-Clause).
+
+"""
+Backend for scipy.fft.
+
+This module implements the uarray backend protocol of scipy.fft, and may be
+installed with::
+
+    import scipy.fft
+    from skfftw.interfaces import scipy_fft
+
+    scipy.fft.set_global_backend(scipy_fft)
+
+or enabled for a block of code with ``scipy.fft.set_backend(scipy_fft)``.
+Functions of scipy built upon scipy.fft, such as scipy.signal.fftconvolve,
+are then computed with FFTW plans from the process-wide plan cache as well.
+
+The workers argument sets the number of threads of the plans, and defaults
+to skfftw.fftw.get_default_threads. Calls which this module does not
+implement, such as those passing a precomputed plan, are left to the next
+backend, usually scipy's own. The functions may also be called directly.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+from skfftw.enums import Direction, R2RKind
+from skfftw.interfaces import _transforms
+import numpy as np
+import operator
+import os
+
+__all__ = ('fft', 'ifft', 'fft2', 'ifft2', 'fftn', 'ifftn', 'rfft', 'irfft',
+           'rfft2', 'irfft2', 'rfftn', 'irfftn', 'hfft', 'ihfft', 'hfft2',
+           'ihfft2', 'hfftn', 'ihfftn', 'dct', 'idct', 'dst', 'idst', 'dctn',
+           'idctn', 'dstn', 'idstn')
+
+__ua_domain__ = 'numpy.scipy.fft'
+
+
+def __ua_function__(method, args, kwargs):
+    """
+    Dispatch a scipy.fft function to its implementation in this module.
+    """
+    implementation = _implemented.get(getattr(method, '__name__', None))
+    if implementation is None or kwargs.get('plan') is not None:
+        return NotImplemented
+    return implementation(*args, **kwargs)
+
+
+def _threads(workers):
+    """
+    Number of threads for the workers argument of scipy.fft.
+
+    Negative values count backwards from the number of CPUs, so that -1 uses
+    all of them.
+    """
+    if workers is None:
+        return None
+    workers = operator.index(workers)
+    if workers < 0:
+        workers += (os.cpu_count() or 1) + 1
+        if workers < 1:
+            raise ValueError('Negative workers out of range')
+    elif workers == 0:
+        raise ValueError('Workers must not be zero')
+    return workers
+
+
+def _size(n):
+    return None if n is None else (n,)
+
+
+# kind of each type of DCT and DST, and type of their inverse
+_dct_kinds = {1: R2RKind.redft00, 2: R2RKind.redft10, 3: R2RKind.redft01,
+              4: R2RKind.redft11}
+_dst_kinds = {1: R2RKind.rodft00, 2: R2RKind.rodft10, 3: R2RKind.rodft01,
+              4: R2RKind.rodft11}
+_inverse_types = {1: 1, 2: 3, 3: 2, 4: 4}
+
+
+def _r2r(x, s, axes, kinds, type, direction, norm, workers, orthogonalize):
+    """
+    DCT or DST of the given type, whose kind is looked up in kinds.
+    """
+    try:
+        kind = kinds[type]
+    except (KeyError, TypeError):
+        raise ValueError("Invalid transform type: {!r}".format(type))
+    return _transforms.r2r(x, s, axes, (kind,), direction, norm,
+                           orthogonalize, threads=_threads(workers))
+
+
+def fft(x, n=None, axis=-1, norm=None, overwrite_x=False, workers=None,
+        plan=None):
+    """
+    One-dimensional discrete Fourier transform.
+
+    See scipy.fft.fft.
+    """
+    return _transforms.c2c(x, _size(n), (axis,), Direction.forward, norm,
+                           threads=_threads(workers))
+
+
+def ifft(x, n=None, axis=-1, norm=None, overwrite_x=False, workers=None,
+         plan=None):
+    """
+    One-dimensional inverse discrete Fourier transform.
+
+    See scipy.fft.ifft.
+    """
+    return _transforms.c2c(x, _size(n), (axis,), Direction.backward, norm,
+                           threads=_threads(workers))
+
+
+def fft2(x, s=None, axes=(-2, -1), norm=None, overwrite_x=False,
+         workers=None, plan=None):
+    """
+    Two-dimensional discrete Fourier transform.
+
+    See scipy.fft.fft2.
+    """
+    return fftn(x, s, axes, norm, overwrite_x, workers)
+
+
+def ifft2(x, s=None, axes=(-2, -1), norm=None, overwrite_x=False,
+          workers=None, plan=None):
+    """
+    Two-dimensional inverse discrete Fourier transform.
+
+    See scipy.fft.ifft2.
+    """
+    return ifftn(x, s, axes, norm, overwrite_x, workers)
+
+
+def fftn(x, s=None, axes=None, norm=None, overwrite_x=False, workers=None,
+         plan=None):
+    """
+    N-dimensional discrete Fourier transform.
+
+    See scipy.fft.fftn.
+    """
+    return _transforms.c2c(x, s, axes, Direction.forward, norm,
+                           threads=_threads(workers))
+
+
+def ifftn(x, s=None, axes=None, norm=None, overwrite_x=False, workers=None,
+          plan=None):
+    """
+    N-dimensional inverse discrete Fourier transform.
+
+    See scipy.fft.ifftn.
+    """
+    return _transforms.c2c(x, s, axes, Direction.backward, norm,
+                           threads=_threads(workers))
+
+
+def rfft(x, n=None, axis=-1, norm=None, overwrite_x=False, workers=None,
+         plan=None):
+    """
+    One-dimensional discrete Fourier transform of real input.
+
+    See scipy.fft.rfft.
+    """
+    return _transforms.r2c(x, _size(n), (axis,), norm,
+                           threads=_threads(workers))
+
+
+def irfft(x, n=None, axis=-1, norm=None, overwrite_x=False, workers=None,
+          plan=None):
+    """
+    Inverse of rfft.
+
+    See scipy.fft.irfft.
+    """
+    return _transforms.c2r(x, _size(n), (axis,), norm,
+                           threads=_threads(workers))
+
+
+def rfft2(x, s=None, axes=(-2, -1), norm=None, overwrite_x=False,
+          workers=None, plan=None):
+    """
+    Two-dimensional discrete Fourier transform of real input.
+
+    See scipy.fft.rfft2.
+    """
+    return rfftn(x, s, axes, norm, overwrite_x, workers)
+
+
+def irfft2(x, s=None, axes=(-2, -1), norm=None, overwrite_x=False,
+           workers=None, plan=None):
+    """
+    Inverse of rfft2.
+
+    See scipy.fft.irfft2.
+    """
+    return irfftn(x, s, axes, norm, overwrite_x, workers)
+
+
+def rfftn(x, s=None, axes=None, norm=None, overwrite_x=False, workers=None,
+          plan=None):
+    """
+    N-dimensional discrete Fourier transform of real input.
+
+    See scipy.fft.rfftn.
+    """
+    return _transforms.r2c(x, s, axes, norm, threads=_threads(workers))
+
+
+def irfftn(x, s=None, axes=None, norm=None, overwrite_x=False, workers=None,
+           plan=None):
+    """
+    Inverse of rfftn.
+
+    See scipy.fft.irfftn.
+    """
+    return _transforms.c2r(x, s, axes, norm, threads=_threads(workers))
+
+
+def hfft(x, n=None, axis=-1, norm=None, overwrite_x=False, workers=None,
+         plan=None):
+    """
+    Discrete Fourier transform of a signal with Hermitian symmetry.
+
+    See scipy.fft.hfft.
+    """
+    return hfftn(x, _size(n), (axis,), norm, overwrite_x, workers)
+
+
+def ihfft(x, n=None, axis=-1, norm=None, overwrite_x=False, workers=None,
+          plan=None):
+    """
+    Inverse of hfft.
+
+    See scipy.fft.ihfft.
+    """
+    return ihfftn(x, _size(n), (axis,), norm, overwrite_x, workers)
+
+
+def hfft2(x, s=None, axes=(-2, -1), norm=None, overwrite_x=False,
+          workers=None, plan=None):
+    """
+    Two-dimensional discrete Fourier transform of a Hermitian signal.
+
+    See scipy.fft.hfft2.
+    """
+    return hfftn(x, s, axes, norm, overwrite_x, workers)
+
+
+def ihfft2(x, s=None, axes=(-2, -1), norm=None, overwrite_x=False,
+           workers=None, plan=None):
+    """
+    Inverse of hfft2.
+
+    See scipy.fft.ihfft2.
+    """
+    return ihfftn(x, s, axes, norm, overwrite_x, workers)
+
+
+def hfftn(x, s=None, axes=None, norm=None, overwrite_x=False, workers=None,
+          plan=None):
+    """
+    N-dimensional discrete Fourier transform of a Hermitian signal.
+
+    See scipy.fft.hfftn.
+    """
+    return _transforms.c2r(np.conjugate(x), s, axes,
+                           _transforms.swap_direction(norm),
+                           threads=_threads(workers))
+
+
+def ihfftn(x, s=None, axes=None, norm=None, overwrite_x=False, workers=None,
+           plan=None):
+    """
+    Inverse of hfftn.
+
+    See scipy.fft.ihfftn.
+    """
+    output = _transforms.r2c(x, s, axes, _transforms.swap_direction(norm),
+                             threads=_threads(workers))
+    return np.conjugate(output, out=output)
+
+
+def dct(x, type=2, n=None, axis=-1, norm=None, overwrite_x=False,
+        workers=None, orthogonalize=None):
+    """
+    Discrete cosine transform.
+
+    See scipy.fft.dct.
+    """
+    return _r2r(x, _size(n), (axis,), _dct_kinds, type, Direction.forward,
+                norm, workers, orthogonalize)
+
+
+def idct(x, type=2, n=None, axis=-1, norm=None, overwrite_x=False,
+         workers=None, orthogonalize=None):
+    """
+    Inverse discrete cosine transform.
+
+    See scipy.fft.idct.
+    """
+    return _r2r(x, _size(n), (axis,), _dct_kinds, _inverse_types.get(type),
+                Direction.backward, norm, workers, orthogonalize)
+
+
+def dst(x, type=2, n=None, axis=-1, norm=None, overwrite_x=False,
+        workers=None, orthogonalize=None):
+    """
+    Discrete sine transform.
+
+    See scipy.fft.dst.
+    """
+    return _r2r(x, _size(n), (axis,), _dst_kinds, type, Direction.forward,
+                norm, workers, orthogonalize)
+
+
+def idst(x, type=2, n=None, axis=-1, norm=None, overwrite_x=False,
+         workers=None, orthogonalize=None):
+    """
+    Inverse discrete sine transform.
+
+    See scipy.fft.idst.
+    """
+    return _r2r(x, _size(n), (axis,), _dst_kinds, _inverse_types.get(type),
+                Direction.backward, norm, workers, orthogonalize)
+
+
+def dctn(x, type=2, s=None, axes=None, norm=None, overwrite_x=False,
+         workers=None, orthogonalize=None):
+    """
+    N-dimensional discrete cosine transform.
+
+    See scipy.fft.dctn.
+    """
+    return _r2r(x, s, axes, _dct_kinds, type, Direction.forward, norm,
+                workers, orthogonalize)
+
+
+def idctn(x, type=2, s=None, axes=None, norm=None, overwrite_x=False,
+          workers=None, orthogonalize=None):
+    """
+    N-dimensional inverse discrete cosine transform.
+
+    See scipy.fft.idctn.
+    """
+    return _r2r(x, s, axes, _dct_kinds, _inverse_types.get(type),
+                Direction.backward, norm, workers, orthogonalize)
+
+
+def dstn(x, type=2, s=None, axes=None, norm=None, overwrite_x=False,
+         workers=None, orthogonalize=None):
+    """
+    N-dimensional discrete sine transform.
+
+    See scipy.fft.dstn.
+    """
+    return _r2r(x, s, axes, _dst_kinds, type, Direction.forward, norm,
+                workers, orthogonalize)
+
+
+def idstn(x, type=2, s=None, axes=None, norm=None, overwrite_x=False,
+          workers=None, orthogonalize=None):
+    """
+    N-dimensional inverse discrete sine transform.
+
+    See scipy.fft.idstn.
+    """
+    return _r2r(x, s, axes, _dst_kinds, _inverse_types.get(type),
+                Direction.backward, norm, workers, orthogonalize)
+
+
+# implementation of each scipy.fft function, by name
+_implemented = dict((function.__name__, function) for function in
+                    (fft, ifft, fft2, ifft2, fftn, ifftn, rfft, irfft, rfft2,
+                     irfft2, rfftn, irfftn, hfft, ihfft, hfft2, ihfft2,
+                     hfftn, ihfftn, dct, idct, dst, idst, dctn, idctn, dstn,
+                     idstn))
@@ -0,0 +1,176 @@
+# coding: utf8
+
+# Copyright (c) 2014, 2015 Ghislain Antony Vaillant.
+#
+# This file is distributed under the new BSD License, see the LICENSE file or
+# checkout the license terms at http://opensource.org/licenses/BSD-3-Clause).
+
+"""
+Out-of-core transforms of arrays larger than memory.
+
+fftn transforms arrays mapped from local files with numpy.memmap, one axis
+at a time. Each pass reads the arrays by slabs, which span the whole extent
+of the axis transformed and fit the memory budget, transforms the slabs with
+a batched plan and writes them back. The next slab is read by a background
+thread while the current one is transformed, and slabs are cut across the
+outermost possible axis, so that reads and writes are large sequential
+accesses to the files.
+
+Each slab is transformed by a single execution of a plan batching the
+one-dimensional transforms along the axis, and every slab of a pass, the
+last one included, is transformed by the same plan. The result is therefore
+bit for bit the one of transforming each slab in memory with that plan. The
+memory budget sets the thickness of the slabs, hence the number of
+transforms batched by the plan, and FFTW may pick different algorithms for
+different batch sizes: results for different budgets, and those of the
+in-memory transforms of skfftw.fftw and skfftw.interfaces, agree to rounding
+only.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+from skfftw.aligned import zeros_aligned
+from skfftw.enums import Direction, Flag, Normalization
+from skfftw.fftw import Plan, _check_axes
+import numpy as np
+import sys
+import threading
+
+__all__ = ('fftn',)
+
+
+# memory used by the slabs of a transform, in bytes, by default
+_default_memory_budget = 1 << 28
+
+
+class _Prefetch(object):
+
+    """
+    Copy of a slab into a buffer, made on a background thread.
+    """
+
+    def __init__(self, source, buffer):
+        self._exc_info = None
+        self._thread = threading.Thread(target=self._copy,
+                                        args=(source, buffer))
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _copy(self, source, buffer):
+        try:
+            np.copyto(buffer, source)
+        except BaseException:
+            self._exc_info = sys.exc_info()
+
+    def wait(self):
+        """
+        Wait for the copy, and raise the exception it raised, if any.
+        """
+        self._thread.join()
+        if self._exc_info is not None:
+            raise self._exc_info[1]
+
+
+def _transform_axis(src, dst, axis, memory_budget, direction, scale, threads,
+                    flags):
+    """
+    Transform src along an axis into dst, by slabs fitting the memory budget.
+
+    The slabs are cut across the first other axis, and each is transformed in
+    place by a single execution of a batched plan. The last slab, when
+    thinner than the others, is transformed in a full buffer by the same
+    plan, the sheets past its end being discarded.
+    """
+    slab_axis = 1 if axis == 0 else 0
+    src = np.moveaxis(src, slab_axis, 0)
+    dst = np.moveaxis(dst, slab_axis, 0)
+    axis = axis + 1 if axis < slab_axis else axis
+    sheet_shape = dst.shape[1:]
+    sheet_bytes = int(np.prod(sheet_shape)) * dst.itemsize
+    # two slabs are held at once: the one transformed and the one read
+    thickness = min(dst.shape[0], memory_budget // (2 * sheet_bytes))
+    if thickness < 1:
+        raise ValueError("Memory budget too small for slabs of {} bytes"
+                         .format(2 * sheet_bytes))
+    # zeroed, so that the sheets padding a thinner last slab hold numbers
+    buffers = [zeros_aligned((thickness,) + sheet_shape, dst.dtype)
+               for _ in range(2)]
+    slabs = [(start, min(start + thickness, dst.shape[0]))
+             for start in range(0, dst.shape[0], thickness)]
+    # planned before the buffers are filled, as planning may overwrite them
+    plan = Plan(buffers[0], buffers[0], direction=direction, flags=flags,
+                threads=threads, axes=(axis,))
+    start, stop = slabs[0]
+    prefetch = _Prefetch(src[start:stop], buffers[0][:stop - start])
+    try:
+        for index, (start, stop) in enumerate(slabs):
+            prefetch.wait()
+            if index + 1 < len(slabs):
+                next_start, next_stop = slabs[index + 1]
+                prefetch = _Prefetch(
+                    src[next_start:next_stop],
+                    buffers[(index + 1) % 2][:next_stop - next_start])
+            plan.transform(buffers[index % 2], buffers[index % 2])
+            slab = buffers[index % 2][:stop - start]
+            if scale is not None:
+                slab.view(scale.dtype)[...] *= scale
+            dst[start:stop] = slab
+    finally:
+        prefetch.wait()
+        plan.destroy()
+
+
+def fftn(src, dst, axes=None, memory_budget=_default_memory_budget,
+         direction=Direction.forward, normalization=Normalization.none,
+         threads=None, flags=(Flag.estimate,)):
+    """
+    N-dimensional DFT of src into dst, holding at most memory_budget bytes of
+    the arrays in memory.
+
+    The arrays, usually numpy.memmap of local files, have the same shape and
+    at least two dimensions. The transform is computed in the complex data
+    type of dst, from src of any real or complex type, which may be dst
+    itself. By default, all the axes of the arrays are transformed. The axes
+    are transformed one after the other, the last one first, each by a pass
+    over dst, which is flushed to its file afterwards.
+
+    A ValueError is raised if the memory budget cannot hold two slabs of a
+    single sheet each, a sheet being a subarray of the arrays across one of
+    the axes. The result is bit for bit the one of transforming each slab in
+    memory with the plan of a full slab, which depends on the budget through
+    the thickness of the slabs: results for different budgets agree to
+    rounding only. It is only deterministic for plans created with
+    Flag.estimate or from wisdom.
+
+    Returns dst.
+    """
+    if src.shape != dst.shape:
+        raise ValueError('Input and output arrays have different shapes')
+    if dst.ndim < 2:
+        raise ValueError('Out-of-core transforms require 2-d arrays or more')
+    dt = dst.dtype
+    if dt.kind != 'c' or not dt.isnative:
+        raise ValueError("Unsupported data type: {}".format(dt))
+    axes = _check_axes(axes, dst.ndim)
+    memory_budget = int(memory_budget)
+    if not isinstance(normalization, Normalization):
+        raise ValueError("Invalid normalization: {}".format(normalization))
+    if normalization is Normalization.none:
+        scale = None
+    else:
+        # the factor applied by the plans of skfftw.fftw
+        n = dt.type(0).real.dtype.type(np.prod([dst.shape[axis]
+                                                for axis in axes]))
+        if normalization is Normalization.sqrt:
+            n = np.sqrt(n)
+        scale = n.dtype.type(1) / n
+    if dst.size:
+        passes = sorted(axes, reverse=True)
+        for index, axis in enumerate(passes):
+            _transform_axis(src if index == 0 else dst, dst, axis,
+                            memory_budget, direction,
+                            scale if index == len(passes) - 1 else None,
+                            threads, flags)
+    if hasattr(dst, 'flush'):
+        dst.flush()
+    return dst
@@ -0,0 +1,353 @@
+# coding: utf8
+
+# Copyright (c) 2014, 2015 Ghislain Antony Vaillant.
+#
+# This file is distributed under the new BSD License, see the LICENSE file or
+# checkout the license terms at http://opensource.org/licenses/BSD-3-Clause).
+
+"""
+Transforms of many arrays by a pool of worker processes.
+
+ProcessExecutor runs the transforms of skfftw.interfaces.numpy_fft in worker
+processes, which keep their plans in their plan cache from one job to the
+next. The arrays are exchanged through blocks of shared memory rather than
+pickled: inputs are copied into such blocks, unless allocated there with
+ProcessExecutor.empty, and the workers write the results straight into the
+blocks returned to the caller.
+
+The wisdom of the parent process is broadcast to the workers when the
+executor is created and whenever broadcast_wisdom is called. The exported
+strings are written once to a block of shared memory named after their
+generation, and the jobs only carry the generation, which tells the workers
+to import the block they have not imported yet.
+
+Shared memory requires Python 3.8 or later.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+from skfftw import wisdom, wrappers
+from skfftw.fftw import _half_shape, set_default_threads
+from skfftw.interfaces._transforms import (complex_dtype, real_dtype,
+                                           resized_shape, shape_and_axes)
+import multiprocessing
+import numpy as np
+import pickle
+import threading
+import uuid
+import weakref
+
+__all__ = ('ProcessExecutor',)
+
+
+# transforms run by the workers, and whether they are complex-to-real
+_transforms = {'fftn': False, 'ifftn': False, 'rfftn': False, 'irfftn': True}
+_wisdom_dtypes = (np.dtype('csingle'), np.dtype('cdouble'),
+                  np.dtype('clongdouble'))
+
+# prefix of the names of the wisdom blocks of the executor of a worker, and
+# generation of the wisdom it last imported
+_worker_wisdom_prefix = None
+_worker_wisdom_generation = None
+
+
+class _SharedBlock(object):
+
+    """
+    Block of shared memory, exposed through the array interface.
+
+    Arrays created from the block keep it alive, and the block is closed, and
+    unlinked by the process which created it, once they are all collected.
+    """
+
+    def __init__(self, shape, dtype, name=None):
+        from multiprocessing import shared_memory
+        dt = np.dtype(dtype)
+        shape = tuple(int(n) for n in shape)
+        if name is None:
+            size = max(int(np.prod(shape)) * dt.itemsize, 1)
+            self._memory = shared_memory.SharedMemory(create=True, size=size)
+        else:
+            self._memory = shared_memory.SharedMemory(name=name)
+        self._owner = name is None
+        self.shape = shape
+        self.dtype = dt
+        # the address is taken from a temporary array, which would otherwise
+        # prevent the block from being closed
+        address = np.frombuffer(self._memory.buf, np.uint8).ctypes.data
+        self.__array_interface__ = {'shape': shape, 'typestr': dt.str,
+                                    'data': (address, False), 'version': 3}
+
+    @property
+    def name(self):
+        return self._memory.name
+
+    @property
+    def spec(self):
+        """
+        Name, shape and data type of the block, to attach it elsewhere.
+        """
+        return self.name, self.shape, self.dtype.str
+
+    def __del__(self):
+        memory = getattr(self, '_memory', None)
+        if memory is None:
+            return
+        memory.close()
+        if self._owner:
+            memory.unlink()
+
+
+def _shared_block(array):
+    """
+    Shared block holding exactly the data of an array, or None.
+    """
+    base = array
+    while base is not None and not isinstance(base, _SharedBlock):
+        base = getattr(base, 'base', None)
+    if (base is not None and array.shape == base.shape and
+            array.dtype == base.dtype and array.flags.c_contiguous and
+            array.__array_interface__['data'][0] ==
+            base.__array_interface__['data'][0]):
+        return base
+    return None
+
+
+def _wisdom_block_name(prefix, generation):
+    return '{}_{}'.format(prefix, generation)
+
+
+def _unlink_block(memory):
+    memory.close()
+    memory.unlink()
+
+
+def _initialize(threads, wisdom_prefix):
+    global _worker_wisdom_prefix
+    set_default_threads(threads)
+    _worker_wisdom_prefix = wisdom_prefix
+
+
+def _import_wisdom(prefix, generation):
+    """
+    Import the wisdom broadcast by the parent, unless already imported.
+
+    Wisdom replaced by a newer broadcast is skipped, the newer one being
+    imported by a later job.
+    """
+    global _worker_wisdom_generation
+    from multiprocessing import shared_memory
+    if generation == _worker_wisdom_generation:
+        return
+    try:
+        memory = shared_memory.SharedMemory(
+            name=_wisdom_block_name(prefix, generation))
+    except FileNotFoundError:
+        return
+    try:
+        # the block may be larger than the pickle, whose end is marked
+        wisdom_strings = pickle.loads(memory.buf)
+    finally:
+        memory.close()
+    for dtype, string in wisdom_strings:
+        wisdom.import_wisdom_from_string(string, dtype)
+    _worker_wisdom_generation = generation
+
+
+def _run(transform, input_spec, output_spec, kwargs, generation):
+    """
+    Job of a worker, transforming a shared input into a shared output.
+    """
+    from skfftw.interfaces import numpy_fft
+    _import_wisdom(_worker_wisdom_prefix, generation)
+    input_array = np.asarray(_SharedBlock(input_spec[1], input_spec[2],
+                                          input_spec[0]))
+    output_array = np.asarray(_SharedBlock(output_spec[1], output_spec[2],
+                                           output_spec[0]))
+    getattr(numpy_fft, transform)(input_array, out=output_array, **kwargs)
+
+
+def _output_block(transform, a, s, axes):
+    """
+    Shared block receiving the result of a transform of a.
+    """
+    inverse_real = _transforms[transform]
+    s, axes = shape_and_axes(a, s, axes, inverse_real=inverse_real)
+    shape = resized_shape(a.shape, s, axes)
+    if transform == 'rfftn':
+        shape = _half_shape(shape, axes[-1])
+        dtype = complex_dtype(real_dtype(a.dtype))
+    elif inverse_real:
+        dtype = real_dtype(complex_dtype(a.dtype))
+    else:
+        dtype = complex_dtype(a.dtype)
+    return _SharedBlock(shape, dtype)
+
+
+class ProcessExecutor(object):
+
+    """
+    Pool of worker processes transforming arrays in shared memory.
+    """
+
+    def __init__(self, processes=None, threads=1):
+        """
+        Start the given number of worker processes, which defaults to the
+        number of CPUs, each computing its transforms with the given number
+        of threads.
+        """
+        if processes is None:
+            processes = multiprocessing.cpu_count()
+        self._processes = int(processes)
+        self._threads = int(threads)
+        if self._processes < 1 or self._threads < 1:
+            raise ValueError('Invalid number of processes or threads')
+        # short, as some systems limit the names of shared memory to 31
+        # characters
+        self._wisdom_prefix = 'skfftw_' + uuid.uuid4().hex[:12]
+        self._wisdom_generation = 0
+        # releases the wisdom block of the last broadcast, at the latest when
+        # the executor is collected
+        self._wisdom_finalizer = None
+        # blocks of the input copies, by shape and data type
+        self._free_blocks = {}
+        self._blocks_lock = threading.Lock()
+        self.broadcast_wisdom()
+        # the workers share the resource tracker of this process, which then
+        # sees the blocks they attach unlinked by their creator
+        from multiprocessing import resource_tracker
+        resource_tracker.ensure_running()
+        self._pool = multiprocessing.Pool(self._processes, _initialize,
+                                          (self._threads,
+                                           self._wisdom_prefix))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+
+    @property
+    def processes(self):
+        return self._processes
+
+    @property
+    def threads(self):
+        return self._threads
+
+    def broadcast_wisdom(self):
+        """
+        Send the current wisdom of this process to the workers.
+
+        The wisdom of the precisions loaded by this process is exported to a
+        block of shared memory, and imported by each worker before its next
+        job. The block of the previous broadcast is released.
+        """
+        from multiprocessing import shared_memory
+        data = pickle.dumps(tuple(
+            (dtype.str, wisdom.export_wisdom_to_string(dtype))
+            for dtype in _wisdom_dtypes if wrappers.is_loaded(dtype)))
+        block = shared_memory.SharedMemory(
+            name=_wisdom_block_name(self._wisdom_prefix,
+                                    self._wisdom_generation + 1),
+            create=True, size=len(data))
+        block.buf[:len(data)] = data
+        self._release_wisdom()
+        self._wisdom_finalizer = weakref.finalize(self, _unlink_block, block)
+        self._wisdom_generation += 1
+
+    def _release_wisdom(self):
+        """
+        Private method closing and unlinking the block of the last broadcast.
+        """
+        if self._wisdom_finalizer is not None:
+            self._wisdom_finalizer()
+            self._wisdom_finalizer = None
+
+    def empty(self, shape, dtype=np.cdouble):
+        """
+        New array in shared memory, which the workers transform without
+        copying it.
+        """
+        return np.asarray(_SharedBlock(shape, dtype))
+
+    def _copy_block(self, a):
+        """
+        Private method copying an array into a shared block.
+
+        The blocks of the copies are reused once their job is done, sparing
+        the cost of mapping new memory.
+        """
+        key = a.shape, a.dtype.str
+        with self._blocks_lock:
+            blocks = self._free_blocks.get(key)
+            block = blocks.pop() if blocks else None
+        if block is None:
+            block = _SharedBlock(a.shape, a.dtype)
+        np.copyto(np.asarray(block), a)
+        return block
+
+    def _release_block(self, block):
+        """
+        Private method keeping the block of a copy for the next copies.
+        """
+        key = block.shape, block.dtype.str
+        with self._blocks_lock:
+            blocks = self._free_blocks.setdefault(key, [])
+            if len(blocks) < 2 * self._processes:
+                blocks.append(block)
+
+    def submit(self, transform, a, s=None, axes=None, norm=None):
+        """
+        Schedule a transform of a, and return a future of its result.
+
+        The transform is one of 'fftn', 'ifftn', 'rfftn' and 'irfftn', with
+        the arguments of its skfftw.interfaces.numpy_fft counterpart. The
+        result is an array in shared memory, released once collected.
+        """
+        from concurrent.futures import Future
+        if transform not in _transforms:
+            raise ValueError("Unsupported transform: {}".format(transform))
+        a = np.asarray(a)
+        input_block = _shared_block(a)
+        copied = input_block is None
+        if copied:
+            input_block = self._copy_block(a)
+        output_block = _output_block(transform, a, s, axes)
+        future = Future()
+        future.set_running_or_notify_cancel()
+
+        # the callbacks keep the blocks alive until the job is done
+        def done(_):
+            if copied:
+                self._release_block(input_block)
+            future.set_result(np.asarray(output_block))
+
+        def failed(exception):
+            if copied:
+                self._release_block(input_block)
+            future.set_exception(exception)
+
+        kwargs = {'s': s, 'axes': axes, 'norm': norm}
+        self._pool.apply_async(
+            _run, (transform, input_block.spec, output_block.spec, kwargs,
+                   self._wisdom_generation),
+            callback=done, error_callback=failed)
+        return future
+
+    def map(self, transform, arrays, s=None, axes=None, norm=None):
+        """
+        Transform each of the arrays, and return the list of results.
+        """
+        futures = [self.submit(transform, a, s, axes, norm) for a in arrays]
+        return [future.result() for future in futures]
+
+    def shutdown(self):
+        """
+        Wait for the pending jobs, then stop the workers.
+        """
+        self._pool.close()
+        self._pool.join()
+        self._release_wisdom()
+        with self._blocks_lock:
+            self._free_blocks.clear()
@@ -0,0 +1,362 @@
+# coding: utf8
+
+# Copyright (c) 2014, 2015 Ghislain Antony Vaillant.
+#
+# This file is distributed under the new BSD License, see the LICENSE file or
+# checkout the license terms at http://opensource.org/licenses/BSD-3-Clause).
+
+"""
+Short-time Fourier transforms of unbounded streams.
+
+STFT turns a stream of sample chunks into a stream of spectra, and ISTFT
+turns the spectra back into samples by weighted overlap-add. Both work on
+preallocated aligned buffers holding at most max_frames frames, so their
+memory is bounded whatever the length of the stream or the size of its
+chunks, and all the frames available at once are transformed by a single
+batched plan from the process-wide cache.
+
+The arrays yielded are views of these buffers, which are overwritten by the
+next iteration: copy them to keep them longer.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+from skfftw import cache
+from skfftw.aligned import empty_aligned, zeros_aligned
+from skfftw.enums import Flag, Normalization
+from skfftw.fftw import InverseRealPlan, RealPlan
+from numpy.lib.stride_tricks import as_strided
+import numpy as np
+
+__all__ = ('STFT', 'ISTFT', 'hann')
+
+
+def hann(frame_size, dtype=np.double):
+    """
+    Periodic Hann window, whose shifts by half its size sum to one.
+    """
+    n = np.arange(frame_size, dtype=dtype)
+    return (0.5 - 0.5 * np.cos(2 * np.pi * n / frame_size)).astype(dtype)
+
+
+class _Framing(object):
+
+    """
+    Parameters shared by the forward and inverse transforms.
+    """
+
+    def __init__(self, frame_size, hop_size, window, max_frames, dtype,
+                 threads, flags):
+        frame_size = int(frame_size)
+        hop_size = frame_size // 2 if hop_size is None else int(hop_size)
+        if frame_size < 1:
+            raise ValueError("Invalid frame size: {}".format(frame_size))
+        if not 0 < hop_size <= frame_size:
+            raise ValueError("Invalid hop size: {}".format(hop_size))
+        if int(max_frames) < 1:
+            raise ValueError("Invalid number of frames: {}".format(
+                max_frames))
+        dt = np.dtype(dtype)
+        if dt.kind != 'f':
+            raise ValueError("Unsupported data type: {}".format(dt))
+        if window is None:
+            window = hann(frame_size, dt)
+        window = np.asarray(window)
+        if window.shape != (frame_size,):
+            raise ValueError('Window and frames have different sizes')
+        self._frame_size = frame_size
+        self._hop_size = hop_size
+        self._max_frames = int(max_frames)
+        self._window = empty_aligned(frame_size, dt)
+        self._window[...] = window
+        self._threads = threads
+        self._flags = tuple(flags)
+        self._frames = empty_aligned((self._max_frames, frame_size), dt)
+        self._spectra = empty_aligned(
+            (self._max_frames, frame_size // 2 + 1),
+            np.promote_types(dt, np.csingle))
+        # samples spanned by max_frames consecutive frames
+        self._capacity = frame_size + (self._max_frames - 1) * hop_size
+        self._batches = {}
+
+    def _batch(self, frames):
+        """
+        Private method returning the frames and spectra of a batch.
+
+        The views are kept, so that each batch size reuses the same arrays.
+        """
+        batch = self._batches.get(frames)
+        if batch is None:
+            batch = self._batches[frames] = (self._frames[:frames],
+                                             self._spectra[:frames])
+        return batch
+
+    def _plan(self, plan_class, input_array, output_array):
+        return cache.get_plan(plan_class, input_array, output_array,
+                              flags=self._flags, threads=self._threads,
+                              axes=(1,))
+
+    @property
+    def frame_size(self):
+        """
+        Number of samples per frame.
+        """
+        return self._frame_size
+
+    @property
+    def hop_size(self):
+        """
+        Number of samples between the starts of consecutive frames.
+        """
+        return self._hop_size
+
+    @property
+    def window(self):
+        """
+        Window applied to each frame.
+        """
+        return self._window
+
+    @property
+    def max_frames(self):
+        """
+        Maximum number of frames transformed at once.
+        """
+        return self._max_frames
+
+
+class STFT(_Framing):
+
+    """
+    Streaming short-time Fourier transform of real samples.
+
+    Frames of frame_size samples start every hop_size samples, and are
+    multiplied by the window before their real-to-complex transform. The
+    window defaults to a periodic Hann window, and the hop size to half the
+    frame size.
+
+    Incoming samples are appended to an aligned buffer spanning max_frames
+    frames. Whenever frames are complete, they are windowed out of it in a
+    single operation and transformed with one batched plan, then the samples
+    still needed by the next frames are moved to the front of the buffer.
+    """
+
+    def __init__(self, frame_size, hop_size=None, window=None, max_frames=64,
+                 dtype=np.double, threads=None, flags=(Flag.estimate,)):
+        super(STFT, self).__init__(frame_size, hop_size, window, max_frames,
+                                   dtype, threads, flags)
+        self._buffer = empty_aligned(self._capacity, dtype)
+        itemsize = self._buffer.itemsize
+        # overlapping frames of the buffer, without copy
+        self._buffer_frames = as_strided(
+            self._buffer, (self._max_frames, self._frame_size),
+            (self._hop_size * itemsize, itemsize), writeable=False)
+        self.reset()
+
+    def reset(self):
+        """
+        Discard the pending samples, to start a new stream.
+        """
+        self._filled = 0
+        self._received = 0
+        self._emitted = 0
+
+    def __call__(self, chunks):
+        """
+        Transform a stream of chunks, then flush it.
+
+        Yields 2-d arrays holding the spectra of consecutive frames, one per
+        row.
+        """
+        for chunk in chunks:
+            for spectra in self.feed(chunk):
+                yield spectra
+        for spectra in self.flush():
+            yield spectra
+
+    def feed(self, chunk):
+        """
+        Append a chunk of samples to the stream.
+
+        Yields the spectra of the frames completed by the chunk, as in
+        __call__. Chunks larger than the buffer are transformed in several
+        batches.
+        """
+        chunk = np.ravel(chunk)
+        position = 0
+        while position < chunk.size:
+            n = min(chunk.size - position, self._capacity - self._filled)
+            np.copyto(self._buffer[self._filled:self._filled + n],
+                      chunk[position:position + n], casting='same_kind')
+            self._filled += n
+            self._received += n
+            position += n
+            frames = self._complete_frames()
+            if frames:
+                yield self._transform(frames)
+
+    def flush(self):
+        """
+        Complete the stream with zeros.
+
+        Yields the spectra of the frames starting before the end of the
+        stream which have not been transformed yet.
+        """
+        start = self._emitted * self._hop_size
+        frames = -(-(self._received - start) // self._hop_size)
+        while frames:
+            self._buffer[self._filled:].fill(0)
+            self._filled = self._capacity
+            batch = min(frames, self._max_frames)
+            frames -= batch
+            yield self._transform(batch)
+        self.reset()
+
+    def _complete_frames(self):
+        if self._filled < self._frame_size:
+            return 0
+        return (self._filled - self._frame_size) // self._hop_size + 1
+
+    def _transform(self, frames):
+        """
+        Private method transforming the first frames of the buffer.
+        """
+        frames_array, spectra = self._batch(frames)
+        np.multiply(self._buffer_frames[:frames], self._window,
+                    out=frames_array)
+        consumed = frames * self._hop_size
+        remaining = self._filled - consumed
+        self._buffer[:remaining] = self._buffer[consumed:self._filled]
+        self._filled = remaining
+        self._emitted += frames
+        plan = self._plan(RealPlan, frames_array, spectra)
+        return plan.transform(frames_array, spectra)
+
+
+class ISTFT(_Framing):
+
+    """
+    Streaming inverse short-time Fourier transform.
+
+    The spectra, one per row, are transformed back to frames, which are
+    multiplied by the window and overlap-added. The sum is divided by the sum
+    of the squared windows overlapping each sample, so that the samples
+    transformed by an STFT of the same parameters are recovered wherever that
+    sum is not zero.
+
+    Samples are yielded as soon as no further frame overlaps them. A stream
+    of spectra from STFT.__call__ yields the original samples, followed by
+    the zeros padding its last frame.
+    """
+
+    def __init__(self, frame_size, hop_size=None, window=None, max_frames=64,
+                 dtype=np.double, threads=None, flags=(Flag.estimate,)):
+        super(ISTFT, self).__init__(frame_size, hop_size, window, max_frames,
+                                    dtype, threads, flags)
+        self._squared_window = self._window ** 2
+        self._sum = zeros_aligned(self._capacity, dtype)
+        self._weights = zeros_aligned(self._capacity, dtype)
+        self._output = empty_aligned(self._capacity, dtype)
+
+    def reset(self):
+        """
+        Discard the pending samples, to start a new stream.
+        """
+        self._sum.fill(0)
+        self._weights.fill(0)
+
+    def __call__(self, spectra):
+        """
+        Transform a stream of spectra, then flush it.
+
+        Yields 1-d arrays of consecutive samples.
+        """
+        for batch in spectra:
+            for samples in self.feed(batch):
+                yield samples
+        for samples in self.flush():
+            yield samples
+
+    def feed(self, spectra):
+        """
+        Append the spectra of consecutive frames to the stream.
+
+        Yields the samples completed by the frames, as in __call__. Batches
+        of more than max_frames spectra are transformed in several batches.
+        """
+        spectra = np.asarray(spectra)
+        if spectra.ndim == 1:
+            spectra = spectra[np.newaxis]
+        if spectra.shape[1:] != self._spectra.shape[1:]:
+            raise ValueError("Invalid spectrum size: expected {}, got "
+                             "{}".format(self._spectra.shape[1],
+                                         spectra.shape[1:]))
+        for start in range(0, len(spectra), self._max_frames):
+            batch = spectra[start:start + self._max_frames]
+            yield self._transform(batch)
+
+    def flush(self):
+        """
+        Yield the samples still overlapped by the last frame.
+        """
+        pending = self._frame_size - self._hop_size
+        if pending:
+            yield self._normalize(pending)
+        self.reset()
+
+    def _transform(self, batch):
+        """
+        Private method overlap-adding a batch of spectra.
+        """
+        frames = len(batch)
+        # the transform destroys its input, hence works on a copy
+        frames_array, spectra = self._batch(frames)
+        np.copyto(spectra, batch, casting='same_kind')
+        plan = self._plan(InverseRealPlan, spectra, frames_array)
+        plan.transform(spectra, frames_array, Normalization.full)
+        frames_array *= self._window
+        self._overlap_add(frames_array)
+        n = frames * self._hop_size
+        output = self._normalize(n)
+        # move the samples still overlapped by later frames to the front
+        pending = self._frame_size - self._hop_size
+        for array in (self._sum, self._weights):
+            array[:pending] = array[n:n + pending]
+            array[pending:].fill(0)
+        return output
+
+    def _overlap_add(self, frames_array):
+        """
+        Private method adding windowed frames and squared windows to the
+        sums.
+
+        When the hop size divides the frame size, each of the
+        frame_size // hop_size segments of the frames is added to the sums
+        at once, for all frames.
+        """
+        frames, hop = len(frames_array), self._hop_size
+        if self._frame_size % hop:
+            for i in range(frames):
+                segment = slice(i * hop, i * hop + self._frame_size)
+                self._sum[segment] += frames_array[i]
+                self._weights[segment] += self._squared_window
+            return
+        segments = self._frame_size // hop
+        frames_array = frames_array.reshape(frames, segments, hop)
+        squared_window = self._squared_window.reshape(segments, hop)
+        for i in range(segments):
+            segment = slice(i * hop, (i + frames) * hop)
+            sums = self._sum[segment].reshape(frames, hop)
+            np.add(sums, frames_array[:, i], out=sums)
+            weights = self._weights[segment].reshape(frames, hop)
+            np.add(weights, squared_window[i], out=weights)
+
+    def _normalize(self, n):
+        """
+        Private method returning the first n samples of the sum, normalized.
+        """
+        output = self._output[:n]
+        output.fill(0)
+        np.divide(self._sum[:n], self._weights[:n], out=output,
+                  where=self._weights[:n] > np.finfo(output.dtype).tiny)
+        return output
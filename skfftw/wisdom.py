@@ -0,0 +1,215 @@
+# coding: utf8
+
+# Copyright (c) 2014, 2015 Ghislain Antony Vaillant.
+#
+# This file is distributed under the new BSD License, see the LICENSE file or
+# checkout the license terms at http://opensource.org/licenses/BSD-3-Clause).
+
+"""
+Import and export of the wisdom accumulated by the FFTW planner.
+
+FFTW keeps separate wisdom for each precision, so every function of this
+module takes a ``dtype`` argument selecting the precision to act upon. Real
+and complex dtypes of the same precision are equivalent. The library of the
+precision is loaded if needed, and a ValueError raised if it is unavailable.
+
+Wisdom is also cached on disk, in a directory specific to the current host.
+The cache of a given precision is loaded when the first plan of that
+precision is created, and any new wisdom is saved back on exit.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+from skfftw.wrappers import load_library, planner_lock
+import atexit
+import numpy as np
+import os
+import sys
+import threading
+import warnings
+
+__all__ = ('export_wisdom_to_filename', 'export_wisdom_to_string',
+           'import_system_wisdom', 'import_wisdom_from_filename',
+           'import_wisdom_from_string', 'forget_wisdom', 'cache_directory',
+           'load_cache', 'save_cache', 'set_cache_enabled')
+
+
+_cache_filenames = {np.dtype('cdouble'): 'fftw.wisdom',
+                    np.dtype('csingle'): 'fftwf.wisdom',
+                    np.dtype('clongdouble'): 'fftwl.wisdom'}
+
+_cache_enabled = os.environ.get('SKFFTW_WISDOM_CACHE', '1') != '0'
+_cache_lock = threading.Lock()
+# wisdom of each loaded precision, as it was when last loaded or saved
+_cache_state = {}
+_atexit_registered = False
+
+
+def _precision(dtype):
+    dt = np.dtype(dtype)
+    if dt.kind == 'f':
+        dt = np.promote_types(dt, np.csingle)
+    if dt not in _cache_filenames:
+        raise ValueError("Unsupported data type: {}".format(np.dtype(dtype)))
+    return dt
+
+
+def _encode(filename):
+    if isinstance(filename, bytes):
+        return filename
+    return filename.encode(sys.getfilesystemencoding())
+
+
+def export_wisdom_to_filename(filename, dtype=np.cdouble):
+    """
+    Export the wisdom of the given precision to a file.
+
+    Returns True on success.
+    """
+    wrapper = load_library(_precision(dtype))
+    with planner_lock:
+        return wrapper.export_wisdom_to_filename(_encode(filename))
+
+
+def export_wisdom_to_string(dtype=np.cdouble):
+    """
+    Export the wisdom of the given precision as a bytes string.
+    """
+    wrapper = load_library(_precision(dtype))
+    with planner_lock:
+        return wrapper.export_wisdom_to_string()
+
+
+def import_system_wisdom(dtype=np.cdouble):
+    """
+    Import the system-wide wisdom of the given precision.
+
+    Returns True on success.
+    """
+    wrapper = load_library(_precision(dtype))
+    with planner_lock:
+        return wrapper.import_system_wisdom()
+
+
+def import_wisdom_from_filename(filename, dtype=np.cdouble):
+    """
+    Import wisdom of the given precision from a file.
+
+    Returns True on success.
+    """
+    wrapper = load_library(_precision(dtype))
+    with planner_lock:
+        return wrapper.import_wisdom_from_filename(_encode(filename))
+
+
+def import_wisdom_from_string(wisdom, dtype=np.cdouble):
+    """
+    Import wisdom of the given precision from a bytes string.
+
+    Returns True on success.
+    """
+    wrapper = load_library(_precision(dtype))
+    with planner_lock:
+        return wrapper.import_wisdom_from_string(wisdom)
+
+
+def forget_wisdom(dtype=np.cdouble):
+    """
+    Forget all the wisdom accumulated for the given precision.
+    """
+    wrapper = load_library(_precision(dtype))
+    with planner_lock:
+        wrapper.forget_wisdom()
+
+
+def cache_directory():
+    """
+    Directory of the wisdom cache for the current host.
+
+    Defaults to a per-host subdirectory of ``$XDG_CACHE_HOME/skfftw/wisdom``,
+    and may be overridden with the ``SKFFTW_WISDOM_DIR`` environment variable.
+    """
+    root = os.environ.get('SKFFTW_WISDOM_DIR')
+    if not root:
+        cache_home = (os.environ.get('XDG_CACHE_HOME') or
+                      os.path.join(os.path.expanduser('~'), '.cache'))
+        root = os.path.join(cache_home, 'skfftw', 'wisdom')
+    import socket
+    return os.path.join(root, socket.gethostname())
+
+
+def set_cache_enabled(enabled):
+    """
+    Enable or disable the automatic loading of the wisdom cache.
+
+    The cache is enabled by default, unless the ``SKFFTW_WISDOM_CACHE``
+    environment variable is set to 0.
+    """
+    global _cache_enabled
+    _cache_enabled = bool(enabled)
+
+
+def load_cache(dtype=np.cdouble):
+    """
+    Load the cached wisdom of the given precision.
+
+    The cache of each precision is only read once per process, and is
+    registered for saving on exit. Returns True if wisdom was imported.
+    """
+    global _atexit_registered
+    dt = _precision(dtype)
+    with _cache_lock:
+        if dt in _cache_state:
+            return False
+        filename = os.path.join(cache_directory(), _cache_filenames[dt])
+        imported = (os.path.exists(filename) and
+                    import_wisdom_from_filename(filename, dt))
+        _cache_state[dt] = export_wisdom_to_string(dt)
+        if not _atexit_registered:
+            atexit.register(save_cache)
+            _atexit_registered = True
+    return imported
+
+
+def save_cache():
+    """
+    Save the wisdom of every loaded precision to the cache.
+
+    Wisdom found in the cache is merged first, so concurrent processes do not
+    discard each other's wisdom, and each file is replaced atomically. Nothing
+    is written for a precision which did not gain any wisdom.
+    """
+    import tempfile
+    with _cache_lock:
+        for dt in list(_cache_state):
+            if export_wisdom_to_string(dt) == _cache_state[dt]:
+                continue
+            directory = cache_directory()
+            filename = os.path.join(directory, _cache_filenames[dt])
+            try:
+                if not os.path.isdir(directory):
+                    os.makedirs(directory)
+                if os.path.exists(filename):
+                    import_wisdom_from_filename(filename, dt)
+                wisdom = export_wisdom_to_string(dt)
+                fd, tmpname = tempfile.mkstemp(dir=directory, suffix='.tmp')
+                try:
+                    with os.fdopen(fd, 'wb') as f:
+                        f.write(wisdom)
+                    os.replace(tmpname, filename)
+                except:
+                    os.unlink(tmpname)
+                    raise
+            except (IOError, OSError) as e:
+                warnings.warn("Could not save wisdom to {}: {}".format(
+                    filename, e), RuntimeWarning)
+                continue
+            _cache_state[dt] = wisdom
+
+
+def _autoload(dtype):
+    """
+    Load the wisdom cache for a precision on first use, if enabled.
+    """
+    if _cache_enabled and _precision(dtype) not in _cache_state:
+        load_cache(dtype)
@@ -5,4 +5,88 @@
 # This file is distributed under the new BSD License, see the LICENSE file or 
 # checkout the license terms at http://opensource.org/licenses/BSD-3-Clause).
 
-from __future__ import absolute_import, division, print_function
\ No newline at end of file
+from __future__ import absolute_import, division, print_function
+
+import importlib
+import threading
+import numpy as np
+
+__all__ = ('planner_lock', 'available_precisions', 'load_library',
+           'is_loaded')
+
+
+# The FFTW planner is not thread-safe: every call which creates or destroys a
+# plan, or touches the accumulated wisdom, must hold this lock.
+planner_lock = threading.RLock()
+
+# wrapper module of each precision, by name of the precision
+_modules = (('single', 'libfftwf'),
+            ('double', 'libfftw'),
+            ('longdouble', 'libfftwl'))
+# wrapper module of each precision, by character code of its data types
+_module_names = {'f': 'libfftwf', 'F': 'libfftwf',
+                 'd': 'libfftw', 'D': 'libfftw',
+                 'g': 'libfftwl', 'G': 'libfftwl'}
+# loaded wrapper modules, and import errors of the unavailable ones
+_libraries = {}
+_errors = {}
+
+
+def _load(name):
+    """
+    Wrapper module of the given name, or None if its libraries are missing.
+    """
+    try:
+        return _libraries[name]
+    except KeyError:
+        pass
+    try:
+        library = importlib.import_module('skfftw.wrappers.' + name)
+    except ImportError as e:
+        _errors[name] = e
+        library = None
+    _libraries[name] = library
+    return library
+
+
+def _module_name(dtype):
+    dt = np.dtype(dtype)
+    name = _module_names.get(dt.char)
+    if name is None:
+        raise ValueError("Unsupported data type: {}".format(dt))
+    return dt, name
+
+
+def load_library(dtype):
+    """
+    Wrapper module of the precision of a real or complex data type.
+
+    Each precision of FFTW is an optional library, loaded along with its
+    wrapper module on first use. A ValueError is raised for data types of no
+    FFTW precision, and for precisions whose library is not available.
+    """
+    dt, name = _module_name(dtype)
+    library = _load(name)
+    if library is None:
+        raise ValueError("FFTW library unavailable for data type {}: {}"
+                         .format(dt, _errors[name]))
+    return library
+
+
+def available_precisions():
+    """
+    Names of the precisions of FFTW available, among 'single', 'double' and
+    'longdouble'.
+
+    The libraries of all the precisions are loaded to find out.
+    """
+    return tuple(precision for precision, name in _modules
+                 if _load(name) is not None)
+
+
+def is_loaded(dtype):
+    """
+    Whether the library of the precision of a real or complex data type is
+    loaded, without loading it.
+    """
+    return _libraries.get(_module_name(dtype)[1]) is not None
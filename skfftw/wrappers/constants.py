@@ -5,7 +5,7 @@
 # This file is distributed under the new BSD License, see the LICENSE file or 
 # checkout the license terms at http://opensource.org/licenses/BSD-3-Clause).
 
-from skfftw.bindings.cffi import lib
+from skfftw.bindings._constants_cffi import lib
 
 __all__ = (
     'FFTW_FORWARD',
@@ -18,7 +18,18 @@ __all__ = (
     'FFTW_PRESERVE_INPUT',
     'FFTW_PATIENT',
     'FFTW_ESTIMATE',
-    'FFTW_WISDOM_ONLY'
+    'FFTW_WISDOM_ONLY',
+    'FFTW_R2HC',
+    'FFTW_HC2R',
+    'FFTW_DHT',
+    'FFTW_REDFT00',
+    'FFTW_REDFT01',
+    'FFTW_REDFT10',
+    'FFTW_REDFT11',
+    'FFTW_RODFT00',
+    'FFTW_RODFT01',
+    'FFTW_RODFT10',
+    'FFTW_RODFT11'
 )
 
 
@@ -35,3 +46,14 @@ FFTW_PATIENT = lib.FFTW_PATIENT
 FFTW_ESTIMATE = lib.FFTW_ESTIMATE
 FFTW_WISDOM_ONLY = lib.FFTW_WISDOM_ONLY
 
+FFTW_R2HC = lib.FFTW_R2HC
+FFTW_HC2R = lib.FFTW_HC2R
+FFTW_DHT = lib.FFTW_DHT
+FFTW_REDFT00 = lib.FFTW_REDFT00
+FFTW_REDFT01 = lib.FFTW_REDFT01
+FFTW_REDFT10 = lib.FFTW_REDFT10
+FFTW_REDFT11 = lib.FFTW_REDFT11
+FFTW_RODFT00 = lib.FFTW_RODFT00
+FFTW_RODFT01 = lib.FFTW_RODFT01
+FFTW_RODFT10 = lib.FFTW_RODFT10
+FFTW_RODFT11 = lib.FFTW_RODFT11
@@ -5,9 +5,25 @@
 # This file is distributed under the new BSD License, see the LICENSE file or 
 # checkout the license terms at http://opensource.org/licenses/BSD-3-Clause).
 
-from skfftw.bindings.cffi import ffi, lib
+from skfftw.bindings._fftwf_cffi import ffi, lib
 
-__all__ = ('execute', 'plan_dft', 'execute_dft', 'destroy_plan')
+__all__ = ('execute', 'plan_dft', 'plan_many_dft', 'plan_guru_dft',
+           'execute_dft', 'plan_dft_r2c', 'plan_dft_c2r', 'plan_many_dft_r2c',
+           'plan_many_dft_c2r', 'plan_guru_dft_r2c', 'plan_guru_dft_c2r',
+           'execute_dft_r2c', 'execute_dft_c2r', 'plan_r2r', 'plan_many_r2r',
+           'plan_guru_r2r', 'execute_r2r', 'plan_guru64_dft',
+           'plan_guru64_dft_r2c', 'plan_guru64_dft_c2r', 'plan_guru64_r2r',
+           'dft_pointers', 'dft_r2c_pointers', 'dft_c2r_pointers',
+           'r2r_pointers', 'execute_dft_pointers', 'execute_dft_r2c_pointers',
+           'execute_dft_c2r_pointers', 'execute_r2r_pointers', 'scale_factor',
+           'execute_dft_scaled_pointers', 'execute_dft_r2c_scaled_pointers',
+           'execute_dft_c2r_scaled_pointers', 'execute_r2r_scaled_pointers',
+           'destroy_plan', 'print_plan', 'sprint_plan', 'flops',
+           'estimate_cost', 'cost', 'export_wisdom_to_filename',
+           'export_wisdom_to_string', 'import_system_wisdom',
+           'import_wisdom_from_filename', 'import_wisdom_from_string',
+           'forget_wisdom', 'set_timelimit', 'alignment_of',
+           'init_threads', 'plan_with_nthreads', 'cleanup_threads')
 
 
 def execute(plan):
@@ -25,6 +41,51 @@ def plan_dft(in_array, out_array, sign, flags):
     )
 
 
+def plan_many_dft(n, howmany, in_array, istride, idist, out_array, ostride,
+                  odist, sign, flags):
+    return lib.fftwf_plan_many_dft(
+        len(n),
+        ffi.new('const int []', n),
+        howmany,
+        ffi.cast('fftwf_complex *', in_array.ctypes.data),
+        ffi.NULL,
+        istride,
+        idist,
+        ffi.cast('fftwf_complex *', out_array.ctypes.data),
+        ffi.NULL,
+        ostride,
+        odist,
+        sign,
+        flags,
+    )
+
+
+def plan_guru_dft(dims, howmany_dims, in_array, out_array, sign, flags):
+    return lib.fftwf_plan_guru_dft(
+        len(dims),
+        ffi.new('const fftwf_iodim []', dims),
+        len(howmany_dims),
+        ffi.new('const fftwf_iodim []', howmany_dims),
+        ffi.cast('fftwf_complex *', in_array.ctypes.data),
+        ffi.cast('fftwf_complex *', out_array.ctypes.data),
+        sign,
+        flags,
+    )
+
+
+def plan_guru64_dft(dims, howmany_dims, in_array, out_array, sign, flags):
+    return lib.fftwf_plan_guru64_dft(
+        len(dims),
+        ffi.new('const fftwf_iodim64 []', dims),
+        len(howmany_dims),
+        ffi.new('const fftwf_iodim64 []', howmany_dims),
+        ffi.cast('fftwf_complex *', in_array.ctypes.data),
+        ffi.cast('fftwf_complex *', out_array.ctypes.data),
+        sign,
+        flags,
+    )
+
+
 def execute_dft(plan, in_array, out_array):
     lib.fftwf_execute_dft(
         plan,
@@ -33,5 +94,314 @@ def execute_dft(plan, in_array, out_array):
     )
 
 
-def destroy_plan(plan):
-    lib.fftwf_destroy_plan(plan)
\ No newline at end of file
+def plan_dft_r2c(in_array, out_array, flags):
+    return lib.fftwf_plan_dft_r2c(
+        in_array.ndim,
+        ffi.new('const int []', in_array.shape),
+        ffi.cast('float *', in_array.ctypes.data),
+        ffi.cast('fftwf_complex *', out_array.ctypes.data),
+        flags,
+    )
+
+
+def plan_dft_c2r(in_array, out_array, flags):
+    return lib.fftwf_plan_dft_c2r(
+        out_array.ndim,
+        ffi.new('const int []', out_array.shape),
+        ffi.cast('fftwf_complex *', in_array.ctypes.data),
+        ffi.cast('float *', out_array.ctypes.data),
+        flags,
+    )
+
+
+def plan_many_dft_r2c(n, howmany, in_array, istride, idist, out_array,
+                      ostride, odist, flags):
+    return lib.fftwf_plan_many_dft_r2c(
+        len(n),
+        ffi.new('const int []', n),
+        howmany,
+        ffi.cast('float *', in_array.ctypes.data),
+        ffi.NULL,
+        istride,
+        idist,
+        ffi.cast('fftwf_complex *', out_array.ctypes.data),
+        ffi.NULL,
+        ostride,
+        odist,
+        flags,
+    )
+
+
+def plan_many_dft_c2r(n, howmany, in_array, istride, idist, out_array,
+                      ostride, odist, flags):
+    return lib.fftwf_plan_many_dft_c2r(
+        len(n),
+        ffi.new('const int []', n),
+        howmany,
+        ffi.cast('fftwf_complex *', in_array.ctypes.data),
+        ffi.NULL,
+        istride,
+        idist,
+        ffi.cast('float *', out_array.ctypes.data),
+        ffi.NULL,
+        ostride,
+        odist,
+        flags,
+    )
+
+
+def plan_guru_dft_r2c(dims, howmany_dims, in_array, out_array, flags):
+    return lib.fftwf_plan_guru_dft_r2c(
+        len(dims),
+        ffi.new('const fftwf_iodim []', dims),
+        len(howmany_dims),
+        ffi.new('const fftwf_iodim []', howmany_dims),
+        ffi.cast('float *', in_array.ctypes.data),
+        ffi.cast('fftwf_complex *', out_array.ctypes.data),
+        flags,
+    )
+
+
+def plan_guru64_dft_r2c(dims, howmany_dims, in_array, out_array, flags):
+    return lib.fftwf_plan_guru64_dft_r2c(
+        len(dims),
+        ffi.new('const fftwf_iodim64 []', dims),
+        len(howmany_dims),
+        ffi.new('const fftwf_iodim64 []', howmany_dims),
+        ffi.cast('float *', in_array.ctypes.data),
+        ffi.cast('fftwf_complex *', out_array.ctypes.data),
+        flags,
+    )
+
+
+def plan_guru_dft_c2r(dims, howmany_dims, in_array, out_array, flags):
+    return lib.fftwf_plan_guru_dft_c2r(
+        len(dims),
+        ffi.new('const fftwf_iodim []', dims),
+        len(howmany_dims),
+        ffi.new('const fftwf_iodim []', howmany_dims),
+        ffi.cast('fftwf_complex *', in_array.ctypes.data),
+        ffi.cast('float *', out_array.ctypes.data),
+        flags,
+    )
+
+
+def plan_guru64_dft_c2r(dims, howmany_dims, in_array, out_array, flags):
+    return lib.fftwf_plan_guru64_dft_c2r(
+        len(dims),
+        ffi.new('const fftwf_iodim64 []', dims),
+        len(howmany_dims),
+        ffi.new('const fftwf_iodim64 []', howmany_dims),
+        ffi.cast('fftwf_complex *', in_array.ctypes.data),
+        ffi.cast('float *', out_array.ctypes.data),
+        flags,
+    )
+
+
+def execute_dft_r2c(plan, in_array, out_array):
+    lib.fftwf_execute_dft_r2c(
+        plan,
+        ffi.cast('float *', in_array.ctypes.data),
+        ffi.cast('fftwf_complex *', out_array.ctypes.data),
+    )
+
+
+def execute_dft_c2r(plan, in_array, out_array):
+    lib.fftwf_execute_dft_c2r(
+        plan,
+        ffi.cast('fftwf_complex *', in_array.ctypes.data),
+        ffi.cast('float *', out_array.ctypes.data),
+    )
+
+
+def plan_r2r(in_array, out_array, kinds, flags):
+    return lib.fftwf_plan_r2r(
+        in_array.ndim,
+        ffi.new('const int []', in_array.shape),
+        ffi.cast('float *', in_array.ctypes.data),
+        ffi.cast('float *', out_array.ctypes.data),
+        ffi.new('const fftwf_r2r_kind []', kinds),
+        flags,
+    )
+
+
+def plan_many_r2r(n, howmany, in_array, istride, idist, out_array, ostride,
+                  odist, kinds, flags):
+    return lib.fftwf_plan_many_r2r(
+        len(n),
+        ffi.new('const int []', n),
+        howmany,
+        ffi.cast('float *', in_array.ctypes.data),
+        ffi.NULL,
+        istride,
+        idist,
+        ffi.cast('float *', out_array.ctypes.data),
+        ffi.NULL,
+        ostride,
+        odist,
+        ffi.new('const fftwf_r2r_kind []', kinds),
+        flags,
+    )
+
+
+def plan_guru_r2r(dims, howmany_dims, in_array, out_array, kinds, flags):
+    return lib.fftwf_plan_guru_r2r(
+        len(dims),
+        ffi.new('const fftwf_iodim []', dims),
+        len(howmany_dims),
+        ffi.new('const fftwf_iodim []', howmany_dims),
+        ffi.cast('float *', in_array.ctypes.data),
+        ffi.cast('float *', out_array.ctypes.data),
+        ffi.new('const fftwf_r2r_kind []', kinds),
+        flags,
+    )
+
+
+def plan_guru64_r2r(dims, howmany_dims, in_array, out_array, kinds, flags):
+    return lib.fftwf_plan_guru64_r2r(
+        len(dims),
+        ffi.new('const fftwf_iodim64 []', dims),
+        len(howmany_dims),
+        ffi.new('const fftwf_iodim64 []', howmany_dims),
+        ffi.cast('float *', in_array.ctypes.data),
+        ffi.cast('float *', out_array.ctypes.data),
+        ffi.new('const fftwf_r2r_kind []', kinds),
+        flags,
+    )
+
+
+def execute_r2r(plan, in_array, out_array):
+    lib.fftwf_execute_r2r(
+        plan,
+        ffi.cast('float *', in_array.ctypes.data),
+        ffi.cast('float *', out_array.ctypes.data),
+    )
+
+
+def dft_pointers(in_array, out_array):
+    return (ffi.cast('fftwf_complex *', in_array.ctypes.data),
+            ffi.cast('fftwf_complex *', out_array.ctypes.data))
+
+
+def dft_r2c_pointers(in_array, out_array):
+    return (ffi.cast('float *', in_array.ctypes.data),
+            ffi.cast('fftwf_complex *', out_array.ctypes.data))
+
+
+def dft_c2r_pointers(in_array, out_array):
+    return (ffi.cast('fftwf_complex *', in_array.ctypes.data),
+            ffi.cast('float *', out_array.ctypes.data))
+
+
+def r2r_pointers(in_array, out_array):
+    return (ffi.cast('float *', in_array.ctypes.data),
+            ffi.cast('float *', out_array.ctypes.data))
+
+
+# New-array execute functions taking the data pointers returned by the
+# functions above. They are the C functions themselves, which spares the
+# Python call and pointer conversions when a plan executes repeatedly on the
+# same arrays.
+execute_dft_pointers = lib.fftwf_execute_dft
+execute_dft_r2c_pointers = lib.fftwf_execute_dft_r2c
+execute_dft_c2r_pointers = lib.fftwf_execute_dft_c2r
+execute_r2r_pointers = lib.fftwf_execute_r2r
+
+
+def scale_factor(n, root=False):
+    return lib.skfftwf_scale_factor(n, root)
+
+
+# Same as the execute functions above, with the n values of the output
+# scaled afterwards within the same C call. The scale factor is given in the
+# precision of the plan, as returned by scale_factor.
+execute_dft_scaled_pointers = lib.skfftwf_execute_dft_scaled
+execute_dft_r2c_scaled_pointers = lib.skfftwf_execute_dft_r2c_scaled
+execute_dft_c2r_scaled_pointers = lib.skfftwf_execute_dft_c2r_scaled
+execute_r2r_scaled_pointers = lib.skfftwf_execute_r2r_scaled
+
+
+# Bound to the C function itself, which does not rely on the globals of this
+# module, so that plans collected at exit are still destroyed once the module
+# has been cleared. Wrapper modules are only imported by the first plan of
+# their precision, hence cleared before the modules holding plans.
+destroy_plan = lib.fftwf_destroy_plan
+
+
+def print_plan(plan):
+    lib.fftwf_print_plan(plan)
+
+
+def sprint_plan(plan):
+    description = lib.fftwf_sprint_plan(plan)
+    if description == ffi.NULL:
+        raise MemoryError('Failed to print plan')
+    try:
+        return ffi.string(description)
+    finally:
+        lib.free(description)
+
+
+def flops(plan):
+    counts = ffi.new('double[3]')
+    lib.fftwf_flops(plan, counts, counts + 1, counts + 2)
+    return counts[0], counts[1], counts[2]
+
+
+def estimate_cost(plan):
+    return lib.fftwf_estimate_cost(plan)
+
+
+def cost(plan):
+    return lib.fftwf_cost(plan)
+
+
+def export_wisdom_to_filename(filename):
+    return bool(lib.fftwf_export_wisdom_to_filename(filename))
+
+
+def export_wisdom_to_string():
+    wisdom = lib.fftwf_export_wisdom_to_string()
+    if wisdom == ffi.NULL:
+        raise MemoryError('Failed to export wisdom')
+    try:
+        return ffi.string(wisdom)
+    finally:
+        lib.free(wisdom)
+
+
+def import_system_wisdom():
+    return bool(lib.fftwf_import_system_wisdom())
+
+
+def import_wisdom_from_filename(filename):
+    return bool(lib.fftwf_import_wisdom_from_filename(filename))
+
+
+def import_wisdom_from_string(wisdom):
+    return bool(lib.fftwf_import_wisdom_from_string(wisdom))
+
+
+def forget_wisdom():
+    lib.fftwf_forget_wisdom()
+
+
+def set_timelimit(seconds):
+    # None stands for FFTW_NO_TIMELIMIT, a floating point macro
+    lib.fftwf_set_timelimit(-1.0 if seconds is None else seconds)
+
+
+def alignment_of(array):
+    return lib.fftwf_alignment_of(ffi.cast('float *', array.ctypes.data))
+
+
+def init_threads():
+    return bool(lib.fftwf_init_threads())
+
+
+def plan_with_nthreads(nthreads):
+    lib.fftwf_plan_with_nthreads(nthreads)
+
+
+def cleanup_threads():
+    lib.fftwf_cleanup_threads()
\ No newline at end of file
@@ -0,0 +1,28 @@
+# coding: utf8
+
+# Copyright (c) 2014, 2015 Ghislain Antony Vaillant.
+#
+# This file is distributed under the new BSD License, see the LICENSE file or
+# checkout the license terms at http://opensource.org/licenses/BSD-3-Clause).
+
+from skfftw import wisdom
+import os
+import pytest
+
+
+@pytest.fixture(scope='session', autouse=True)
+def wisdom_cache(tmp_path_factory):
+    """
+    Keep the wisdom cache of the tests away from the cache of the user.
+
+    The tests start from an empty cache, and the wisdom they accumulate is
+    saved before the directory is restored, instead of on exit.
+    """
+    saved_directory = os.environ.get('SKFFTW_WISDOM_DIR')
+    os.environ['SKFFTW_WISDOM_DIR'] = str(tmp_path_factory.mktemp('wisdom'))
+    yield
+    wisdom.save_cache()
+    if saved_directory is None:
+        del os.environ['SKFFTW_WISDOM_DIR']
+    else:
+        os.environ['SKFFTW_WISDOM_DIR'] = saved_directory
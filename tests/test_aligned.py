@@ -0,0 +1,55 @@
+# coding: utf8
+
+# Copyright (c) 2014, 2015 Ghislain Antony Vaillant.
+#
+# This file is distributed under the new BSD License, see the LICENSE file or
+# checkout the license terms at http://opensource.org/licenses/BSD-3-Clause).
+
+from skfftw import byte_align, empty_aligned, zeros_aligned
+from skfftw.aligned import is_aligned, simd_alignment
+import numpy
+import pytest
+
+
+def address(array):
+    return array.__array_interface__['data'][0]
+
+
+class TestAligned():
+
+    @pytest.mark.parametrize('n', [None, 16, 32, 4096])
+    @pytest.mark.parametrize('shape', [7, (3, 5), (2, 1, 4)])
+    def test_empty_aligned(self, shape, n):
+        array = empty_aligned(shape, numpy.complex64, n=n)
+        assert array.shape == numpy.empty(shape).shape
+        assert array.dtype == numpy.complex64
+        assert array.flags.c_contiguous and array.flags.writeable
+        assert address(array) % (n or simd_alignment) == 0
+
+    def test_empty(self):
+        assert empty_aligned((0, 4), numpy.complex64).shape == (0, 4)
+
+    def test_fortran_order(self):
+        array = empty_aligned((3, 5), order='F')
+        assert array.flags.f_contiguous
+        assert is_aligned(array)
+
+    def test_zeros_aligned(self):
+        array = zeros_aligned((4, 6), numpy.float32, n=32)
+        assert not array.any()
+        assert is_aligned(array, 32)
+
+    def test_byte_align(self):
+        buffer = empty_aligned(8 * 17, numpy.uint8)
+        misaligned = buffer[8:].view(numpy.float64)
+        misaligned[:] = numpy.arange(16)
+        assert not is_aligned(misaligned)
+        aligned = byte_align(misaligned)
+        assert is_aligned(aligned)
+        assert numpy.array_equal(aligned, misaligned)
+        assert byte_align(aligned) is aligned
+        assert byte_align(aligned, dtype=numpy.float32).dtype == numpy.float32
+
+    def test_invalid_alignment(self):
+        with pytest.raises(ValueError):
+            empty_aligned(4, n=0)
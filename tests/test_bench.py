@@ -0,0 +1,61 @@
+# coding: utf8
+
+# Copyright (c) 2014, 2015 Ghislain Antony Vaillant.
+#
+# This file is distributed under the new BSD License, see the LICENSE file or
+# checkout the license terms at http://opensource.org/licenses/BSD-3-Clause).
+
+from skfftw import bench
+import json
+
+
+class TimeSmall(object):
+
+    params = [1, 2]
+    param_names = ['n']
+
+    def setup(self, n):
+        if n == 2:
+            raise NotImplementedError
+
+    def time_noop(self, n):
+        pass
+
+    def time_other(self, n):
+        pass
+
+
+def test_run():
+    results = bench.run([TimeSmall], pattern='noop', repeat=1, min_time=1e-4,
+                        output=None)
+    assert len(results) == 1
+    assert results[0]['benchmark'] == 'TimeSmall.time_noop'
+    assert results[0]['params'] == {'n': 1}
+    assert results[0]['seconds'] > 0
+
+
+def test_main(tmpdir):
+    output = str(tmpdir.join('results.json'))
+    bench.main(['-o', output, '-b', r'TimeCallOverhead\.time_execute$',
+                '-r', '1', '-t', '1e-3'])
+    with open(output) as f:
+        document = json.load(f)
+    assert document['versions']['skfftw'] == bench.VERSION
+    assert [result['params']['n'] for result in document['results']] == [
+        64, 256, 1024]
+
+
+class TimeRaw(object):
+
+    def timeraw_statement(self):
+        return 'x = 1'
+
+    def timeraw_setup(self):
+        return 'y = x', 'x = 1'
+
+
+def test_run_raw():
+    results = bench.run([TimeRaw], repeat=1, output=None)
+    assert [result['benchmark'] for result in results] == [
+        'TimeRaw.timeraw_setup', 'TimeRaw.timeraw_statement']
+    assert all(result['number'] == 1 for result in results)
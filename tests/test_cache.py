@@ -0,0 +1,136 @@
+# coding: utf8
+
+# Copyright (c) 2014, 2015 Ghislain Antony Vaillant.
+#
+# This file is distributed under the new BSD License, see the LICENSE file or
+# checkout the license terms at http://opensource.org/licenses/BSD-3-Clause).
+
+from skfftw import empty_aligned
+from skfftw.cache import PlanCache
+from skfftw.fftw import Plan, R2RPlan, RealPlan
+from skfftw.enums import Direction, Flag, R2RKind
+import gc
+import numpy
+import pytest
+import time
+import weakref
+
+
+def random_array(shape):
+    return numpy.random.randn(*shape) + 1j * numpy.random.randn(*shape)
+
+
+class TestPlanCache():
+
+    def setup_method(self, method):
+        self.cache = PlanCache(maxsize=2)
+
+    def test_hit(self):
+        input_array = random_array([16, 16])
+        output_array = numpy.empty_like(input_array)
+        plan = self.cache.get(Plan, input_array, output_array)
+        other_input_array = random_array([16, 16])
+        other_output_array = numpy.empty_like(input_array)
+        assert self.cache.get(Plan, other_input_array,
+                              other_output_array) is plan
+        info = self.cache.info()
+        assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+        assert numpy.allclose(plan(other_input_array, other_output_array),
+                              numpy.fft.fft2(other_input_array))
+
+    def test_miss_on_parameters(self):
+        input_array = random_array([16, 16])
+        output_array = numpy.empty_like(input_array)
+        plan = self.cache.get(Plan, input_array, output_array)
+        assert self.cache.get(Plan, input_array, output_array,
+                              direction=Direction.backward) is not plan
+        assert self.cache.get(Plan, input_array, output_array,
+                              axes=(1,)) is not plan
+        assert self.cache.info().misses == 3
+
+    def test_miss_on_layout(self):
+        input_array = random_array([16, 16])
+        plan = self.cache.get(Plan, input_array, numpy.empty_like(input_array))
+        assert self.cache.get(Plan, input_array, input_array) is not plan
+        assert self.cache.get(Plan, input_array[:8],
+                              numpy.empty([8, 16], complex)) is not plan
+
+    def test_lru_eviction(self):
+        arrays = [random_array([n]) for n in (8, 16, 32)]
+        plans = [self.cache.get(Plan, a, numpy.empty_like(a)) for a in arrays]
+        info = self.cache.info()
+        assert (info.evictions, info.currsize) == (1, 2)
+        # the evicted plan is still usable by its owner
+        assert numpy.allclose(plans[0](arrays[0], numpy.empty_like(arrays[0])),
+                              numpy.fft.fft(arrays[0]))
+        assert self.cache.get(Plan, arrays[2],
+                              numpy.empty_like(arrays[2])) is plans[2]
+        assert self.cache.get(Plan, arrays[0],
+                              numpy.empty_like(arrays[0])) is not plans[0]
+
+    def test_ttl_eviction(self):
+        self.cache.configure(ttl=0.01)
+        input_array = random_array([16])
+        plan = self.cache.get(Plan, input_array, numpy.empty_like(input_array))
+        time.sleep(0.02)
+        assert self.cache.get(Plan, input_array,
+                              numpy.empty_like(input_array)) is not plan
+        assert self.cache.info().evictions == 1
+
+    def test_measure_preserves_input(self):
+        input_array = numpy.random.randn(64)
+        saved_input = input_array.copy()
+        output_array = numpy.empty(33, dtype=numpy.complex128)
+        self.cache.get(RealPlan, input_array, output_array,
+                       flags=(Flag.measure,))
+        assert numpy.array_equal(input_array, saved_input)
+
+    def test_unhashable_arguments(self):
+        array = numpy.random.randn(4, 8)
+        plan = self.cache.get(R2RPlan, array, array,
+                              kinds=[R2RKind.redft10, R2RKind.redft01])
+        assert self.cache.get(R2RPlan, array, array,
+                              kinds=(R2RKind.redft10,
+                                     R2RKind.redft01)) is plan
+        assert self.cache.get(R2RPlan, array, array, axes=[0, 1],
+                              kinds=[R2RKind.redft10,
+                                     R2RKind.redft01]) is plan
+        assert self.cache.get(Plan, random_array([8]),
+                              numpy.empty(8, complex),
+                              flags=[Flag.estimate]) is not None
+
+    def test_caller_arrays_released(self):
+        input_array = random_array([16])
+        output_array = numpy.empty_like(input_array)
+        references = [weakref.ref(input_array), weakref.ref(output_array)]
+        plan = self.cache.get(Plan, input_array, output_array)
+        assert not numpy.shares_memory(plan.input_array, input_array)
+        assert plan.transform(input_array, output_array) is output_array
+        assert numpy.allclose(output_array, numpy.fft.fft(input_array))
+        assert self.cache.get(Plan, input_array, output_array) is plan
+        del input_array, output_array
+        gc.collect()
+        assert [reference() for reference in references] == [None, None]
+
+    def test_misaligned_arrays(self):
+        # offset an aligned buffer by half the SIMD alignment of FFTW
+        misaligned = empty_aligned(16 * 16 + 8, numpy.uint8)[8:].view(complex)
+        misaligned[:] = random_array([16])
+        plan = self.cache.get(Plan, misaligned, numpy.empty_like(misaligned))
+        assert not plan.aligned
+        assert numpy.allclose(plan(misaligned, numpy.empty_like(misaligned)),
+                              numpy.fft.fft(misaligned))
+        aligned_plan = self.cache.get(Plan, empty_aligned(16, complex),
+                                      empty_aligned(16, complex))
+        assert aligned_plan.aligned
+
+    def test_clear(self):
+        input_array = random_array([16])
+        self.cache.get(Plan, input_array, numpy.empty_like(input_array))
+        self.cache.clear()
+        assert len(self.cache) == 0
+        assert self.cache.info().misses == 0
+
+    def test_invalid_size(self):
+        with pytest.raises(ValueError):
+            self.cache.configure(maxsize=-1)
@@ -0,0 +1,103 @@
+# coding: utf8
+
+# Copyright (c) 2014, 2015 Ghislain Antony Vaillant.
+#
+# This file is distributed under the new BSD License, see the LICENSE file or
+# checkout the license terms at http://opensource.org/licenses/BSD-3-Clause).
+
+from skfftw import convolve
+import numpy
+import pytest
+
+
+modes = ['full', 'same', 'valid']
+functions = [convolve.fftconvolve, convolve.oaconvolve]
+
+
+def assert_close(actual, expected, dtype=numpy.float64):
+    assert actual.shape == expected.shape
+    tolerance = 1e-4 if numpy.dtype(dtype).itemsize <= 8 else 1e-10
+    assert numpy.allclose(actual, expected, rtol=tolerance,
+                          atol=tolerance * numpy.abs(expected).max())
+
+
+class TestConvolve():
+
+    @pytest.mark.parametrize('function', functions)
+    @pytest.mark.parametrize('mode', modes)
+    @pytest.mark.parametrize('sizes', [(5000, 31), (31, 5000), (64, 64)])
+    def test_1d(self, function, mode, sizes):
+        in1, in2 = numpy.random.randn(sizes[0]), numpy.random.randn(sizes[1])
+        expected = numpy.convolve(in1, in2, mode)
+        if mode == 'same':
+            expected = numpy.convolve(in1, in2)[(sizes[1] - 1) // 2:][
+                :sizes[0]]
+        assert_close(function(in1, in2, mode), expected)
+
+    @pytest.mark.parametrize('function', functions)
+    @pytest.mark.parametrize('dtype', [numpy.float32, numpy.complex64,
+                                       numpy.complex128])
+    def test_dtypes(self, function, dtype):
+        in1 = numpy.random.randn(3000).astype(dtype)
+        in2 = numpy.random.randn(20).astype(dtype)
+        output = function(in1, in2)
+        assert output.dtype == dtype
+        assert_close(output, numpy.convolve(in1, in2), dtype)
+
+    @pytest.mark.parametrize('function', functions)
+    @pytest.mark.parametrize('mode', modes)
+    def test_nd(self, function, mode):
+        signal = pytest.importorskip('scipy.signal')
+        in1 = numpy.random.randn(300, 200)
+        in2 = numpy.random.randn(7, 9)
+        expected = signal.convolve(in1, in2, mode, method='direct')
+        assert_close(function(in1, in2, mode), expected)
+
+    @pytest.mark.parametrize('function', functions)
+    def test_axes(self, function):
+        in1 = numpy.random.randn(2000, 3)
+        in2 = numpy.random.randn(40, 1)
+        output = function(in1, in2, axes=0, threads=2)
+        for j in range(3):
+            assert_close(output[:, j], numpy.convolve(in1[:, j], in2[:, 0]))
+
+    def test_blocks(self):
+        assert convolve._block_size(1000000, 513) is not None
+        assert convolve._block_size(100, 90) is None
+
+    def test_kernel_spectrum_cached(self):
+        kernel = numpy.random.randn(33)
+        convolve.oaconvolve(numpy.random.randn(4000), kernel)
+        spectra = len(convolve._kernel_spectra)
+        convolve.oaconvolve(numpy.random.randn(4000), kernel)
+        assert len(convolve._kernel_spectra) == spectra
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            convolve.fftconvolve(numpy.ones(8), numpy.ones(3), mode='middle')
+        with pytest.raises(ValueError):
+            convolve.oaconvolve(numpy.ones(8), numpy.ones((3, 1)))
+        with pytest.raises(ValueError):
+            convolve.oaconvolve(numpy.ones((8, 2)), numpy.ones((2, 8)),
+                                mode='valid')
+
+
+class TestCorrelate():
+
+    @pytest.mark.parametrize('mode', modes)
+    def test_1d(self, mode):
+        in1 = numpy.random.randn(4000) + 1j * numpy.random.randn(4000)
+        in2 = numpy.random.randn(25) + 1j * numpy.random.randn(25)
+        assert_close(convolve.correlate(in1, in2, mode),
+                     numpy.correlate(in1, in2, mode))
+
+
+class TestNextFastLen():
+
+    def test_sizes(self):
+        assert convolve.next_fast_len(1) == 1
+        assert convolve.next_fast_len(97) == 98
+        assert convolve.next_fast_len(1025) == 1029
+        assert convolve.next_fast_len(1000001) == 1000188
+        with pytest.raises(ValueError):
+            convolve.next_fast_len(0)
@@ -0,0 +1,70 @@
+# coding: utf8
+
+# Copyright (c) 2014, 2015 Ghislain Antony Vaillant.
+#
+# This file is distributed under the new BSD License, see the LICENSE file or
+# checkout the license terms at http://opensource.org/licenses/BSD-3-Clause).
+
+from skfftw import available_precisions
+from skfftw.wrappers import is_loaded, load_library
+import numpy as np
+import pytest
+import subprocess
+import sys
+
+
+def imported_modules(code):
+    script = code + '\nimport sys\nprint(" ".join(sys.modules))'
+    output = subprocess.check_output([sys.executable, '-c', script])
+    return output.decode().split()
+
+
+def test_enums_without_libraries():
+    modules = imported_modules('import skfftw, skfftw.enums')
+    assert 'skfftw.bindings._constants_cffi' in modules
+    assert 'skfftw.bindings._fftw_cffi' not in modules
+
+
+def test_fftw_without_libraries():
+    modules = imported_modules('import skfftw.fftw')
+    assert not [name for name in modules
+                if name.startswith('skfftw.bindings._fftw')]
+
+
+def test_plan_loads_its_precision_only():
+    modules = imported_modules(
+        'import numpy as np\n'
+        'from skfftw.fftw import Plan\n'
+        'a = np.zeros(16, np.csingle)\n'
+        'Plan(a, a.copy())')
+    assert 'skfftw.bindings._fftwf_cffi' in modules
+    assert 'skfftw.bindings._fftw_cffi' not in modules
+    assert 'skfftw.bindings._fftwl_cffi' not in modules
+
+
+def test_available_precisions():
+    precisions = available_precisions()
+    assert 'double' in precisions
+    assert set(precisions) <= set(['single', 'double', 'longdouble'])
+    for precision in precisions:
+        library = load_library(np.dtype(precision))
+        assert load_library(np.dtype('c' + precision)) is library
+
+
+def test_is_loaded():
+    modules = imported_modules(
+        'import numpy as np\n'
+        'from skfftw.wrappers import is_loaded\n'
+        'assert not is_loaded(np.csingle)\n'
+        'from skfftw.fftw import Plan\n'
+        'a = np.zeros(16, np.csingle)\n'
+        'Plan(a, a.copy())\n'
+        'assert is_loaded(np.single)')
+    assert 'skfftw.bindings._fftw_cffi' not in modules
+    with pytest.raises(ValueError):
+        is_loaded(np.int32)
+
+
+def test_load_library_unsupported_dtype():
+    with pytest.raises(ValueError):
+        load_library(np.int32)
@@ -0,0 +1,200 @@
+# coding: utf8
+
+# Copyright (c) 2014, 2015 Ghislain Antony Vaillant.
+#
+# This file is distributed under the new BSD License, see the LICENSE file or
+# checkout the license terms at http://opensource.org/licenses/BSD-3-Clause).
+
+from skfftw import cache
+from skfftw.interfaces import numpy_fft
+import gc
+import numpy
+import pytest
+import weakref
+
+
+real_dtypes = [numpy.float32, numpy.float64, numpy.int64]
+dtypes = real_dtypes + [numpy.complex64, numpy.complex128]
+shapes = [(64,), (63,), (8, 30), (3, 4, 10)]
+norms = [None, 'backward', 'ortho', 'forward']
+
+
+def random_array(shape, dtype):
+    array = numpy.random.randn(*shape)
+    if numpy.dtype(dtype).kind == 'c':
+        array = array + 1j * numpy.random.randn(*shape)
+    elif numpy.dtype(dtype).kind == 'i':
+        array = numpy.round(10 * array)
+    return array.astype(dtype)
+
+
+def assert_matches(actual, expected):
+    assert actual.shape == expected.shape
+    assert actual.dtype == expected.dtype
+    single = expected.dtype in (numpy.float32, numpy.complex64)
+    tolerance = 1e-4 if single else 1e-10
+    assert numpy.allclose(actual, expected, rtol=tolerance,
+                          atol=tolerance * numpy.abs(expected).max())
+
+
+class TestOneDimensional():
+
+    @pytest.mark.parametrize('name', ['fft', 'ifft'])
+    @pytest.mark.parametrize('dtype', dtypes)
+    @pytest.mark.parametrize('shape', shapes)
+    def test_complex(self, name, dtype, shape):
+        a = random_array(shape, dtype)
+        assert_matches(getattr(numpy_fft, name)(a),
+                       getattr(numpy.fft, name)(a))
+
+    @pytest.mark.parametrize('name', ['rfft', 'ihfft'])
+    @pytest.mark.parametrize('dtype', real_dtypes)
+    @pytest.mark.parametrize('shape', shapes)
+    def test_real(self, name, dtype, shape):
+        a = random_array(shape, dtype)
+        assert_matches(getattr(numpy_fft, name)(a),
+                       getattr(numpy.fft, name)(a))
+
+    @pytest.mark.parametrize('name', ['irfft', 'hfft'])
+    @pytest.mark.parametrize('dtype', [numpy.complex64, numpy.complex128])
+    @pytest.mark.parametrize('shape', [(33,), (8, 16)])
+    def test_inverse_real(self, name, dtype, shape):
+        a = random_array(shape, dtype)
+        assert_matches(getattr(numpy_fft, name)(a),
+                       getattr(numpy.fft, name)(a))
+
+    @pytest.mark.parametrize('name', ['fft', 'ifft', 'rfft', 'irfft', 'hfft',
+                                      'ihfft'])
+    @pytest.mark.parametrize('n', [20, 32, 45])
+    @pytest.mark.parametrize('axis', [0, -1])
+    def test_size_and_axis(self, name, n, axis):
+        a = random_array((32, 12), numpy.float64)
+        assert_matches(getattr(numpy_fft, name)(a, n, axis),
+                       getattr(numpy.fft, name)(a, n, axis))
+
+    @pytest.mark.parametrize('name', ['fft', 'ifft', 'rfft', 'irfft', 'hfft',
+                                      'ihfft'])
+    @pytest.mark.parametrize('norm', norms)
+    def test_norm(self, name, norm):
+        a = random_array((30,), numpy.float64)
+        assert_matches(getattr(numpy_fft, name)(a, norm=norm),
+                       getattr(numpy.fft, name)(a, norm=norm))
+
+    def test_input_is_preserved(self):
+        a = random_array((16, 30), numpy.complex128)
+        saved = a.copy()
+        numpy_fft.irfft(a)
+        numpy_fft.fft(a, 20)
+        assert numpy.array_equal(a, saved)
+
+    def test_non_contiguous_input(self):
+        a = random_array((16, 30), numpy.complex128)[::2, ::3]
+        assert_matches(numpy_fft.fft(a, axis=0), numpy.fft.fft(a, axis=0))
+
+    @pytest.mark.parametrize('name', ['fft', 'rfft', 'ihfft'])
+    def test_half_precision(self, name):
+        a = random_array((16,), numpy.float16)
+        assert_matches(getattr(numpy_fft, name)(a),
+                       getattr(numpy.fft, name)(a))
+
+    def test_complex_input_to_real_transform(self):
+        with pytest.raises(TypeError):
+            numpy_fft.rfft(random_array((16,), numpy.complex128))
+
+    @pytest.mark.parametrize('name', ['fft', 'rfft', 'irfft'])
+    def test_arrays_released(self, name):
+        a = random_array((1024,), numpy.complex128 if name == 'irfft' else
+                         numpy.float64)
+        result = getattr(numpy_fft, name)(a)
+        references = [weakref.ref(a), weakref.ref(result)]
+        del a, result
+        gc.collect()
+        assert [reference() for reference in references] == [None, None]
+
+    def test_invalid_size(self):
+        with pytest.raises(ValueError):
+            numpy_fft.fft(numpy.ones(8), 0)
+        with pytest.raises(ValueError):
+            numpy_fft.irfft(numpy.ones(1))
+
+    def test_invalid_norm(self):
+        with pytest.raises(ValueError):
+            numpy_fft.fft(numpy.ones(8), norm='full')
+
+    def test_plans_are_reused(self):
+        a = random_array((48,), numpy.complex128)
+        numpy_fft.fft(a)
+        hits = cache.cache_info().hits
+        numpy_fft.fft(random_array((48,), numpy.complex128))
+        assert cache.cache_info().hits == hits + 1
+
+
+class TestMultiDimensional():
+
+    @pytest.mark.parametrize('name', ['fftn', 'ifftn', 'rfftn', 'irfftn'])
+    @pytest.mark.parametrize('dtype', [numpy.float32, numpy.float64])
+    @pytest.mark.parametrize('shape', [(16, 30), (4, 6, 10)])
+    def test_default(self, name, dtype, shape):
+        a = random_array(shape, dtype)
+        assert_matches(getattr(numpy_fft, name)(a),
+                       getattr(numpy.fft, name)(a))
+
+    @pytest.mark.parametrize('name', ['fft2', 'ifft2', 'rfft2', 'irfft2'])
+    @pytest.mark.parametrize('norm', norms)
+    def test_two_dimensional(self, name, norm):
+        a = random_array((3, 12, 10), numpy.float64)
+        assert_matches(getattr(numpy_fft, name)(a, norm=norm),
+                       getattr(numpy.fft, name)(a, norm=norm))
+
+    @pytest.mark.parametrize('name', ['fftn', 'ifftn', 'rfftn', 'irfftn'])
+    @pytest.mark.parametrize('s, axes', [((8, 20), (0, 2)),
+                                         ((12, 16), None),
+                                         (None, (2, 0)),
+                                         ((6,), (1,))])
+    def test_shape_and_axes(self, name, s, axes):
+        a = random_array((10, 12, 14), numpy.complex128)
+        if name == 'rfftn':
+            a = a.real
+        assert_matches(getattr(numpy_fft, name)(a, s, axes),
+                       getattr(numpy.fft, name)(a, s, axes))
+
+    @pytest.mark.parametrize('name', ['fftn', 'rfftn', 'irfftn'])
+    def test_out(self, name):
+        a = random_array((8, 10), numpy.complex128)
+        if name == 'rfftn':
+            a = a.real
+        expected = getattr(numpy.fft, name)(a)
+        out = numpy.empty_like(expected)
+        assert getattr(numpy_fft, name)(a, out=out) is out
+        assert_matches(out, expected)
+        fortran_out = numpy.empty(expected.shape, expected.dtype, order='F')
+        getattr(numpy_fft, name)(a, out=fortran_out)
+        assert_matches(fortran_out, expected)
+
+    def test_foreign_arrays(self):
+        a = random_array((8, 10), numpy.complex128)
+        out = numpy.empty_like(a)
+        result = numpy_fft.fftn(memoryview(a), out=memoryview(out))
+        assert numpy.shares_memory(result, out)
+        assert_matches(out, numpy.fft.fftn(a))
+        read_only = numpy.empty_like(a)
+        read_only.flags.writeable = False
+        with pytest.raises(ValueError):
+            numpy_fft.fftn(a, out=memoryview(read_only))
+
+    def test_strided_out(self):
+        a = random_array((8, 10), numpy.complex128)
+        out = numpy.empty((16, 20), numpy.complex128)[::2, ::2]
+        assert numpy_fft.fftn(a, out=out) is out
+        assert_matches(out, numpy.fft.fftn(a))
+
+    def test_invalid_out(self):
+        with pytest.raises(ValueError):
+            numpy_fft.fftn(numpy.ones([8, 10]),
+                           out=numpy.empty([8, 8], complex))
+
+    def test_empty_batch(self):
+        a = numpy.empty((0, 16))
+        assert numpy_fft.fft(a).shape == (0, 16)
+        assert numpy_fft.rfft(a).shape == (0, 9)
+        assert numpy_fft.irfft(numpy_fft.rfft(a)).shape == (0, 16)
@@ -0,0 +1,107 @@
+# coding: utf8
+
+# Copyright (c) 2014, 2015 Ghislain Antony Vaillant.
+#
+# This file is distributed under the new BSD License, see the LICENSE file or
+# checkout the license terms at http://opensource.org/licenses/BSD-3-Clause).
+
+from skfftw import empty_aligned, ooc
+from skfftw.enums import Direction, Flag, Normalization
+from skfftw.fftw import Plan
+import numpy
+import pytest
+
+
+def memmap(tmpdir, name, array):
+    mapped = numpy.memmap(str(tmpdir.join(name)), array.dtype, 'w+',
+                          shape=array.shape)
+    mapped[...] = array
+    return mapped
+
+
+def random_array(shape, dtype=numpy.cdouble):
+    array = numpy.random.randn(*shape) + 1j * numpy.random.randn(*shape)
+    return array.astype(dtype)
+
+
+class TestFFTN():
+
+    @pytest.mark.parametrize('shape', [(40, 33, 16), (7, 128), (3, 5, 4, 6)])
+    @pytest.mark.parametrize('dtype', [numpy.csingle, numpy.cdouble])
+    def test_fftn(self, tmpdir, shape, dtype):
+        x = random_array(shape, dtype)
+        src = memmap(tmpdir, 'src', x)
+        dst = memmap(tmpdir, 'dst', numpy.zeros(shape, dtype))
+        assert ooc.fftn(src, dst, memory_budget=1 << 16) is dst
+        rtol = 1e-4 if dtype == numpy.csingle else 1e-10
+        assert numpy.allclose(dst, numpy.fft.fftn(x), rtol=rtol,
+                              atol=rtol * x.size)
+
+    def test_memory_budget(self, tmpdir):
+        x = random_array((40, 33, 16))
+        src = memmap(tmpdir, 'src', x)
+        in_core = numpy.empty_like(x)
+        ooc.fftn(x, in_core, memory_budget=1 << 30)
+        for budget in (2 * 40 * 16 * 16, 1 << 16, 1 << 18):
+            dst = memmap(tmpdir, 'dst{}'.format(budget), numpy.zeros_like(x))
+            ooc.fftn(src, dst, memory_budget=budget)
+            assert numpy.array_equal(dst, in_core)
+
+    @pytest.mark.parametrize('flags', [(Flag.estimate,), (Flag.measure,)])
+    def test_thinner_last_slab(self, tmpdir, flags):
+        # slabs of 5 sheets of 64 x 48 values, the last one holding 2, for
+        # which the wisdom holds measured plans, usually of other algorithms
+        for axis in (2, 1):
+            scratch = empty_aligned((2, 64, 48), numpy.cdouble)
+            Plan(scratch, scratch, flags=(Flag.measure,), axes=(axis,))
+        x = random_array((37, 64, 48))
+        src = memmap(tmpdir, 'src', x)
+        dst = memmap(tmpdir, 'dst', numpy.zeros_like(x))
+        ooc.fftn(src, dst, axes=(1, 2), memory_budget=2 * 5 * 64 * 48 * 16,
+                 flags=flags)
+        # each slab transformed in memory by the plan of a full slab
+        in_core = empty_aligned((40, 64, 48), x.dtype)
+        in_core[:37] = x
+        in_core[37:] = 0
+        for axis in (2, 1):
+            scratch = empty_aligned((5, 64, 48), x.dtype)
+            plan = Plan(scratch, scratch, flags=flags, axes=(axis,))
+            for start in range(0, 40, 5):
+                plan.transform(in_core[start:start + 5],
+                               in_core[start:start + 5])
+        assert numpy.array_equal(dst, in_core[:37])
+        assert numpy.allclose(dst, numpy.fft.fftn(x, axes=(1, 2)))
+
+    def test_memory_budget_too_small(self):
+        x = random_array((40, 33, 16))
+        budget = 2 * 40 * 16 * 16 - 1
+        with pytest.raises(ValueError):
+            ooc.fftn(x, numpy.empty_like(x), memory_budget=budget)
+
+    def test_axes_normalization(self, tmpdir):
+        x = random_array((12, 10, 8))
+        dst = memmap(tmpdir, 'dst', x)
+        ooc.fftn(dst, dst, axes=(0, 2), memory_budget=1 << 12,
+                 normalization=Normalization.full)
+        assert numpy.allclose(dst, numpy.fft.fftn(x, axes=(0, 2)) / 96)
+        ooc.fftn(dst, dst, axes=(0, 2), memory_budget=1 << 12,
+                 direction=Direction.backward)
+        assert numpy.allclose(dst, x)
+
+    def test_real_input(self, tmpdir):
+        x = numpy.random.randn(16, 24)
+        src = memmap(tmpdir, 'src', x)
+        dst = memmap(tmpdir, 'dst', numpy.zeros(x.shape, numpy.cdouble))
+        ooc.fftn(src, dst, memory_budget=1 << 12)
+        assert numpy.allclose(dst, numpy.fft.fftn(x))
+
+    def test_invalid_arrays(self):
+        x = random_array((8, 8))
+        with pytest.raises(ValueError):
+            ooc.fftn(x, numpy.empty((8, 4), x.dtype))
+        with pytest.raises(ValueError):
+            ooc.fftn(x[0], numpy.empty(8, x.dtype))
+        with pytest.raises(ValueError):
+            ooc.fftn(x, numpy.empty((8, 8)))
+        with pytest.raises(ValueError):
+            ooc.fftn(x, numpy.empty_like(x), normalization='full')
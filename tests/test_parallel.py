@@ -0,0 +1,158 @@
+# coding: utf8
+
+# Copyright (c) 2014, 2015 Ghislain Antony Vaillant.
+#
+# This file is distributed under the new BSD License, see the LICENSE file or
+# checkout the license terms at http://opensource.org/licenses/BSD-3-Clause).
+
+from skfftw import wisdom
+from skfftw.enums import Flag
+from skfftw.fftw import Plan
+import gc
+import numpy
+import pytest
+
+pytest.importorskip('multiprocessing.shared_memory')
+
+from skfftw import parallel
+
+
+def random_complex(*shape):
+    return numpy.random.randn(*shape) + 1j * numpy.random.randn(*shape)
+
+
+def worker_wisdom(n):
+    """
+    Generation of the wisdom imported by a worker, and whether it holds a
+    measured plan of size n.
+    """
+    a = numpy.empty(n, numpy.cdouble)
+    try:
+        Plan(a, numpy.empty_like(a), flags=(Flag.measure, Flag.wisdom_only))
+    except RuntimeError:
+        return parallel._worker_wisdom_generation, False
+    return parallel._worker_wisdom_generation, True
+
+
+class TestProcessExecutor():
+
+    def setup_method(self, method):
+        self.executor = parallel.ProcessExecutor(processes=2)
+
+    def teardown_method(self, method):
+        self.executor.shutdown()
+
+    @pytest.mark.parametrize('transform', ['fftn', 'ifftn'])
+    def test_complex(self, transform):
+        arrays = [random_complex(16, 12) for _ in range(6)]
+        results = self.executor.map(transform, arrays)
+        for a, result in zip(arrays, results):
+            assert numpy.allclose(result, getattr(numpy.fft, transform)(a))
+            assert parallel._shared_block(result) is not None
+
+    def test_real(self):
+        a = numpy.random.randn(16, 12).astype(numpy.single)
+        spectrum = self.executor.submit('rfftn', a, axes=(1,)).result()
+        assert spectrum.dtype == numpy.csingle
+        assert numpy.allclose(spectrum, numpy.fft.rfftn(a, axes=(1,)),
+                              atol=1e-4)
+        result = self.executor.submit('irfftn', spectrum, s=(12,),
+                                      axes=(1,)).result()
+        assert result.dtype == numpy.single
+        assert numpy.allclose(result, a, atol=1e-5)
+
+    def test_norm(self):
+        a = random_complex(32)
+        result = self.executor.submit('fftn', a, norm='ortho').result()
+        assert numpy.allclose(result, numpy.fft.fftn(a, norm='ortho'))
+
+    def test_shared_input(self):
+        a = self.executor.empty((8, 8), numpy.cdouble)
+        a[...] = random_complex(8, 8)
+        assert parallel._shared_block(a) is not None
+        assert parallel._shared_block(a[1:]) is None
+        result = self.executor.submit('fftn', a).result()
+        assert numpy.allclose(result, numpy.fft.fftn(a))
+
+    def test_copies_reused(self):
+        a = random_complex(8, 8)
+        self.executor.submit('fftn', a).result()
+        block = self.executor._free_blocks[a.shape, a.dtype.str][0]
+        result = self.executor.submit('fftn', a).result()
+        assert self.executor._free_blocks[a.shape, a.dtype.str] == [block]
+        assert numpy.allclose(result, numpy.fft.fftn(a))
+
+    def test_failure(self):
+        future = self.executor.submit('fftn', numpy.zeros((4, 4), object))
+        with pytest.raises(Exception):
+            future.result()
+
+    def test_invalid_transform(self):
+        with pytest.raises(ValueError):
+            self.executor.submit('dct', random_complex(8))
+
+    def test_broadcast_wisdom(self):
+        a = random_complex(64)
+        Plan(a, numpy.empty_like(a))
+        prefix = self.executor._wisdom_prefix
+        generation = self.executor._wisdom_generation
+        self.executor.broadcast_wisdom()
+        assert self.executor._wisdom_generation == generation + 1
+        parallel._import_wisdom(prefix, generation)
+        assert parallel._worker_wisdom_generation is None
+        parallel._import_wisdom(prefix, generation + 1)
+        assert parallel._worker_wisdom_generation == generation + 1
+        parallel._worker_wisdom_generation = None
+
+    def test_worker_imports_wisdom(self):
+        executor = parallel.ProcessExecutor(processes=1)
+        try:
+            # planned after the worker started, hence unknown to it
+            a = random_complex(1201)
+            Plan(a, numpy.empty_like(a), flags=(Flag.measure,))
+            assert executor._pool.apply(worker_wisdom, (1201,)) == (None,
+                                                                   False)
+            executor.broadcast_wisdom()
+            executor.submit('fftn', random_complex(8)).result()
+            assert executor._pool.apply(worker_wisdom, (1201,)) == (2, True)
+        finally:
+            executor.shutdown()
+
+    def test_wisdom_released_when_collected(self):
+        from multiprocessing import shared_memory
+        executor = parallel.ProcessExecutor(processes=1)
+        executor._pool.close()
+        executor._pool.join()
+        name = parallel._wisdom_block_name(executor._wisdom_prefix,
+                                           executor._wisdom_generation)
+        shared_memory.SharedMemory(name=name).close()
+        del executor
+        gc.collect()
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=name)
+
+    def test_wisdom_not_sent_with_jobs(self):
+        self.executor._pool.close()
+        self.executor._pool.join()
+        self.executor._pool = RecordingPool()
+        self.executor.submit('fftn', random_complex(8))
+        args = self.executor._pool.args
+        assert args[-1] == self.executor._wisdom_generation
+        assert not [arg for arg in args if isinstance(arg, bytes)]
+
+
+class RecordingPool(object):
+
+    def apply_async(self, function, args, callback, error_callback):
+        self.args = args
+
+    def close(self):
+        pass
+
+    def join(self):
+        pass
+
+
+def test_invalid_executor():
+    with pytest.raises(ValueError):
+        parallel.ProcessExecutor(processes=0)
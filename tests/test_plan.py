@@ -5,9 +5,17 @@
 # This file is distributed under the new BSD License, see the LICENSE file or 
 # checkout the license terms at http://opensource.org/licenses/BSD-3-Clause).
 
-from skfftw.fftw import Plan
-from skfftw.enums import Direction, Flag, Normalization
+from skfftw import empty_aligned, wisdom
+from skfftw.fftw import (InverseRealPlan, Plan, R2RPlan, RealPlan,
+                         empty_real_inplace, get_default_threads,
+                         set_default_threads)
+from skfftw.enums import Direction, Flag, Normalization, R2RKind
+from skfftw.wrappers import libfftw, planner_lock
+from numpy.lib.stride_tricks import as_strided
+import array
 import numpy
+import pickle
+import pytest
 
 
 class TestPlanCall():
@@ -56,4 +64,716 @@ class TestPlanCall():
     def test_with_sqrt_normalization(self):
         self.input_array.ravel()[:] = 1
         output_array = self.plan(normalization=Normalization.sqrt)
-        assert output_array.ravel()[0] == numpy.sqrt(self.plan.N)
\ No newline at end of file
+        assert output_array.ravel()[0] == numpy.sqrt(self.plan.N)
+
+    def test_transform(self):
+        input_array = numpy.ones([64, 64], dtype=numpy.complex128)
+        output_array = numpy.empty_like(input_array)
+        result = self.plan.transform(input_array, output_array,
+                                     Normalization.full)
+        assert result is output_array
+        assert output_array.ravel()[0] == 1
+        assert self.plan.input_array is self.input_array
+        assert self.plan.output_array is self.output_array
+        with pytest.raises(RuntimeError):
+            self.plan.transform(input_array[:32], output_array)
+
+class TestPlanThreads():
+
+    def setup_method(self, method):
+        self.input_array = (
+            numpy.random.randn(32, 64) + 1j * numpy.random.randn(32, 64))
+        self.output_array = numpy.empty([32, 64], dtype=numpy.complex128)
+
+    def test_default_threads(self):
+        plan = Plan(self.input_array, self.output_array)
+        assert plan.threads == get_default_threads()
+
+    def test_multithreaded(self):
+        plan = Plan(self.input_array, self.output_array, threads=4)
+        assert plan.threads == 4
+        output_array = plan()
+        assert numpy.allclose(output_array, numpy.fft.fft2(self.input_array))
+
+    def test_process_wide_default(self):
+        set_default_threads(2)
+        try:
+            plan = Plan(self.input_array, self.output_array)
+        finally:
+            set_default_threads(1)
+        assert plan.threads == 2
+
+    def test_invalid_threads(self):
+        with pytest.raises(ValueError):
+            Plan(self.input_array, self.output_array, threads=0)
+
+
+class TestPlanArrays():
+
+    def test_mismatched_shapes(self):
+        input_array = numpy.empty([64, 64], dtype=numpy.complex128)
+        output_array = numpy.empty([64, 32], dtype=numpy.complex128)
+        with pytest.raises(ValueError):
+            Plan(input_array, output_array)
+
+    def test_mismatched_types(self):
+        input_array = numpy.empty([64, 64], dtype=numpy.complex128)
+        output_array = numpy.empty([64, 64], dtype=numpy.complex64)
+        with pytest.raises(ValueError):
+            Plan(input_array, output_array)
+
+    def test_inplace(self):
+        array = numpy.random.randn(64) + 1j * numpy.random.randn(64)
+        expected = numpy.fft.fft(array)
+        plan = Plan(array, array)
+        assert numpy.allclose(plan(), expected)
+        with pytest.raises(RuntimeError):
+            plan(output_array=numpy.empty_like(array))
+
+
+class TestPlanAxes():
+
+    def setup_method(self, method):
+        self.input_array = (
+            numpy.random.randn(6, 10, 12) + 1j * numpy.random.randn(6, 10, 12))
+        self.output_array = numpy.empty_like(self.input_array)
+
+    @pytest.mark.parametrize('axes', [(-1,), (1, 2), (0,), (0, 2), (2, 0),
+                                      (2, 1, 0)])
+    def test_axes(self, axes):
+        plan = Plan(self.input_array, self.output_array, axes=axes)
+        assert plan.N == numpy.prod([self.input_array.shape[a] for a in axes])
+        output_array = plan()
+        assert numpy.allclose(output_array,
+                              numpy.fft.fftn(self.input_array, axes=axes))
+
+    def test_normalization(self):
+        self.input_array[:] = 1
+        plan = Plan(self.input_array, self.output_array, axes=(1,))
+        output_array = plan(normalization=Normalization.full)
+        assert numpy.allclose(output_array[:, 0, :], 1)
+
+    def test_batched_real(self):
+        input_array = numpy.random.randn(6, 10, 12)
+        output_array = numpy.empty([6, 6, 12], dtype=numpy.complex128)
+        plan = RealPlan(input_array, output_array, axes=(2, 1))
+        assert numpy.allclose(plan(),
+                              numpy.fft.rfftn(input_array, axes=(2, 1)))
+
+    def test_batched_inverse_real(self):
+        expected = numpy.random.randn(6, 10, 12)
+        input_array = numpy.fft.rfft(expected, axis=-1)
+        saved_input = input_array.copy()
+        output_array = numpy.empty_like(expected)
+        plan = InverseRealPlan(input_array, output_array, axes=-1,
+                               preserve_input=True)
+        assert Flag.preserve_input in plan.flags
+        output_array = plan(normalization=Normalization.full)
+        assert numpy.allclose(output_array, expected)
+        assert numpy.array_equal(input_array, saved_input)
+
+    @pytest.mark.parametrize('axes', [(3,), (-4,), (0, 0), ()])
+    def test_invalid_axes(self, axes):
+        with pytest.raises(ValueError):
+            Plan(self.input_array, self.output_array, axes=axes)
+
+
+class TestPlanStrided():
+
+    def setup_method(self, method):
+        self.data = (numpy.random.randn(12, 16) +
+                     1j * numpy.random.randn(12, 16))
+
+    @pytest.mark.parametrize('view', [
+        lambda a: numpy.asfortranarray(a), lambda a: a[:, 2:10],
+        lambda a: a[::2, ::3], lambda a: a.T])
+    @pytest.mark.parametrize('axes', [None, (0,), (1,)])
+    def test_views(self, view, axes):
+        input_array = view(self.data.copy())
+        output_array = view(numpy.zeros_like(self.data))
+        plan = Plan(input_array, output_array, axes=axes)
+        assert plan.input_array is input_array
+        assert numpy.allclose(plan(),
+                              numpy.fft.fftn(input_array, axes=axes))
+        assert numpy.allclose(plan(normalization=Normalization.full),
+                              numpy.fft.fftn(input_array, axes=axes) /
+                              plan.N)
+
+    def test_mixed_orders(self):
+        output_array = numpy.empty(self.data.shape, self.data.dtype,
+                                   order='F')
+        plan = Plan(self.data, output_array, flags=(Flag.measure,))
+        plan(self.data)
+        assert numpy.allclose(output_array, numpy.fft.fft2(self.data))
+
+    def test_inplace(self):
+        array = self.data.copy()
+        view = array[:, ::2]
+        expected = numpy.fft.fft2(view)
+        plan = Plan(view, view)
+        plan(normalization=Normalization.sqrt)
+        assert numpy.allclose(view, expected / numpy.sqrt(view.size))
+        # the elements between those of the view are left untouched
+        assert numpy.array_equal(array[:, 1::2], self.data[:, 1::2])
+
+    def test_stride_pattern(self):
+        plan = Plan(self.data[:, ::2], numpy.empty((12, 8), complex))
+        other = (numpy.random.randn(12, 16) +
+                 1j * numpy.random.randn(12, 16))
+        assert numpy.allclose(plan(other[:, ::2]),
+                              numpy.fft.fft2(other[:, ::2]))
+        with pytest.raises(RuntimeError):
+            plan(other[:, :8])
+        with pytest.raises(RuntimeError):
+            plan(numpy.asfortranarray(other[:, :8]))
+
+    def test_realign(self):
+        input_array = misaligned_empty((12, 16), numpy.complex128)[:, ::2]
+        input_array[:] = self.data[:, ::2]
+        aligned_array = empty_aligned((12, 16), numpy.complex128)[:, ::2]
+        aligned_array[:] = self.data[:, ::2]
+        plan = Plan(aligned_array, numpy.empty((12, 8), complex))
+        assert plan.aligned
+        assert numpy.allclose(plan(input_array),
+                              numpy.fft.fft2(self.data[:, ::2]))
+
+    def test_real_plans(self):
+        data = numpy.asfortranarray(numpy.random.randn(12, 16))
+        spectrum = numpy.empty((12, 9), complex, order='F')
+        plan = RealPlan(data, spectrum)
+        assert numpy.allclose(plan(), numpy.fft.rfft2(data))
+        output_array = numpy.empty((12, 32))[:, ::2]
+        plan = InverseRealPlan(spectrum.copy(), output_array,
+                               preserve_input=True)
+        assert numpy.allclose(plan(normalization=Normalization.full), data)
+
+    def test_invalid_strides(self):
+        with pytest.raises(ValueError):
+            Plan(self.data[::-1], numpy.empty_like(self.data))
+        broadcast = numpy.broadcast_to(self.data[0], self.data.shape)
+        with pytest.raises(ValueError):
+            Plan(self.data, broadcast)
+
+
+def unallocated(shape, dtype, strides=None):
+    # view of a single element, for plans created but never executed
+    dtype = numpy.dtype(dtype)
+    if strides is None:
+        strides = tuple(int(numpy.prod(shape[i + 1:])) * dtype.itemsize
+                        for i in range(len(shape)))
+    return as_strided(numpy.zeros(1, dtype), shape, strides)
+
+
+class TestPlanLarge():
+
+    def setup_method(self, method):
+        self.calls = []
+
+    def spy(self, monkeypatch, name):
+        planner = getattr(libfftw, name)
+
+        def spied_planner(*args):
+            self.calls.append(name)
+            return planner(*args)
+        monkeypatch.setattr(libfftw, name, spied_planner)
+
+    @pytest.mark.parametrize('shape,axes', [((2048, 2048, 1024), None),
+                                            ((1 << 28, 16), (1,))])
+    def test_complex(self, monkeypatch, shape, axes):
+        self.spy(monkeypatch, 'plan_guru64_dft')
+        plan = Plan(unallocated(shape, numpy.complex128),
+                    unallocated(shape, numpy.complex128), axes=axes)
+        assert self.calls == ['plan_guru64_dft']
+        assert plan.N == numpy.prod([shape[axis] for axis in
+                                     (axes or range(len(shape)))])
+        assert plan.describe()
+
+    def test_strides(self, monkeypatch):
+        self.spy(monkeypatch, 'plan_guru64_dft')
+        input_array = unallocated((16,), numpy.complex128, (1 << 36,))
+        Plan(input_array, numpy.empty(16, numpy.complex128))
+        assert self.calls == ['plan_guru64_dft']
+
+    def test_real_plans(self, monkeypatch):
+        self.spy(monkeypatch, 'plan_guru64_dft_r2c')
+        self.spy(monkeypatch, 'plan_guru64_dft_c2r')
+        self.spy(monkeypatch, 'plan_guru64_r2r')
+        real_array = unallocated((2048, 2048, 1024), numpy.float64)
+        complex_array = unallocated((2048, 2048, 513), numpy.complex128)
+        RealPlan(real_array, complex_array)
+        InverseRealPlan(complex_array, real_array)
+        R2RPlan(real_array, real_array, R2RKind.redft10, axes=(2,))
+        assert self.calls == ['plan_guru64_dft_r2c', 'plan_guru64_dft_c2r',
+                              'plan_guru64_r2r']
+
+    def test_small(self, monkeypatch):
+        self.spy(monkeypatch, 'plan_guru64_dft')
+        array = numpy.empty((64, 32), numpy.complex128)[:, ::2]
+        Plan(array, array)
+        assert self.calls == []
+
+
+class TestPlanDestroy():
+
+    def test_destroy_twice(self):
+        array = numpy.empty(16, dtype=numpy.complex128)
+        plan = Plan(array, numpy.empty_like(array))
+        plan.destroy()
+        plan.destroy()
+
+
+def random_complex(n):
+    return numpy.random.randn(n) + 1j * numpy.random.randn(n)
+
+
+def misaligned_empty(shape, dtype):
+    # offset an aligned buffer by half the SIMD alignment of FFTW
+    dtype = numpy.dtype(dtype)
+    size = int(numpy.prod(shape)) * dtype.itemsize
+    return empty_aligned(size + 8, numpy.uint8)[8:].view(dtype).reshape(shape)
+
+
+class TestPlanAlignment():
+
+    def test_aligned_plan(self):
+        input_array = empty_aligned(64, numpy.complex128)
+        output_array = empty_aligned(64, numpy.complex128)
+        plan = Plan(input_array, output_array)
+        assert plan.aligned
+        assert Flag.unaligned not in plan.flags
+
+    @pytest.mark.parametrize('inplace', [False, True])
+    def test_realign(self, inplace):
+        input_array = empty_aligned(64, numpy.complex128)
+        output_array = (input_array if inplace else
+                        empty_aligned(64, numpy.complex128))
+        plan = Plan(input_array, output_array)
+        new_input_array = misaligned_empty(64, numpy.complex128)
+        new_input_array[:] = random_complex(64)
+        expected = numpy.fft.fft(new_input_array)
+        new_output_array = (new_input_array if inplace else
+                            misaligned_empty(64, numpy.complex128))
+        assert plan(new_input_array, new_output_array) is new_output_array
+        assert numpy.allclose(new_output_array, expected)
+
+    def test_realign_inplace_real(self):
+        real_array, complex_array = empty_real_inplace([8, 30])
+        plan = RealPlan(real_array, complex_array)
+        buffer = misaligned_empty(complex_array.shape, complex_array.dtype)
+        new_real_array = buffer.view(numpy.float64)[:, :30]
+        new_real_array[:] = numpy.random.randn(8, 30)
+        expected = numpy.fft.rfft2(new_real_array)
+        plan(new_real_array, buffer)
+        assert numpy.allclose(buffer, expected)
+
+    def test_no_realign(self):
+        input_array = empty_aligned(64, numpy.complex128)
+        plan = Plan(input_array, empty_aligned(64, numpy.complex128),
+                    realign=False)
+        with pytest.raises(RuntimeError):
+            plan(misaligned_empty(64, numpy.complex128))
+
+    def test_unaligned_plan(self):
+        input_array = misaligned_empty(64, numpy.complex128)
+        input_array[:] = random_complex(64)
+        plan = Plan(input_array, empty_aligned(64, numpy.complex128),
+                    realign=False)
+        assert not plan.aligned
+        new_input_array = random_complex(64)
+        assert numpy.allclose(plan(new_input_array),
+                              numpy.fft.fft(new_input_array))
+
+
+class TestPlanFastPath():
+
+    def setup_method(self, method):
+        self.input_array = empty_aligned(64, numpy.complex128)
+        self.output_array = empty_aligned(64, numpy.complex128)
+        self.plan = Plan(self.input_array, self.output_array)
+
+    def test_repeated_call(self):
+        for _ in range(3):
+            self.input_array[:] = random_complex(64)
+            assert self.plan() is self.output_array
+            assert numpy.allclose(self.output_array,
+                                  numpy.fft.fft(self.input_array))
+
+    def test_rebind(self):
+        new_input_array = random_complex(64)
+        new_output_array = numpy.empty_like(new_input_array)
+        self.plan(new_input_array, new_output_array)
+        new_input_array[:] = random_complex(64)
+        self.plan.execute()
+        assert numpy.allclose(new_output_array,
+                              numpy.fft.fft(new_input_array))
+        assert self.plan() is new_output_array
+
+    def test_rebind_misaligned(self):
+        new_input_array = misaligned_empty(64, numpy.complex128)
+        for _ in range(2):
+            new_input_array[:] = random_complex(64)
+            output_array = self.plan(new_input_array)
+            assert numpy.allclose(output_array,
+                                  numpy.fft.fft(new_input_array))
+
+
+class TestPlanNormalization():
+
+    @pytest.mark.parametrize('dtype', [numpy.complex64, numpy.complex128,
+                                       numpy.clongdouble])
+    @pytest.mark.parametrize('normalization', [Normalization.sqrt,
+                                               Normalization.full])
+    def test_roundtrip(self, dtype, normalization):
+        expected = random_complex(48).astype(dtype)
+        input_array = expected.copy()
+        output_array = numpy.empty_like(input_array)
+        forward = Plan(input_array, output_array)
+        backward = Plan(output_array, input_array,
+                        direction=Direction.backward)
+        forward(normalization=Normalization.sqrt)
+        backward(normalization=normalization)
+        if normalization is Normalization.full:
+            input_array *= numpy.sqrt(expected.real.dtype.type(48))
+        tolerance = 100 * numpy.finfo(expected.real.dtype).eps
+        assert numpy.allclose(input_array, expected, rtol=tolerance,
+                              atol=tolerance)
+
+    def test_realigned(self):
+        input_array = empty_aligned(16, numpy.complex128)
+        input_array[:] = 1
+        output_array = empty_aligned(16, numpy.complex128)
+        plan = Plan(input_array, output_array)
+        misaligned_output = misaligned_empty(16, numpy.complex128)
+        result = plan(input_array, misaligned_output, Normalization.full)
+        assert result is misaligned_output
+        assert numpy.allclose(result[0], 1)
+
+    def test_invalid_normalization(self):
+        array = random_complex(16)
+        plan = Plan(array, numpy.empty_like(array))
+        with pytest.raises(ValueError):
+            plan(normalization='full')
+
+
+class TestPlanIntrospection():
+
+    def setup_method(self, method):
+        self.input_array = empty_aligned(64, numpy.complex128)
+        self.input_array[:] = random_complex(64)
+        self.output_array = empty_aligned(64, numpy.complex128)
+        self.plan = Plan(self.input_array, self.output_array)
+
+    def test_flops(self):
+        assert self.plan.flops > 0
+        assert self.plan.estimated_cost > 0
+        assert self.plan.cost == 0
+        # wisdom left by other tests may select other algorithms
+        wisdom.forget_wisdom()
+        plan = Plan(self.input_array, self.output_array)
+        real_plan = RealPlan(numpy.empty(64),
+                             numpy.empty(33, numpy.complex128))
+        assert 0 < real_plan.flops < plan.flops
+
+    def test_describe(self):
+        description = self.plan.describe()
+        assert description.startswith('(')
+        assert 'dft' in description
+
+    def test_statistics(self):
+        assert self.plan.planning_time >= 0
+        assert self.plan.executions == 0
+        assert self.plan.execution_time == 0
+        self.plan()
+        self.plan(normalization=Normalization.full)
+        self.plan.execute()
+        self.plan.execute_dft(random_complex(64))
+        assert self.plan.executions == 4
+        assert self.plan.execution_time > 0
+        self.plan.reset_statistics()
+        assert self.plan.executions == 0
+        assert self.plan.execution_time == 0
+
+    def test_destroyed(self):
+        self.plan.destroy()
+        with pytest.raises(RuntimeError):
+            self.plan.flops
+        with pytest.raises(RuntimeError):
+            self.plan.describe()
+
+
+class TestPlanBackground():
+
+    @pytest.mark.parametrize('inplace', [False, True])
+    def test_upgrade(self, inplace):
+        data = random_complex(256)
+        input_array = empty_aligned(256, numpy.complex128)
+        input_array[:] = data
+        output_array = (input_array if inplace else
+                        empty_aligned(256, numpy.complex128))
+        plan = Plan(input_array, output_array, flags=(Flag.measure,),
+                    planning='background')
+        assert plan.upgrade.result(timeout=60) is None
+        assert plan.cost > 0
+        assert numpy.array_equal(input_array, data)
+        assert numpy.allclose(plan(), numpy.fft.fft(data))
+
+    def test_execute_while_planning(self):
+        data = random_complex(4096)
+        input_array = data.copy()
+        output_array = numpy.empty_like(input_array)
+        plan = Plan(input_array, output_array, flags=(Flag.measure,),
+                    planning='background')
+        while not plan.upgrade.done():
+            assert numpy.allclose(plan(), numpy.fft.fft(data))
+        plan.upgrade.result()
+        assert numpy.allclose(plan(), numpy.fft.fft(data))
+
+    def test_real_plans(self):
+        data = numpy.random.randn(6, 10)
+        spectrum = numpy.fft.rfft2(data)
+        real_plan = RealPlan(data.copy(), numpy.empty_like(spectrum),
+                             flags=(Flag.measure,), planning='background')
+        inverse_plan = InverseRealPlan(spectrum.copy(), numpy.empty_like(data),
+                                       flags=(Flag.measure,),
+                                       preserve_input=True,
+                                       planning='background')
+        real_plan.upgrade.result(timeout=60)
+        inverse_plan.upgrade.result(timeout=60)
+        assert numpy.allclose(real_plan(), spectrum)
+        assert numpy.allclose(inverse_plan(normalization=Normalization.full),
+                              data)
+        assert numpy.array_equal(inverse_plan.input_array, spectrum)
+
+    def test_estimate(self):
+        array = random_complex(16)
+        plan = Plan(array, numpy.empty_like(array), planning='background')
+        assert plan.upgrade.done()
+        assert plan.upgrade.result() is None
+
+    def test_destroyed(self):
+        array = random_complex(16)
+        with planner_lock:
+            plan = Plan(array, numpy.empty_like(array),
+                        flags=(Flag.measure,), planning='background')
+            plan.destroy()
+        assert isinstance(plan.upgrade.exception(timeout=60), RuntimeError)
+
+    def test_invalid_planning(self):
+        array = random_complex(16)
+        with pytest.raises(ValueError):
+            Plan(array, numpy.empty_like(array), planning='lazy')
+
+
+class TestPlanPickle():
+
+    def test_patient(self):
+        data = random_complex(4096).reshape(64, 64)
+        plan = Plan(data.copy(), numpy.empty_like(data),
+                    direction=Direction.backward, flags=(Flag.patient,))
+        string = pickle.dumps(plan)
+        wisdom.forget_wisdom()
+        copy = pickle.loads(string)
+        assert copy.flags == plan.flags
+        assert copy.direction is Direction.backward
+        assert copy.describe() == plan.describe()
+        assert copy.input_array is not plan.input_array
+        copy.input_array[:] = data
+        plan.input_array[:] = data
+        assert numpy.array_equal(copy(), plan())
+
+    def test_estimate(self):
+        data = random_complex(48).reshape(8, 6)
+        plan = Plan(data, numpy.empty_like(data), axes=(1,), threads=2)
+        copy = pickle.loads(pickle.dumps(plan))
+        assert copy.axes == (1,)
+        assert copy.threads == 2
+        assert numpy.allclose(copy(data), plan())
+
+    def test_layout(self):
+        array = random_complex(256).reshape(16, 16)[:, ::2]
+        plan = Plan(numpy.empty((16, 16), complex)[:, ::2],
+                    numpy.empty((16, 8), complex, order='F'),
+                    flags=(Flag.measure,))
+        copy = pickle.loads(pickle.dumps(plan))
+        assert copy.input_array is not copy.output_array
+        assert copy.input_array.shape == array.shape
+        assert copy.input_array.strides == array.strides
+        assert copy.output_array.flags.f_contiguous
+        assert numpy.allclose(copy(array), numpy.fft.fft2(array))
+        plan = Plan(array, array)
+        copy = pickle.loads(pickle.dumps(plan))
+        assert numpy.shares_memory(copy.input_array, copy.output_array)
+
+    def test_real_plans(self):
+        data = numpy.random.randn(8, 10)
+        input_array, output_array = empty_real_inplace(data.shape)
+        plan = RealPlan(input_array, output_array, flags=(Flag.measure,))
+        copy = pickle.loads(pickle.dumps(plan))
+        assert numpy.shares_memory(copy.input_array, copy.output_array)
+        copy.input_array[:] = data
+        assert numpy.allclose(copy(), numpy.fft.rfft2(data))
+        spectrum = numpy.fft.rfft2(data)
+        plan = InverseRealPlan(spectrum.copy(), numpy.empty_like(data),
+                               flags=(Flag.measure,), preserve_input=True)
+        copy = pickle.loads(pickle.dumps(plan))
+        assert copy.flags == plan.flags
+        result = copy(spectrum, normalization=Normalization.full)
+        assert numpy.allclose(result, data)
+        assert numpy.array_equal(copy.input_array, spectrum)
+
+    def test_r2r_plan(self):
+        data = numpy.random.randn(12)
+        plan = R2RPlan(data, numpy.empty_like(data), kinds=(R2RKind.redft10,),
+                       orthogonalize=True, flags=(Flag.measure,))
+        copy = pickle.loads(pickle.dumps(plan))
+        assert copy.kinds == plan.kinds
+        assert numpy.allclose(copy(data), plan())
+
+    def test_missing_wisdom(self):
+        data = random_complex(48)
+        plan = Plan(data, numpy.empty_like(data), flags=(Flag.measure,))
+        reconstructor, args, state = plan.__reduce__()
+        wisdom.forget_wisdom()
+        state['wisdom'] = wisdom.export_wisdom_to_string(data.dtype)
+        copy = reconstructor(*args)
+        with pytest.warns(RuntimeWarning):
+            copy.__setstate__(state)
+        assert Flag.estimate in copy.flags
+        assert Flag.measure not in copy.flags
+        assert numpy.allclose(copy(data), numpy.fft.fft(data))
+
+    def test_background(self):
+        data = random_complex(256)
+        plan = Plan(data, numpy.empty_like(data), flags=(Flag.measure,),
+                    planning='background')
+        copy = pickle.loads(pickle.dumps(plan))
+        assert plan.upgrade.done()
+        assert numpy.allclose(copy(data), numpy.fft.fft(data))
+
+    def test_destroyed(self):
+        data = random_complex(16)
+        plan = Plan(data, numpy.empty_like(data))
+        plan.destroy()
+        with pytest.raises(RuntimeError):
+            pickle.dumps(plan)
+
+
+class ArrayInterface(object):
+
+    def __init__(self, array):
+        self.array = array
+        self.__array_interface__ = array.__array_interface__
+
+
+class DLPackTensor(object):
+
+    def __init__(self, array):
+        self.array = array
+
+    def __dlpack__(self, **kwargs):
+        return self.array.__dlpack__(**kwargs)
+
+    def __dlpack_device__(self):
+        return self.array.__dlpack_device__()
+
+
+class TestPlanForeignArrays():
+
+    @pytest.mark.parametrize('wrapper', [memoryview, ArrayInterface,
+                                         DLPackTensor])
+    def test_zero_copy(self, wrapper):
+        data = random_complex(64).reshape(8, 8)
+        input_array = data.copy()
+        output_array = numpy.empty_like(data)
+        plan = Plan(wrapper(input_array), wrapper(output_array))
+        assert numpy.shares_memory(plan.input_array, input_array)
+        assert numpy.shares_memory(plan.output_array, output_array)
+        plan()
+        assert numpy.allclose(output_array, numpy.fft.fft2(data))
+        other = numpy.empty_like(data)
+        plan(wrapper(data), wrapper(other))
+        assert numpy.allclose(other, numpy.fft.fft2(data))
+
+    def test_buffer_protocol(self):
+        data = numpy.random.randn(16)
+        input_array = array.array('d', data)
+        output_array = array.array('d', bytes(data.nbytes))
+        plan = RealPlan(input_array, numpy.empty(9, numpy.complex128))
+        assert numpy.allclose(plan(), numpy.fft.rfft(data))
+        plan = R2RPlan(input_array, output_array, kinds=R2RKind.redft10)
+        plan()
+        assert numpy.allclose(output_array, R2RPlan(
+            data, numpy.empty_like(data), kinds=R2RKind.redft10)())
+
+    def test_validation(self):
+        with pytest.raises(ValueError):
+            Plan(memoryview(bytearray(64)), numpy.empty(4, numpy.complex128))
+        with pytest.raises(TypeError):
+            Plan([1j, 2j], numpy.empty(2, numpy.complex128))
+        strided = memoryview(random_complex(16))[::-2]
+        with pytest.raises(ValueError):
+            Plan(strided, numpy.empty(8, numpy.complex128))
+
+    def test_read_only(self):
+        data = random_complex(16)
+        read_only = data.copy()
+        read_only.flags.writeable = False
+        output_array = numpy.empty_like(data)
+        plan = Plan(memoryview(read_only), output_array)
+        assert numpy.allclose(plan(), numpy.fft.fft(data))
+        with pytest.raises(ValueError):
+            Plan(data.copy(), memoryview(read_only))
+        with pytest.raises(ValueError):
+            Plan(memoryview(read_only), output_array, flags=(Flag.measure,))
+        with pytest.raises(RuntimeError):
+            plan(data, memoryview(read_only))
+        spectrum = numpy.fft.rfft(data.real)
+        spectrum.flags.writeable = False
+        with pytest.raises(ValueError):
+            InverseRealPlan(spectrum, numpy.empty(16))
+        plan = InverseRealPlan(spectrum, numpy.empty(16), preserve_input=True)
+        assert numpy.allclose(plan(normalization=Normalization.full),
+                              data.real)
+
+
+class TestPlanTimeLimit():
+
+    def setup_method(self, method):
+        wisdom.forget_wisdom()
+        self.input_array = random_complex(96)
+        self.output_array = numpy.empty_like(self.input_array)
+
+    def test_wisdom_only(self):
+        with pytest.raises(RuntimeError):
+            Plan(self.input_array, self.output_array,
+                 flags=(Flag.wisdom_only,))
+
+    def test_wisdom_policy(self):
+        plan = Plan(self.input_array, self.output_array,
+                    flags=(Flag.measure,), planning='wisdom')
+        assert plan.planning_path is Flag.measure
+        plan = Plan(self.input_array, self.output_array,
+                    flags=(Flag.measure,), planning='wisdom')
+        assert plan.planning_path is Flag.wisdom_only
+        assert numpy.allclose(plan(), numpy.fft.fft(self.input_array))
+
+    def test_timelimit(self):
+        input_array = empty_aligned(3 * 2 ** 14, numpy.complex128)
+        plan = Plan(input_array, empty_aligned(3 * 2 ** 14, numpy.complex128),
+                    flags=(Flag.exhaustive,), timelimit=0.05)
+        input_array[:] = 1
+        assert plan.timelimit == 0.05
+        assert plan.planning_path is Flag.exhaustive
+        assert plan.planning_time < 10
+        assert numpy.allclose(plan(normalization=Normalization.full)[0], 1)
+
+    def test_background_path(self):
+        plan = Plan(self.input_array, self.output_array,
+                    flags=(Flag.patient,), planning='background')
+        plan.upgrade.result(timeout=60)
+        assert plan.planning_path is Flag.patient
+
+    @pytest.mark.parametrize('timelimit', [0, -1, 'soon'])
+    def test_invalid_timelimit(self, timelimit):
+        with pytest.raises(ValueError):
+            Plan(self.input_array, self.output_array, timelimit=timelimit)
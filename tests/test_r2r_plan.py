@@ -0,0 +1,106 @@
+# coding: utf8
+
+# Copyright (c) 2014, 2015 Ghislain Antony Vaillant.
+#
+# This file is distributed under the new BSD License, see the LICENSE file or
+# checkout the license terms at http://opensource.org/licenses/BSD-3-Clause).
+
+from skfftw.fftw import R2RPlan
+from skfftw.enums import Normalization, R2RKind
+import numpy
+import pytest
+
+
+dtypes = [numpy.float32, numpy.float64, numpy.longdouble]
+# pairs of kinds undoing each other once normalized
+inverse_kinds = [(R2RKind.redft00, R2RKind.redft00),
+                 (R2RKind.redft10, R2RKind.redft01),
+                 (R2RKind.redft11, R2RKind.redft11),
+                 (R2RKind.rodft00, R2RKind.rodft00),
+                 (R2RKind.rodft10, R2RKind.rodft01),
+                 (R2RKind.rodft11, R2RKind.rodft11),
+                 (R2RKind.r2hc, R2RKind.hc2r),
+                 (R2RKind.dht, R2RKind.dht)]
+
+
+def dct2_matrix(n):
+    j, k = numpy.meshgrid(numpy.arange(n), numpy.arange(n))
+    return 2 * numpy.cos(numpy.pi * (j + 0.5) * k / n)
+
+
+def tolerance(dtype):
+    return 1e-4 if numpy.dtype(dtype).itemsize <= 4 else 1e-10
+
+
+class TestR2RPlan():
+
+    @pytest.mark.parametrize('dtype', dtypes)
+    def test_dct(self, dtype):
+        input_array = numpy.random.randn(4, 10).astype(dtype)
+        output_array = numpy.empty_like(input_array)
+        plan = R2RPlan(input_array, output_array, R2RKind.redft10, axes=1)
+        assert plan() is output_array
+        expected = input_array.astype(numpy.double).dot(dct2_matrix(10).T)
+        assert numpy.allclose(output_array, expected, rtol=tolerance(dtype),
+                              atol=tolerance(dtype))
+
+    @pytest.mark.parametrize('kinds', inverse_kinds)
+    def test_inverse(self, kinds):
+        data = numpy.random.randn(12)
+        input_array = data.copy()
+        output_array = numpy.empty_like(input_array)
+        forward = R2RPlan(input_array, output_array, kinds[0])
+        backward = R2RPlan(output_array, input_array, kinds[1])
+        forward()
+        backward(normalization=Normalization.full)
+        assert numpy.allclose(input_array, data)
+
+    @pytest.mark.parametrize('dtype', dtypes)
+    def test_orthonormal(self, dtype):
+        input_array = numpy.eye(6, dtype=dtype)
+        output_array = numpy.empty_like(input_array)
+        plan = R2RPlan(input_array, output_array, R2RKind.redft10, axes=0,
+                       orthogonalize=True)
+        matrix = plan(normalization=Normalization.sqrt)
+        assert numpy.allclose(matrix.T.dot(matrix), numpy.eye(6),
+                              rtol=tolerance(dtype), atol=tolerance(dtype))
+
+    def test_orthogonalize_input(self):
+        input_array = numpy.ones(8)
+        output_array = numpy.empty(8)
+        plan = R2RPlan(input_array, output_array, R2RKind.redft01,
+                       orthogonalize=True)
+        plan()
+        assert input_array[0] == numpy.sqrt(2)
+
+    def test_inplace(self):
+        data = numpy.random.randn(8, 6)
+        array = data.copy()
+        plan = R2RPlan(array, array, (R2RKind.redft10, R2RKind.rodft10))
+        assert plan() is array
+        assert not numpy.allclose(array, data)
+        inverse = R2RPlan(array, array, (R2RKind.redft01, R2RKind.rodft01))
+        assert numpy.allclose(inverse(normalization=Normalization.full), data)
+
+    def test_per_axis_kinds(self):
+        plan = R2RPlan(numpy.empty((4, 5, 6)), numpy.empty((4, 5, 6)),
+                       (R2RKind.redft00, R2RKind.rodft00), axes=(1, 2))
+        assert plan.kinds == (R2RKind.redft00, R2RKind.rodft00)
+        assert plan.N == 2 * 4 * 2 * 7
+        with pytest.raises(ValueError):
+            R2RPlan(numpy.empty((4, 5)), numpy.empty((4, 5)),
+                    (R2RKind.redft10,) * 3)
+
+    def test_strided(self):
+        data = numpy.random.randn(10, 12)
+        input_array = numpy.asfortranarray(data)
+        output_array = numpy.empty((20, 12))[::2]
+        plan = R2RPlan(input_array, output_array, R2RKind.redft10, axes=0)
+        assert numpy.allclose(plan(), dct2_matrix(10).dot(data))
+
+    def test_invalid_arrays(self):
+        with pytest.raises(ValueError):
+            R2RPlan(numpy.empty(8, numpy.complex128),
+                    numpy.empty(8, numpy.complex128), R2RKind.redft10)
+        with pytest.raises(ValueError):
+            R2RPlan(numpy.empty(1), numpy.empty(1), R2RKind.redft00)
@@ -0,0 +1,151 @@
+# coding: utf8
+
+# Copyright (c) 2014, 2015 Ghislain Antony Vaillant.
+#
+# This file is distributed under the new BSD License, see the LICENSE file or
+# checkout the license terms at http://opensource.org/licenses/BSD-3-Clause).
+
+from skfftw.fftw import InverseRealPlan, RealPlan, empty_real_inplace
+from skfftw.enums import Normalization
+from concurrent.futures import ThreadPoolExecutor
+import numpy
+import pytest
+
+
+shapes = [(64,), (63,), (16, 30), (8, 6, 5)]
+dtypes = [numpy.float32, numpy.float64, numpy.longdouble]
+
+
+def half_shape(shape):
+    return shape[:-1] + (shape[-1] // 2 + 1,)
+
+
+def complex_dtype(dtype):
+    return numpy.promote_types(dtype, numpy.complex64)
+
+
+class TestRealPlan():
+
+    @pytest.mark.parametrize('dtype', dtypes)
+    @pytest.mark.parametrize('shape', shapes)
+    def test_forward(self, shape, dtype):
+        input_array = numpy.random.randn(*shape).astype(dtype)
+        output_array = numpy.empty(half_shape(shape), complex_dtype(dtype))
+        plan = RealPlan(input_array, output_array)
+        assert plan() is output_array
+        assert numpy.allclose(output_array, numpy.fft.rfftn(input_array),
+                              rtol=1e-4, atol=1e-4)
+
+    def test_normalization(self):
+        input_array = numpy.ones([16, 30])
+        output_array = numpy.empty([16, 16], dtype=numpy.complex128)
+        plan = RealPlan(input_array, output_array)
+        assert plan.N == input_array.size
+        output_array = plan(normalization=Normalization.full)
+        assert output_array[0, 0] == 1
+
+    def test_inplace(self):
+        real_array, complex_array = empty_real_inplace([12, 30])
+        assert real_array.shape == (12, 30)
+        assert complex_array.shape == (12, 16)
+        input_array = numpy.random.randn(12, 30)
+        real_array[:] = input_array
+        plan = RealPlan(real_array, complex_array)
+        output_array = plan()
+        assert output_array is complex_array
+        assert numpy.allclose(output_array, numpy.fft.rfft2(input_array))
+
+    def test_invalid_half_spectrum(self):
+        input_array = numpy.empty([16, 30])
+        output_array = numpy.empty([16, 30], dtype=numpy.complex128)
+        with pytest.raises(ValueError):
+            RealPlan(input_array, output_array)
+
+    def test_invalid_precision(self):
+        input_array = numpy.empty([16, 30])
+        output_array = numpy.empty([16, 16], dtype=numpy.complex64)
+        with pytest.raises(ValueError):
+            RealPlan(input_array, output_array)
+
+    def test_strided_input(self):
+        data = numpy.random.randn(16, 32)
+        input_array = data[:, :30]
+        output_array = numpy.empty([16, 16], dtype=numpy.complex128)
+        plan = RealPlan(input_array, output_array)
+        assert numpy.allclose(plan(), numpy.fft.rfft2(data[:, :30]))
+
+    def test_invalid_padding(self):
+        output_array = numpy.empty([16, 16], dtype=numpy.complex128)
+        input_array = output_array.view(numpy.float64).reshape(-1)[:480]
+        with pytest.raises(ValueError):
+            RealPlan(input_array.reshape(16, 30), output_array)
+
+
+class TestInverseRealPlan():
+
+    @pytest.mark.parametrize('dtype', dtypes)
+    @pytest.mark.parametrize('shape', shapes)
+    def test_backward(self, shape, dtype):
+        expected = numpy.random.randn(*shape)
+        input_array = numpy.fft.rfftn(expected).astype(complex_dtype(dtype))
+        output_array = numpy.empty(shape, dtype=dtype)
+        plan = InverseRealPlan(input_array, output_array)
+        output_array = plan(normalization=Normalization.full)
+        assert numpy.allclose(output_array, expected, rtol=1e-4, atol=1e-4)
+
+    @pytest.mark.parametrize('shape', shapes)
+    def test_preserve_input(self, shape):
+        input_array = numpy.fft.rfftn(numpy.random.randn(*shape))
+        saved_input = input_array.copy()
+        output_array = numpy.empty(shape)
+        plan = InverseRealPlan(input_array, output_array, preserve_input=True)
+        assert plan.preserve_input
+        plan()
+        assert numpy.array_equal(input_array, saved_input)
+        assert numpy.allclose(output_array / plan.N,
+                              numpy.fft.irfftn(saved_input, shape))
+
+    def test_preserve_input_concurrent(self):
+        spectra = [numpy.fft.rfft2(numpy.random.randn(16, 30))
+                   for _ in range(8)]
+        plan = InverseRealPlan(spectra[0].copy(), numpy.empty([16, 30]),
+                               preserve_input=True)
+
+        def transform(spectrum):
+            output_array = numpy.empty([16, 30])
+            for _ in range(20):
+                plan(spectrum, output_array, normalization=Normalization.full)
+            return output_array
+
+        with ThreadPoolExecutor(4) as executor:
+            outputs = list(executor.map(transform, spectra))
+        for spectrum, output_array in zip(spectra, outputs):
+            assert numpy.allclose(output_array,
+                                  numpy.fft.irfft2(spectrum, (16, 30)))
+
+    def test_inplace(self):
+        real_array, complex_array = empty_real_inplace([12, 30])
+        expected = numpy.random.randn(12, 30)
+        complex_array[:] = numpy.fft.rfft2(expected)
+        plan = InverseRealPlan(complex_array, real_array)
+        output_array = plan(normalization=Normalization.full)
+        assert output_array is real_array
+        assert numpy.allclose(output_array, expected)
+
+    def test_inplace_preserve_input(self):
+        real_array, complex_array = empty_real_inplace([12, 30])
+        with pytest.raises(ValueError):
+            InverseRealPlan(complex_array, real_array, preserve_input=True)
+
+    def test_update_arrays(self):
+        input_array = numpy.empty([16, 16], dtype=numpy.complex128)
+        output_array = numpy.empty([16, 30])
+        plan = InverseRealPlan(input_array, output_array)
+        expected = numpy.random.randn(16, 30)
+        new_output_array = numpy.empty([16, 30])
+        plan(numpy.fft.rfft2(expected), new_output_array,
+             normalization=Normalization.full)
+        assert plan.output_array is new_output_array
+        assert numpy.allclose(new_output_array, expected)
+        with pytest.raises(RuntimeError):
+            plan(output_array=numpy.empty([16, 31]))
@@ -0,0 +1,126 @@
+# coding: utf8
+
+# Copyright (c) 2014, 2015 Ghislain Antony Vaillant.
+#
+# This file is distributed under the new BSD License, see the LICENSE file or
+# checkout the license terms at http://opensource.org/licenses/BSD-3-Clause).
+
+import pytest
+
+scipy_fft = pytest.importorskip('scipy.fft')
+signal = pytest.importorskip('scipy.signal')
+
+from skfftw import cache
+from skfftw.interfaces import scipy_fft as backend
+import numpy
+
+
+names = ['fft', 'ifft', 'fftn', 'ifftn', 'fft2', 'ifft2', 'rfft', 'irfft',
+         'rfftn', 'irfftn', 'rfft2', 'irfft2', 'hfft', 'ihfft', 'hfftn',
+         'ihfftn', 'hfft2', 'ihfft2']
+real_input = ['rfft', 'rfftn', 'rfft2', 'ihfft', 'ihfftn', 'ihfft2']
+r2r_names = ['dct', 'idct', 'dst', 'idst', 'dctn', 'idctn', 'dstn', 'idstn']
+
+
+def random_array(shape, dtype, real=False):
+    array = numpy.random.randn(*shape)
+    if not real:
+        array = array + 1j * numpy.random.randn(*shape)
+    return array.astype(dtype)
+
+
+def assert_matches(actual, expected):
+    assert actual.shape == expected.shape
+    assert actual.dtype == expected.dtype
+    tolerance = 1e-4 if expected.dtype.itemsize <= 8 else 1e-10
+    assert numpy.allclose(actual, expected, rtol=tolerance,
+                          atol=tolerance * numpy.abs(expected).max())
+
+
+class TestBackend():
+
+    @pytest.mark.parametrize('name', names)
+    @pytest.mark.parametrize('precision', ['single', 'double'])
+    @pytest.mark.parametrize('norm', [None, 'ortho', 'forward'])
+    def test_dispatch(self, name, precision, norm):
+        real = name in real_input
+        dtype = {(True, 'single'): numpy.float32,
+                 (True, 'double'): numpy.float64,
+                 (False, 'single'): numpy.complex64,
+                 (False, 'double'): numpy.complex128}[real, precision]
+        x = random_array((6, 10), dtype, real)
+        expected = getattr(scipy_fft, name)(x, norm=norm)
+        calls = sum(cache.cache_info()[:2])
+        with scipy_fft.set_backend(backend, only=True):
+            actual = getattr(scipy_fft, name)(x, norm=norm)
+        assert sum(cache.cache_info()[:2]) == calls + 1
+        assert_matches(actual, expected)
+
+    @pytest.mark.parametrize('name', r2r_names)
+    @pytest.mark.parametrize('type', [1, 2, 3, 4])
+    @pytest.mark.parametrize('precision', [numpy.float32, numpy.float64])
+    @pytest.mark.parametrize('norm', [None, 'ortho', 'forward'])
+    def test_dispatch_r2r(self, name, type, precision, norm):
+        x = random_array((6, 10), precision, real=True)
+        expected = getattr(scipy_fft, name)(x, type, norm=norm)
+        with scipy_fft.set_backend(backend, only=True):
+            actual = getattr(scipy_fft, name)(x, type, norm=norm)
+        assert_matches(actual, expected)
+
+    @pytest.mark.parametrize('name', ['dct', 'idst'])
+    def test_r2r_options(self, name):
+        x = random_array((16, 12), numpy.float64, real=True)
+        expected = getattr(scipy_fft, name)(x, 3, 20, axis=0, norm='ortho',
+                                            orthogonalize=False)
+        with scipy_fft.set_backend(backend, only=True):
+            actual = getattr(scipy_fft, name)(x, 3, 20, axis=0, norm='ortho',
+                                              orthogonalize=False)
+        assert_matches(actual, expected)
+        x = random_array((16, 12), numpy.complex128)
+        expected = getattr(scipy_fft, name)(x, 3, 20, axis=0, norm='ortho')
+        with scipy_fft.set_backend(backend, only=True):
+            actual = getattr(scipy_fft, name)(x, 3, 20, axis=0, norm='ortho',
+                                              workers=2)
+        assert_matches(actual, expected)
+        with pytest.raises(ValueError):
+            getattr(backend, name)(x, 5)
+
+    @pytest.mark.parametrize('name', ['fft', 'rfft', 'irfft'])
+    def test_size_and_workers(self, name):
+        x = random_array((16, 12), numpy.float64)
+        expected = getattr(scipy_fft, name)(x, 20, axis=0)
+        with scipy_fft.set_backend(backend, only=True):
+            actual = getattr(scipy_fft, name)(x, 20, axis=0, workers=2)
+        assert_matches(actual, expected)
+
+    @pytest.mark.parametrize('name', ['rfft', 'dct', 'dst'])
+    def test_half_precision(self, name):
+        x = random_array((16,), numpy.float16, real=True)
+        expected = getattr(scipy_fft, name)(x)
+        with scipy_fft.set_backend(backend, only=True):
+            assert_matches(getattr(scipy_fft, name)(x), expected)
+
+    def test_negative_workers(self):
+        assert backend._threads(-1) >= 1
+        with pytest.raises(ValueError):
+            backend._threads(0)
+
+    def test_fallback(self):
+        x = random_array((16,), numpy.float64, real=True)
+        expected = scipy_fft.fht(x, 0.1, 0.0)
+        with scipy_fft.set_backend(backend):
+            assert numpy.allclose(scipy_fft.fht(x, 0.1, 0.0), expected)
+        assert backend.__ua_function__(scipy_fft.fht, (x, 0.1, 0.0),
+                                       {}) is NotImplemented
+        assert backend.__ua_function__(scipy_fft.fft, (x,),
+                                       {'plan': object()}) is NotImplemented
+
+    def test_fftconvolve(self):
+        a = numpy.random.randn(200, 30)
+        b = numpy.random.randn(15, 7)
+        expected = signal.fftconvolve(a, b, mode='same')
+        calls = sum(cache.cache_info()[:2])
+        with scipy_fft.set_backend(backend, only=True):
+            actual = signal.fftconvolve(a, b, mode='same')
+        assert sum(cache.cache_info()[:2]) > calls
+        assert numpy.allclose(actual, expected)
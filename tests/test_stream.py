@@ -0,0 +1,82 @@
+# coding: utf8
+
+# Copyright (c) 2014, 2015 Ghislain Antony Vaillant.
+#
+# This file is distributed under the new BSD License, see the LICENSE file or
+# checkout the license terms at http://opensource.org/licenses/BSD-3-Clause).
+
+from skfftw.stream import ISTFT, STFT, hann
+import numpy
+import pytest
+
+
+def chunked(signal, size):
+    return (signal[i:i + size] for i in range(0, len(signal), size))
+
+
+def reference_stft(signal, frame_size, hop_size):
+    frames = -(-len(signal) // hop_size)
+    padded = numpy.zeros(frames * hop_size + frame_size)
+    padded[:len(signal)] = signal
+    window = hann(frame_size)
+    return numpy.array([
+        numpy.fft.rfft(padded[m * hop_size:m * hop_size + frame_size] *
+                       window) for m in range(frames)])
+
+
+class TestSTFT():
+
+    @pytest.mark.parametrize('chunk_size', [1, 37, 64, 1000])
+    @pytest.mark.parametrize('hop_size', [16, 24, 64])
+    def test_spectra(self, chunk_size, hop_size):
+        signal = numpy.random.randn(500)
+        stft = STFT(64, hop_size, max_frames=4)
+        spectra = numpy.concatenate([s.copy() for s in
+                                     stft(chunked(signal, chunk_size))])
+        assert numpy.allclose(spectra, reference_stft(signal, 64, hop_size))
+
+    def test_batches(self):
+        stft = STFT(32, 8, max_frames=16)
+        batches = list(stft.feed(numpy.zeros(32 + 8 * 9)))
+        assert [len(batch) for batch in batches] == [10]
+        assert len(list(stft.feed(numpy.zeros(7)))) == 0
+        assert [len(batch) for batch in stft.feed(numpy.zeros(1))] == [1]
+
+    def test_buffers_reused(self):
+        stft = STFT(32, 8, max_frames=4)
+        batches = stft.feed(numpy.random.randn(1000))
+        first = next(batches)
+        assert all(numpy.shares_memory(first, batch) for batch in batches)
+
+    def test_single_precision(self):
+        stft = STFT(16, dtype=numpy.float32)
+        batch = next(stft.feed(numpy.ones(16)))
+        assert batch.dtype == numpy.complex64
+
+    def test_invalid_parameters(self):
+        with pytest.raises(ValueError):
+            STFT(16, 17)
+        with pytest.raises(ValueError):
+            STFT(16, window=numpy.ones(8))
+        with pytest.raises(ValueError):
+            STFT(16, dtype=numpy.complex128)
+
+
+class TestISTFT():
+
+    @pytest.mark.parametrize('hop_size', [8, 16, 24])
+    @pytest.mark.parametrize('max_frames', [1, 5])
+    def test_roundtrip(self, hop_size, max_frames):
+        signal = numpy.random.randn(700)
+        stft = STFT(64, hop_size, max_frames=max_frames)
+        istft = ISTFT(64, hop_size, max_frames=max_frames)
+        output = numpy.concatenate([s.copy() for s in
+                                    istft(stft(chunked(signal, 50)))])
+        assert len(output) >= len(signal)
+        # the Hann window vanishes on the first sample only
+        assert numpy.allclose(output[1:len(signal)], signal[1:])
+
+    def test_invalid_spectra(self):
+        istft = ISTFT(64)
+        with pytest.raises(ValueError):
+            list(istft.feed(numpy.zeros((2, 32), numpy.complex128)))
@@ -0,0 +1,103 @@
+# coding: utf8
+
+# Copyright (c) 2014, 2015 Ghislain Antony Vaillant.
+#
+# This file is distributed under the new BSD License, see the LICENSE file or
+# checkout the license terms at http://opensource.org/licenses/BSD-3-Clause).
+
+from skfftw import wisdom
+from skfftw.fftw import Plan
+from skfftw.enums import Flag
+import numpy
+import os
+import pytest
+
+
+def make_plan(dtype=numpy.complex128):
+    input_array = numpy.empty(48, dtype=dtype)
+    output_array = numpy.empty(48, dtype=dtype)
+    return Plan(input_array, output_array, flags=(Flag.measure,))
+
+
+class TestWisdomString():
+
+    def setup_method(self, method):
+        wisdom.forget_wisdom()
+        make_plan()
+
+    def test_export(self):
+        exported = wisdom.export_wisdom_to_string()
+        assert isinstance(exported, bytes)
+        assert exported.startswith(b'(fftw-3')
+
+    def test_roundtrip(self):
+        exported = wisdom.export_wisdom_to_string()
+        wisdom.forget_wisdom()
+        assert wisdom.export_wisdom_to_string() != exported
+        assert wisdom.import_wisdom_from_string(exported)
+        assert wisdom.export_wisdom_to_string() == exported
+
+    def test_import_invalid(self):
+        assert not wisdom.import_wisdom_from_string(b'not wisdom')
+
+    def test_precisions_are_separate(self):
+        wisdom.forget_wisdom(numpy.float32)
+        assert (wisdom.export_wisdom_to_string(numpy.complex64) !=
+                wisdom.export_wisdom_to_string(numpy.complex128))
+
+    def test_unsupported_dtype(self):
+        with pytest.raises(ValueError):
+            wisdom.export_wisdom_to_string(numpy.int8)
+
+
+class TestWisdomFile():
+
+    def test_roundtrip(self, tmp_path):
+        wisdom.forget_wisdom()
+        make_plan()
+        exported = wisdom.export_wisdom_to_string()
+        filename = str(tmp_path / 'fftw.wisdom')
+        assert wisdom.export_wisdom_to_filename(filename)
+        wisdom.forget_wisdom()
+        assert wisdom.import_wisdom_from_filename(filename)
+        assert wisdom.export_wisdom_to_string() == exported
+
+    def test_import_missing(self, tmp_path):
+        assert not wisdom.import_wisdom_from_filename(
+            str(tmp_path / 'missing.wisdom'))
+
+
+class TestWisdomCache():
+
+    def setup_method(self, method):
+        self.saved_state = dict(wisdom._cache_state)
+        wisdom._cache_state.clear()
+        wisdom.forget_wisdom(numpy.complex64)
+
+    def teardown_method(self, method):
+        wisdom._cache_state.clear()
+        wisdom._cache_state.update(self.saved_state)
+
+    def test_save_and_load(self, tmp_path, monkeypatch):
+        monkeypatch.setenv('SKFFTW_WISDOM_DIR', str(tmp_path))
+        assert not wisdom.load_cache(numpy.complex64)
+        make_plan(numpy.complex64)
+        wisdom.save_cache()
+        filename = os.path.join(wisdom.cache_directory(), 'fftwf.wisdom')
+        assert os.path.exists(filename)
+        exported = wisdom.export_wisdom_to_string(numpy.complex64)
+        wisdom.forget_wisdom(numpy.complex64)
+        wisdom._cache_state.clear()
+        assert wisdom.load_cache(numpy.complex64)
+        assert wisdom.export_wisdom_to_string(numpy.complex64) == exported
+
+    def test_no_save_without_new_wisdom(self, tmp_path, monkeypatch):
+        monkeypatch.setenv('SKFFTW_WISDOM_DIR', str(tmp_path))
+        wisdom.load_cache(numpy.complex64)
+        wisdom.save_cache()
+        assert not os.path.exists(wisdom.cache_directory())
+
+    def test_autoload_on_first_plan(self, tmp_path, monkeypatch):
+        monkeypatch.setenv('SKFFTW_WISDOM_DIR', str(tmp_path))
+        make_plan(numpy.complex64)
+        assert numpy.dtype(numpy.complex64) in wisdom._cache_state